@@ -1,16 +1,39 @@
 """
 Application Use Cases
 """
-from .upload_document import UploadDocumentUseCase
+from .upload_document import UploadDocumentUseCase, FileTooLargeError
+from .bulk_upload_documents import BulkUploadDocumentsUseCase, BulkUploadItem, BulkUploadResult
 from .get_document_url import GetDocumentUrlUseCase
+from .get_document_urls import GetDocumentUrlsUseCase
+from .get_document_content import GetDocumentContentUseCase, DocumentContent
+from .get_document_thumbnail import GetDocumentThumbnailUseCase, DocumentThumbnail, PreviewNotAvailableError
 from .get_documents_by_application import GetDocumentsByApplicationUseCase
 from .get_documents_by_user import GetDocumentsByUserUseCase
+from .resumable_upload import ResumableUploadUseCase, UploadConflictError
+from .direct_upload import DirectUploadUseCase, DirectUploadIntent
 from .delete_document import DeleteDocumentUseCase
+from .delete_application_documents import DeleteApplicationDocumentsUseCase, DeleteApplicationDocumentsResult
 
 __all__ = [
     'UploadDocumentUseCase',
+    'BulkUploadDocumentsUseCase',
+    'BulkUploadItem',
+    'BulkUploadResult',
     'GetDocumentUrlUseCase',
+    'GetDocumentUrlsUseCase',
+    'GetDocumentContentUseCase',
+    'DocumentContent',
+    'GetDocumentThumbnailUseCase',
+    'DocumentThumbnail',
+    'PreviewNotAvailableError',
     'GetDocumentsByApplicationUseCase',
     'GetDocumentsByUserUseCase',
-    'DeleteDocumentUseCase'
+    'ResumableUploadUseCase',
+    'UploadConflictError',
+    'DirectUploadUseCase',
+    'DirectUploadIntent',
+    'DeleteDocumentUseCase',
+    'DeleteApplicationDocumentsUseCase',
+    'DeleteApplicationDocumentsResult',
+    'FileTooLargeError'
 ]
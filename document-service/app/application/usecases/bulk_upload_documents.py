@@ -0,0 +1,152 @@
+"""
+Caso de uso: Subir varios documentos de una postulación
+"""
+import asyncio
+import uuid
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+from ...domain.entities.document import Document
+from ...domain.repositories.document_repository import IDocumentRepository
+from .upload_document import DOCUMENT_TYPES, UploadDocumentUseCase
+
+
+MAX_BULK_FILES = 20
+BULK_UPLOAD_CONCURRENCY = 4
+
+
+@dataclass
+class BulkUploadItem:
+    """Archivo a subir dentro de una carga masiva"""
+    chunks: AsyncIterator[bytes]
+    filename: str
+    mime_type: str
+    document_type: str
+    file_size: Optional[int] = None
+
+
+@dataclass
+class BulkUploadResult:
+    """Resultado de un archivo: el documento creado o el error que lo impidió"""
+    index: int
+    filename: str
+    document: Optional[Document] = None
+    error: Optional[Exception] = None
+
+
+def validate_bulk_item(item: BulkUploadItem) -> None:
+    """
+    Validar un archivo antes de subirlo: un valor que rechace la base de
+    datos haría fallar la transacción de todo el lote
+
+    Raises:
+        ValueError: Si los datos del archivo son inválidos
+    """
+    if not item.filename:
+        raise ValueError("El archivo no tiene nombre")
+
+    if len(item.filename) > 255:
+        raise ValueError("El nombre del archivo no puede superar los 255 caracteres")
+
+    if item.document_type not in DOCUMENT_TYPES:
+        raise ValueError(f"Tipo de documento no válido: {item.document_type}")
+
+
+class BulkUploadDocumentsUseCase:
+    """Caso de uso para subir varios documentos de una misma postulación"""
+
+    def __init__(
+        self,
+        upload_document_usecase: UploadDocumentUseCase,
+        document_repository: IDocumentRepository,
+        max_concurrency: int = BULK_UPLOAD_CONCURRENCY
+    ):
+        self.upload_document_usecase = upload_document_usecase
+        self.document_repository = document_repository
+        self.max_concurrency = max_concurrency
+
+    async def execute(
+        self,
+        items: list[BulkUploadItem],
+        user_document: str,
+        application_id: str,
+        uploaded_by: Optional[str]
+    ) -> list[BulkUploadResult]:
+        """
+        Subir los archivos al storage con concurrencia acotada y guardar
+        la metadata de todos los que se subieron en una sola transacción
+
+        Args:
+            items: Archivos a subir
+            user_document: Número de documento del usuario
+            application_id: ID de la postulación
+            uploaded_by: ID del usuario que sube los archivos
+
+        Returns:
+            list[BulkUploadResult]: Un resultado por archivo, en el orden recibido
+
+        Raises:
+            ValueError: Si no hay archivos, se supera el máximo permitido o
+                los datos comunes del lote son inválidos
+        """
+        if not items:
+            raise ValueError("No se recibieron archivos")
+
+        if len(items) > MAX_BULK_FILES:
+            raise ValueError(f"No se pueden subir más de {MAX_BULK_FILES} archivos a la vez")
+
+        # Datos comunes a todo el lote: si no son válidos fallarían todos
+        if not user_document or len(user_document) > 50:
+            raise ValueError("Número de documento del usuario inválido")
+
+        try:
+            uuid.UUID(application_id)
+        except ValueError:
+            raise ValueError("ID de postulación inválido")
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def store(index: int, item: BulkUploadItem) -> BulkUploadResult:
+            result = BulkUploadResult(index=index, filename=item.filename)
+
+            async with semaphore:
+                try:
+                    validate_bulk_item(item)
+                    result.document = await self.upload_document_usecase.store(
+                        chunks=item.chunks,
+                        filename=item.filename,
+                        mime_type=item.mime_type,
+                        user_document=user_document,
+                        application_id=application_id,
+                        document_type=item.document_type,
+                        uploaded_by=uploaded_by,
+                        file_size=item.file_size
+                    )
+                except Exception as e:
+                    result.error = e
+
+            return result
+
+        results = await asyncio.gather(
+            *(store(index, item) for index, item in enumerate(items))
+        )
+        stored = [result for result in results if result.document is not None]
+
+        if not stored:
+            return results
+
+        # Una sola transacción para todas las filas
+        try:
+            saved = await self.document_repository.save_many([result.document for result in stored])
+        except Exception as e:
+            for result in stored:
+                await self.upload_document_usecase.discard(result.document)
+                result.document = None
+                result.error = Exception(f"Error al guardar documento: {str(e)}")
+
+            return results
+
+        # Los valores guardados (ruta del blob, fechas) vienen del RETURNING
+        for result, document in zip(stored, saved):
+            result.document = document
+
+        return results
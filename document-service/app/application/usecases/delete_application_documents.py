@@ -0,0 +1,45 @@
+"""
+Caso de uso: Eliminar todos los documentos de una postulación
+"""
+import uuid
+from dataclasses import dataclass, field
+from ...domain.repositories.document_repository import IDocumentRepository
+
+
+@dataclass
+class DeleteApplicationDocumentsResult:
+    """Resultado del borrado de una postulación"""
+    deleted_ids: list[str] = field(default_factory=list)
+    queued_paths: list[str] = field(default_factory=list)
+
+
+class DeleteApplicationDocumentsUseCase:
+    """Caso de uso para eliminar todos los documentos de una postulación"""
+
+    def __init__(self, document_repository: IDocumentRepository):
+        self.document_repository = document_repository
+
+    async def execute(self, application_id: str) -> DeleteApplicationDocumentsResult:
+        """
+        Eliminar las filas de la postulación en una sola sentencia; los
+        archivos sin referencias quedan encolados para el worker de limpieza
+
+        Args:
+            application_id: ID de la postulación
+
+        Returns:
+            DeleteApplicationDocumentsResult: IDs eliminados y archivos encolados
+
+        Raises:
+            ValueError: Si el ID de la postulación no es un UUID
+        """
+        try:
+            uuid.UUID(application_id)
+        except ValueError:
+            raise ValueError("ID de postulación inválido")
+
+        deleted_ids, queued_paths = await self.document_repository.delete_by_application_id(
+            application_id
+        )
+
+        return DeleteApplicationDocumentsResult(deleted_ids=deleted_ids, queued_paths=queued_paths)
@@ -0,0 +1,200 @@
+"""
+Caso de uso: Subida directa al storage con URL firmada
+"""
+import hashlib
+import re
+import uuid
+from typing import NamedTuple, Optional
+from ...domain.entities.document import Document
+from ...domain.entities.upload_session import UploadSession
+from ...domain.repositories.storage_repository import IStorageRepository, PresignedUpload
+from ...domain.repositories.upload_session_repository import IUploadSessionRepository
+from ...domain.services.storage_layout import StorageLayout
+from .resumable_upload import UPLOAD_SESSION_TTL, UploadConflictError, validate_upload_session
+from .upload_document import UploadDocumentUseCase
+
+
+UPLOAD_URL_EXPIRATION = 15 * 60  # 15 minutos
+
+SHA256_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+
+class DirectUploadIntent(NamedTuple):
+    """Sesión creada y petición firmada que el cliente debe ejecutar"""
+    session: UploadSession
+    upload: PresignedUpload
+
+
+class DirectUploadUseCase:
+    """
+    Caso de uso para que el cliente suba el archivo directo al storage
+
+    El servicio solo firma la subida y, al finalizar, verifica el objeto
+    con un HEAD (tamaño, tipo y checksum SHA-256) antes de registrar el
+    documento: los bytes nunca pasan por este proceso. La firma exige el
+    tamaño, el tipo y el checksum declarados, así que el storage rechaza
+    cualquier otro contenido.
+
+    La sesión se guarda en `upload_sessions` con el archivo subido como
+    único chunk: si nunca se finaliza, vence y el worker de limpieza borra
+    el objeto como cualquier otro chunk.
+    """
+
+    def __init__(
+        self,
+        upload_session_repository: IUploadSessionRepository,
+        storage_repository: IStorageRepository,
+        upload_document_usecase: UploadDocumentUseCase,
+        storage_layout: Optional[StorageLayout] = None,
+        session_ttl: int = UPLOAD_SESSION_TTL,
+        url_expiration: int = UPLOAD_URL_EXPIRATION
+    ):
+        self.upload_session_repository = upload_session_repository
+        self.storage_repository = storage_repository
+        self.upload_document_usecase = upload_document_usecase
+        self.storage_layout = storage_layout or StorageLayout()
+        self.session_ttl = session_ttl
+        self.url_expiration = url_expiration
+
+    async def create(
+        self,
+        filename: str,
+        mime_type: str,
+        file_size: int,
+        sha256: str,
+        user_document: str,
+        application_id: str,
+        document_type: str,
+        uploaded_by: Optional[str]
+    ) -> DirectUploadIntent:
+        """
+        Crear una sesión de subida directa y firmar el PUT al storage
+
+        Args:
+            filename: Nombre original del archivo
+            mime_type: Tipo MIME del archivo
+            file_size: Tamaño exacto en bytes
+            sha256: SHA-256 del contenido (hex)
+            user_document: Número de documento del usuario
+            application_id: ID de la postulación
+            document_type: Tipo de documento
+            uploaded_by: ID del usuario que sube el archivo
+
+        Returns:
+            DirectUploadIntent: Sesión y petición firmada
+
+        Raises:
+            NotImplementedError: Si el storage no admite subidas directas
+            FileTooLargeError: Si el tamaño declarado supera el máximo
+            ValueError: Si los datos son inválidos
+        """
+        validate_upload_session(mime_type, file_size, application_id, document_type)
+        sha256 = sha256.lower()
+
+        if not SHA256_PATTERN.match(sha256):
+            raise ValueError("Checksum SHA-256 inválido")
+
+        session = UploadSession(
+            id=str(uuid.uuid4()),
+            user_document=user_document,
+            application_id=application_id,
+            document_type=document_type,
+            filename=filename,
+            mime_type=mime_type,
+            file_size=file_size,
+            uploaded_by=uploaded_by,
+            content_hash=sha256
+        )
+        staged_path = self.storage_layout.incoming_path(
+            session.id, self.storage_layout.extension(filename)
+        )
+
+        # Firmar antes de guardar: con un storage sin subidas directas no queda sesión
+        upload = await self.storage_repository.generate_upload_url(
+            staged_path, mime_type, file_size, sha256, self.url_expiration
+        )
+        session = await self.upload_session_repository.create(session, self.session_ttl, staged_path)
+
+        return DirectUploadIntent(session, upload)
+
+    async def complete(self, session_id: str) -> Optional[Document]:
+        """
+        Verificar el objeto subido y crear el documento
+
+        Args:
+            session_id: ID de la sesión
+
+        Returns:
+            Document creado o None si la sesión no existe
+
+        Raises:
+            UploadConflictError: Si el archivo todavía no se subió o la sesión ya se está finalizando
+            ValueError: Si el objeto no coincide con lo declarado
+        """
+        try:
+            uuid.UUID(session_id)
+        except ValueError:
+            return None
+
+        session = await self.upload_session_repository.find_by_id(session_id)
+
+        if session is None:
+            return None
+
+        if not session.is_direct:
+            raise UploadConflictError("La subida no es directa al storage", session.received_size)
+
+        # Solo una petición puede finalizar la sesión
+        if await self.upload_session_repository.begin_completion(session_id) is None:
+            raise UploadConflictError("La subida ya se está finalizando", session.received_size)
+
+        try:
+            parts = await self.upload_session_repository.list_parts(session_id)
+            staged_path = parts[0].file_path
+            await self._verify(session, staged_path)
+
+            document = await self.upload_document_usecase.adopt(
+                staged_path=staged_path,
+                content_hash=session.content_hash,
+                file_size=session.file_size,
+                filename=session.filename,
+                mime_type=session.mime_type,
+                user_document=session.user_document,
+                application_id=session.application_id,
+                document_type=session.document_type,
+                uploaded_by=session.uploaded_by,
+                keep_staged=True
+            )
+            document = await self.upload_document_usecase.save(document)
+        except BaseException:
+            await self.upload_session_repository.cancel_completion(session_id)
+            raise
+
+        # El objeto en incoming/ se borra con la sesión, a través de la outbox
+        await self.upload_session_repository.delete(session_id)
+        return document
+
+    async def _verify(self, session: UploadSession, staged_path: str) -> None:
+        """Comprobar con un HEAD que el objeto es el declarado en la sesión"""
+        metadata = await self.storage_repository.stat_file(staged_path)
+
+        if metadata is None:
+            raise UploadConflictError("El archivo todavía no se subió", 0)
+
+        if metadata.size != session.file_size:
+            raise ValueError("El tamaño del archivo subido no coincide con el declarado")
+
+        if metadata.content_type and metadata.content_type != session.mime_type:
+            raise ValueError("El tipo del archivo subido no coincide con el declarado")
+
+        sha256 = metadata.sha256
+
+        if sha256 is None:
+            # El storage no devolvió el checksum: se calcula leyendo el objeto
+            digest = hashlib.sha256()
+            async for chunk in self.storage_repository.open_range(staged_path):
+                digest.update(chunk)
+            sha256 = digest.hexdigest()
+
+        if sha256 != session.content_hash:
+            raise ValueError("El contenido del archivo subido no coincide con el checksum declarado")
@@ -0,0 +1,82 @@
+"""
+Caso de uso: Obtener contenido de documento
+"""
+import uuid
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+from ...domain.entities.document import Document
+from ...domain.repositories.document_repository import IDocumentRepository
+from ...domain.repositories.storage_repository import IStorageRepository
+
+
+@dataclass
+class DocumentContent:
+    """Metadata necesaria para servir el contenido de un documento"""
+    document: Document
+    etag: str
+    local_path: Optional[str] = None
+
+    @property
+    def size(self) -> int:
+        return self.document.file_size
+
+
+class GetDocumentContentUseCase:
+    """Caso de uso para descargar el contenido de un documento"""
+    
+    def __init__(
+        self,
+        document_repository: IDocumentRepository,
+        storage_repository: IStorageRepository
+    ):
+        self.document_repository = document_repository
+        self.storage_repository = storage_repository
+    
+    async def execute(self, document_id: str) -> Optional[DocumentContent]:
+        """
+        Resolver el documento y cómo leer su contenido
+        
+        El ETag es el hash del contenido: no cambia mientras el documento
+        exista. Los documentos anteriores al hash usan su ID, porque su
+        archivo tampoco se modifica nunca.
+        
+        Args:
+            document_id: ID del documento
+            
+        Returns:
+            DocumentContent o None si el documento no existe
+        """
+        try:
+            uuid.UUID(document_id)
+        except ValueError:
+            return None
+        
+        document = await self.document_repository.find_by_id(document_id)
+        
+        if document is None:
+            return None
+        
+        return DocumentContent(
+            document=document,
+            etag=f'"{document.content_hash or document.id}"',
+            local_path=self.storage_repository.get_local_path(document.file_path)
+        )
+    
+    def open_range(
+        self,
+        content: DocumentContent,
+        start: int = 0,
+        end: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Leer el contenido (o un rango de bytes) desde el storage
+        
+        Args:
+            content: Resultado de `execute`
+            start: Primer byte
+            end: Último byte, inclusive (None = hasta el final)
+            
+        Returns:
+            Iterador asíncrono con el contenido
+        """
+        return self.storage_repository.open_range(content.document.file_path, start, end)
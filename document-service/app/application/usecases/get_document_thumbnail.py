@@ -0,0 +1,150 @@
+"""
+Caso de uso: Obtener miniatura de documento
+"""
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+from ...domain.entities.document import Document
+from ...domain.repositories.document_repository import IDocumentRepository
+from ...domain.repositories.storage_repository import IStorageRepository
+from ...domain.services.storage_layout import StorageLayout
+from ...infrastructure.imaging.thumbnail_renderer import ThumbnailRenderer
+
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_MIME_TYPES = ['image/jpeg', 'image/png']
+
+
+class PreviewNotAvailableError(Exception):
+    """El documento no es una imagen o no se pudo decodificar"""
+
+
+@dataclass
+class DocumentThumbnail:
+    """Documento cuya miniatura se va a servir"""
+    document: Document
+    etag: str
+    media_type: str = 'image/webp'
+
+
+class GetDocumentThumbnailUseCase:
+    """
+    Caso de uso para obtener la miniatura de un documento de imagen
+
+    La miniatura se genera la primera vez que se pide y se guarda en el
+    storage junto a los blobs, así que la comparten los documentos con el
+    mismo contenido. Las peticiones simultáneas de la misma miniatura
+    esperan una sola generación (single-flight).
+    """
+    
+    def __init__(
+        self,
+        document_repository: IDocumentRepository,
+        storage_repository: IStorageRepository,
+        renderer: ThumbnailRenderer,
+        storage_layout: Optional[StorageLayout] = None
+    ):
+        self.document_repository = document_repository
+        self.storage_repository = storage_repository
+        self.renderer = renderer
+        self.storage_layout = storage_layout or StorageLayout()
+        self._inflight: dict[str, asyncio.Future] = {}
+    
+    async def execute(self, document_id: str) -> Optional[DocumentThumbnail]:
+        """
+        Resolver el documento y el ETag de su miniatura, sin generarla
+        
+        Args:
+            document_id: ID del documento
+            
+        Returns:
+            DocumentThumbnail o None si el documento no existe
+            
+        Raises:
+            PreviewNotAvailableError: Si el documento no es una imagen
+        """
+        try:
+            uuid.UUID(document_id)
+        except ValueError:
+            return None
+        
+        document = await self.document_repository.find_by_id(document_id)
+        
+        if document is None:
+            return None
+        
+        if document.mime_type not in THUMBNAIL_MIME_TYPES:
+            raise PreviewNotAvailableError("Vista previa disponible solo para imágenes JPEG y PNG")
+        
+        return DocumentThumbnail(
+            document=document,
+            etag=f'"{document.content_hash or document.id}-thumb"'
+        )
+    
+    async def load(self, thumbnail: DocumentThumbnail) -> bytes:
+        """
+        Leer la miniatura del storage o generarla si todavía no existe
+        
+        Args:
+            thumbnail: Resultado de `execute`
+            
+        Returns:
+            bytes: Miniatura en formato WebP
+            
+        Raises:
+            FileNotFoundError: Si el archivo original no está en el storage
+            PreviewNotAvailableError: Si la imagen no se puede decodificar
+        """
+        document = thumbnail.document
+        key = document.content_hash or document.id
+        task = self._inflight.get(key)
+        
+        if task is None:
+            task = asyncio.ensure_future(self._load(document))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # shield: si un cliente se desconecta, la generación sigue para los demás
+        return await asyncio.shield(task)
+    
+    async def _load(self, document: Document) -> bytes:
+        # Documentos anteriores al hash: no tienen blob al que asociarla
+        if document.content_hash is None:
+            return await self._render(document)
+        
+        path = self.storage_layout.thumbnail_path(document.content_hash)
+        
+        try:
+            return await self._read(path)
+        except FileNotFoundError:
+            pass
+        
+        content = await self._render(document)
+        
+        try:
+            staged_path = await self.storage_repository.upload_file(
+                file_content=content,
+                filename=f"tmp_thumb_{uuid.uuid4().hex}.webp",
+                content_type='image/webp'
+            )
+            await self.storage_repository.move_file(staged_path, path)
+        except Exception as e:
+            # Se sirve igual; se volverá a intentar guardar en la próxima petición
+            logger.warning(f"No se pudo guardar la miniatura {path}: {str(e)}")
+        
+        return content
+    
+    async def _render(self, document: Document) -> bytes:
+        data = await self._read(document.file_path)
+        
+        try:
+            return await self.renderer.render(data)
+        except Exception as e:
+            logger.warning(f"No se pudo generar la miniatura de {document.id}: {str(e)}")
+            raise PreviewNotAvailableError("No se pudo generar la vista previa de la imagen")
+    
+    async def _read(self, file_path: str) -> bytes:
+        return b''.join([chunk async for chunk in self.storage_repository.open_range(file_path)])
@@ -4,6 +4,7 @@ Caso de uso: Obtener URL de documento
 from typing import Optional
 from ...domain.repositories.document_repository import IDocumentRepository
 from ...domain.repositories.storage_repository import IStorageRepository
+from ...infrastructure.cache.url_cache import PresignedUrlCache
 
 
 class GetDocumentUrlUseCase:
@@ -12,10 +13,12 @@ class GetDocumentUrlUseCase:
     def __init__(
         self,
         document_repository: IDocumentRepository,
-        storage_repository: IStorageRepository
+        storage_repository: IStorageRepository,
+        url_cache: Optional[PresignedUrlCache] = None
     ):
         self.document_repository = document_repository
         self.storage_repository = storage_repository
+        self.url_cache = url_cache
     
     async def execute(self, document_id: str) -> Optional[str]:
         """
@@ -27,13 +30,26 @@ class GetDocumentUrlUseCase:
         Returns:
             URL del documento o None si no existe
         """
-        # Buscar documento en BD
+        # Siempre pasa por el repositorio (cacheado): un documento borrado
+        # o movido en otro proceso deja de firmarse enseguida
         document = await self.document_repository.find_by_id(document_id)
         
         if document is None:
             return None
         
-        # Obtener URL del storage
-        url = await self.storage_repository.get_file_url(document.file_path)
+        file_path = document.file_path
+        
+        if self.url_cache is None:
+            return await self.storage_repository.get_file_url(file_path)
+        
+        # Firmar solo si no hay una URL vigente para el archivo
+        url = self.url_cache.get_url(file_path)
+        
+        if url is None:
+            url = await self.storage_repository.get_file_url(
+                file_path,
+                expiration=self.url_cache.expiration
+            )
+            self.url_cache.put_url(file_path, url)
         
         return url
@@ -0,0 +1,92 @@
+"""
+Caso de uso: Obtener URLs de varios documentos
+"""
+import asyncio
+import uuid
+from typing import Optional
+from ...domain.entities.document import Document
+from ...domain.repositories.document_repository import IDocumentRepository
+from ...domain.repositories.storage_repository import IStorageRepository
+from ...infrastructure.cache.url_cache import PresignedUrlCache
+
+
+class GetDocumentUrlsUseCase:
+    """Caso de uso para resolver las URLs de acceso de muchos documentos a la vez"""
+    
+    def __init__(
+        self,
+        document_repository: IDocumentRepository,
+        storage_repository: IStorageRepository,
+        url_cache: Optional[PresignedUrlCache] = None
+    ):
+        self.document_repository = document_repository
+        self.storage_repository = storage_repository
+        self.url_cache = url_cache
+    
+    async def execute(self, document_ids: list[str]) -> dict[str, str]:
+        """
+        Obtener URLs de acceso para una lista de documentos
+        
+        Args:
+            document_ids: IDs de los documentos
+            
+        Returns:
+            Diccionario document_id -> URL; los IDs inexistentes o
+            inválidos no aparecen
+        """
+        valid_ids = [
+            document_id for document_id in dict.fromkeys(document_ids)
+            if self._is_uuid(document_id)
+        ]
+        
+        if not valid_ids:
+            return {}
+        
+        # Una sola consulta (el repositorio cacheado solo pide lo que no tiene)
+        documents = await self.document_repository.find_by_ids(valid_ids)
+        return await self._sign({document.id: document.file_path for document in documents})
+    
+    async def for_documents(self, documents: list[Document]) -> dict[str, str]:
+        """
+        Obtener URLs de acceso para documentos ya cargados
+        
+        Args:
+            documents: Documentos obtenidos previamente del repositorio
+            
+        Returns:
+            Diccionario document_id -> URL
+        """
+        return await self._sign({document.id: document.file_path for document in documents})
+    
+    async def _sign(self, file_paths: dict[str, str]) -> dict[str, str]:
+        """Firmar concurrentemente cada archivo distinto que no esté en caché"""
+        urls: dict[str, str] = {}
+        
+        if self.url_cache is not None:
+            for file_path in set(file_paths.values()):
+                url = self.url_cache.get_url(file_path)
+                
+                if url is not None:
+                    urls[file_path] = url
+        
+        expiration = self.url_cache.expiration if self.url_cache else 3600
+        to_sign = [file_path for file_path in set(file_paths.values()) if file_path not in urls]
+        signed = await asyncio.gather(*(
+            self.storage_repository.get_file_url(file_path, expiration=expiration)
+            for file_path in to_sign
+        ))
+        urls.update(zip(to_sign, signed))
+        
+        if self.url_cache is not None:
+            for file_path, url in zip(to_sign, signed):
+                self.url_cache.put_url(file_path, url)
+        
+        return {document_id: urls[file_path] for document_id, file_path in file_paths.items()}
+    
+    @staticmethod
+    def _is_uuid(value: str) -> bool:
+        try:
+            uuid.UUID(value)
+            return True
+        except (ValueError, AttributeError, TypeError):
+            return False
@@ -1,25 +1,91 @@
 """
 Caso de uso: Obtener documentos por postulación
 """
+from typing import Optional
 from ...domain.entities.document import Document
 from ...domain.repositories.document_repository import IDocumentRepository
+from .pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, encode_cursor_key, paginate
 
 
 class GetDocumentsByApplicationUseCase:
-    """Caso de uso para obtener todos los documentos de una postulación"""
+    """Caso de uso para obtener los documentos de una postulación, paginados"""
     
     def __init__(self, document_repository: IDocumentRepository):
         self.document_repository = document_repository
     
-    async def execute(self, application_id: str) -> list[Document]:
+    async def execute(
+        self,
+        application_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None
+    ) -> tuple[list[Document], Optional[str]]:
         """
-        Obtener todos los documentos de una postulación
+        Obtener una página de documentos de una postulación
         
         Args:
             application_id: ID de la postulación
+            limit: Tamaño de la página
+            cursor: Cursor devuelto por la página anterior
             
         Returns:
-            Lista de documentos
+            Tupla (documentos, cursor de la siguiente página o None)
+            
+        Raises:
+            ValueError: Si el cursor no es válido
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        after = decode_cursor(cursor) if cursor else None
+        
+        # Pedir una fila de más para saber si hay otra página
+        documents = await self.document_repository.find_by_application_id(
+            application_id,
+            limit=limit + 1,
+            after=after
+        )
+        return paginate(documents, limit)
+    
+    async def etag(self, application_id: str) -> str:
+        """
+        ETag débil del listado de una postulación, sin leer los documentos
+        
+        Args:
+            application_id: ID de la postulación
+            
+        Returns:
+            str: ETag que cambia al agregar o eliminar documentos
         """
-        documents = await self.document_repository.find_by_application_id(application_id)
-        return documents
+        version = await self.document_repository.list_version_by_application_id(application_id)
+        return f'W/"{version}"'
+    
+    async def execute_json(
+        self,
+        application_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None
+    ) -> tuple[str, Optional[str]]:
+        """
+        Obtener una página de documentos de una postulación ya serializada a JSON
+        
+        Args:
+            application_id: Igual que en `execute`
+            limit: Tamaño de la página
+            cursor: Cursor devuelto por la página anterior
+            fields: Campos a incluir (todos si es None)
+            
+        Returns:
+            Tupla (array JSON, cursor de la siguiente página o None)
+            
+        Raises:
+            ValueError: Si el cursor o los campos no son válidos
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        after = decode_cursor(cursor) if cursor else None
+        
+        items, next_key = await self.document_repository.find_json_by_application_id(
+            application_id,
+            limit=limit,
+            after=after,
+            fields=fields
+        )
+        return items, encode_cursor_key(next_key) if next_key else None
@@ -0,0 +1,53 @@
+"""
+Paginación por cursor (keyset) sobre (uploaded_at, id)
+"""
+import base64
+import uuid
+from datetime import datetime
+from typing import Optional
+from ...domain.entities.document import Document
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(document: Document) -> str:
+    """Cursor opaco que apunta justo después del documento indicado"""
+    return encode_cursor_key((document.uploaded_at, document.id))
+
+
+def encode_cursor_key(key: tuple[datetime, str]) -> str:
+    """Cursor opaco a partir de la clave (uploaded_at, id)"""
+    uploaded_at, document_id = key
+    raw = f"{uploaded_at.isoformat()}|{document_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decodificar un cursor generado por `encode_cursor`
+    
+    Raises:
+        ValueError: Si el cursor no es válido
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        uploaded_at, document_id = base64.urlsafe_b64decode(padded).decode().split('|')
+        return datetime.fromisoformat(uploaded_at), str(uuid.UUID(document_id))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Cursor de paginación inválido") from e
+
+
+def paginate(documents: list[Document], limit: int) -> tuple[list[Document], Optional[str]]:
+    """
+    Recortar una consulta hecha con `limit + 1` filas
+    
+    Returns:
+        Tupla (documentos de la página, cursor de la siguiente o None)
+    """
+    if len(documents) <= limit:
+        return documents, None
+    
+    page = documents[:limit]
+    return page, encode_cursor(page[-1])
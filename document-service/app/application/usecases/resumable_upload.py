@@ -0,0 +1,322 @@
+"""
+Caso de uso: Subida reanudable por chunks
+"""
+import uuid
+from typing import AsyncIterator, Optional
+from ...domain.entities.document import Document
+from ...domain.entities.upload_session import UploadSession
+from ...domain.repositories.storage_repository import IStorageRepository
+from ...domain.repositories.upload_session_repository import IUploadSessionRepository
+from .upload_document import (
+    ALLOWED_MIME_TYPES,
+    DOCUMENT_TYPES,
+    MAX_FILE_SIZE,
+    FileTooLargeError,
+    UploadDocumentUseCase
+)
+
+
+UPLOAD_SESSION_TTL = 24 * 60 * 60  # 24 horas
+
+
+def validate_upload_session(mime_type: str, file_size: int, application_id: str, document_type: str) -> None:
+    """
+    Validar los datos declarados al crear una sesión, antes de recibir bytes
+
+    Raises:
+        FileTooLargeError: Si el tamaño declarado supera el máximo
+        ValueError: Si los datos son inválidos
+    """
+    if file_size > MAX_FILE_SIZE:
+        raise FileTooLargeError()
+
+    if file_size <= 0:
+        raise ValueError("El archivo está vacío")
+
+    if mime_type not in ALLOWED_MIME_TYPES:
+        raise ValueError(f"Tipo de archivo no permitido: {mime_type}")
+
+    if document_type not in DOCUMENT_TYPES:
+        raise ValueError(f"Tipo de documento no válido: {document_type}")
+
+    try:
+        uuid.UUID(application_id)
+    except ValueError:
+        raise ValueError("ID de postulación inválido")
+
+
+class UploadConflictError(Exception):
+    """El chunk no encaja con el estado actual de la sesión"""
+
+    def __init__(self, message: str, offset: int):
+        super().__init__(message)
+        self.offset = offset
+
+
+class ResumableUploadUseCase:
+    """
+    Caso de uso para subir un archivo en varios chunks reanudables
+
+    El cliente crea una sesión declarando el tamaño total, envía chunks
+    indicando el offset en el que empieza cada uno, consulta el offset
+    actual si se cortó la conexión y finaliza la sesión al completar el
+    archivo. El estado vive en PostgreSQL y los chunks en el storage, así
+    que cualquier instancia del servicio puede continuar la subida.
+    """
+
+    def __init__(
+        self,
+        upload_session_repository: IUploadSessionRepository,
+        storage_repository: IStorageRepository,
+        upload_document_usecase: UploadDocumentUseCase,
+        session_ttl: int = UPLOAD_SESSION_TTL
+    ):
+        self.upload_session_repository = upload_session_repository
+        self.storage_repository = storage_repository
+        self.upload_document_usecase = upload_document_usecase
+        self.session_ttl = session_ttl
+
+    async def create(
+        self,
+        filename: str,
+        mime_type: str,
+        file_size: int,
+        user_document: str,
+        application_id: str,
+        document_type: str,
+        uploaded_by: Optional[str]
+    ) -> UploadSession:
+        """
+        Crear una sesión de subida
+
+        Se validan de entrada los mismos datos que en una subida normal
+        para no aceptar 10 MB de chunks que luego serían rechazados.
+
+        Args:
+            filename: Nombre original del archivo
+            mime_type: Tipo MIME del archivo
+            file_size: Tamaño total en bytes
+            user_document: Número de documento del usuario
+            application_id: ID de la postulación
+            document_type: Tipo de documento
+            uploaded_by: ID del usuario que sube el archivo
+
+        Returns:
+            UploadSession: Sesión creada
+
+        Raises:
+            FileTooLargeError: Si el tamaño declarado supera el máximo
+            ValueError: Si los datos son inválidos
+        """
+        validate_upload_session(mime_type, file_size, application_id, document_type)
+
+        session = UploadSession(
+            id=str(uuid.uuid4()),
+            user_document=user_document,
+            application_id=application_id,
+            document_type=document_type,
+            filename=filename,
+            mime_type=mime_type,
+            file_size=file_size,
+            uploaded_by=uploaded_by
+        )
+        return await self.upload_session_repository.create(session, self.session_ttl)
+
+    async def get(self, session_id: str) -> Optional[UploadSession]:
+        """
+        Obtener el estado de una sesión vigente
+
+        Args:
+            session_id: ID de la sesión
+
+        Returns:
+            UploadSession o None si no existe o venció
+        """
+        try:
+            uuid.UUID(session_id)
+        except ValueError:
+            return None
+
+        return await self.upload_session_repository.find_by_id(session_id)
+
+    async def append(
+        self,
+        session_id: str,
+        offset: int,
+        chunks: AsyncIterator[bytes]
+    ) -> Optional[UploadSession]:
+        """
+        Guardar un chunk que empieza en `offset`
+
+        Args:
+            session_id: ID de la sesión
+            offset: Byte en el que empieza el chunk; debe ser el offset actual
+            chunks: Contenido del chunk como iterador asíncrono de bytes
+
+        Returns:
+            UploadSession actualizada o None si la sesión no existe
+
+        Raises:
+            UploadConflictError: Si el offset no coincide o la sesión se está finalizando
+            ValueError: Si el chunk supera el tamaño declarado
+        """
+        session = await self.get(session_id)
+
+        if session is None:
+            return None
+
+        if session.is_direct:
+            raise UploadConflictError("La subida es directa al storage", session.received_size)
+
+        if session.status != 'open':
+            raise UploadConflictError("La subida se está finalizando", session.received_size)
+
+        if offset != session.received_size:
+            raise UploadConflictError(
+                f"El chunk debe empezar en el byte {session.received_size}", session.received_size
+            )
+
+        remaining = session.file_size - offset
+        counter = _ChunkCounter(chunks, remaining)
+
+        try:
+            part_path = await self.storage_repository.upload_stream(
+                chunks=counter,
+                filename=f"upload_{session_id}_{offset}_{uuid.uuid4().hex}.part",
+                content_type='application/octet-stream'
+            )
+        except ValueError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error al guardar el chunk: {str(e)}")
+
+        if counter.size == 0:
+            await self.storage_repository.delete_file(part_path)
+            return session
+
+        received_size = await self.upload_session_repository.add_part(
+            session_id, offset, counter.size, part_path
+        )
+
+        if received_size is None:
+            # Otro chunk para el mismo offset llegó antes: este se descarta
+            await self.storage_repository.delete_file(part_path)
+            current = await self.get(session_id)
+
+            if current is None:
+                return None
+
+            raise UploadConflictError(
+                f"El chunk debe empezar en el byte {current.received_size}", current.received_size
+            )
+
+        session.received_size = received_size
+        return session
+
+    async def complete(self, session_id: str) -> Optional[Document]:
+        """
+        Finalizar la sesión: concatenar los chunks y crear el documento con
+        la misma validación, deduplicación y metadata que `UploadDocumentUseCase`
+
+        Args:
+            session_id: ID de la sesión
+
+        Returns:
+            Document creado o None si la sesión no existe
+
+        Raises:
+            UploadConflictError: Si faltan bytes o la sesión ya se está finalizando
+            FileTooLargeError: Si el archivo supera el tamaño máximo
+            ValueError: Si los datos son inválidos
+        """
+        session = await self.get(session_id)
+
+        if session is None:
+            return None
+
+        if session.is_direct:
+            raise UploadConflictError("La subida es directa al storage", session.received_size)
+
+        # Solo una petición puede finalizar la sesión
+        reserved = await self.upload_session_repository.begin_completion(session_id)
+
+        if reserved is None:
+            if session.status != 'open':
+                raise UploadConflictError("La subida ya se está finalizando", session.received_size)
+            raise UploadConflictError(
+                f"Faltan {session.file_size - session.received_size} bytes por subir",
+                session.received_size
+            )
+
+        try:
+            parts = await self.upload_session_repository.list_parts(session_id)
+            document = await self.upload_document_usecase.execute(
+                chunks=self._read_parts(parts),
+                filename=reserved.filename,
+                mime_type=reserved.mime_type,
+                user_document=reserved.user_document,
+                application_id=reserved.application_id,
+                document_type=reserved.document_type,
+                uploaded_by=reserved.uploaded_by,
+                file_size=reserved.file_size
+            )
+        except BaseException:
+            await self.upload_session_repository.cancel_completion(session_id)
+            raise
+
+        await self.upload_session_repository.delete(session_id)
+        return document
+
+    async def abort(self, session_id: str) -> bool:
+        """
+        Cancelar una sesión y descartar sus chunks
+
+        Args:
+            session_id: ID de la sesión
+
+        Returns:
+            True si se eliminó, False si no existía
+
+        Raises:
+            UploadConflictError: Si la sesión se está finalizando
+        """
+        session = await self.get(session_id)
+
+        if session is None:
+            return False
+
+        if await self.upload_session_repository.delete(session_id, status='open') is None:
+            raise UploadConflictError("La subida se está finalizando", session.received_size)
+
+        return True
+
+    async def _read_parts(self, parts) -> AsyncIterator[bytes]:
+        """Leer los chunks en orden como un único flujo"""
+        expected_offset = 0
+
+        for part in parts:
+            if part.offset != expected_offset:
+                raise ValueError("Los chunks de la subida no son contiguos")
+
+            async for chunk in self.storage_repository.open_range(part.file_path):
+                yield chunk
+
+            expected_offset += part.size
+
+
+class _ChunkCounter:
+    """Cuenta los bytes de un chunk y corta si supera lo que falta por subir"""
+
+    def __init__(self, chunks: AsyncIterator[bytes], max_size: int):
+        self.chunks = chunks
+        self.max_size = max_size
+        self.size = 0
+
+    async def __aiter__(self):
+        async for chunk in self.chunks:
+            self.size += len(chunk)
+
+            if self.size > self.max_size:
+                raise ValueError("El chunk supera el tamaño declarado del archivo")
+
+            yield chunk
@@ -1,105 +1,296 @@
 """
 Caso de uso: Subir documento
 """
-from typing import BinaryIO, Optional
+from typing import AsyncIterator, Optional
 from datetime import datetime
+import hashlib
 import uuid
 from ...domain.entities.document import Document
 from ...domain.repositories.document_repository import IDocumentRepository
 from ...domain.repositories.storage_repository import IStorageRepository
+from ...domain.services.storage_layout import StorageLayout
+
+
+MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
+UPLOAD_CHUNK_SIZE = 64 * 1024  # 64 KB
+
+ALLOWED_MIME_TYPES = [
+    'application/pdf',
+    'application/msword',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'image/jpeg',
+    'image/png'
+]
+
+# Los mismos que admite chk_document_type en la tabla documents
+DOCUMENT_TYPES = ['cv', 'carta_presentacion', 'certificado', 'diploma', 'referencia', 'otro']
+
+
+class FileTooLargeError(ValueError):
+    """El archivo supera el tamaño máximo permitido"""
+
+    def __init__(self, max_size: int = MAX_FILE_SIZE):
+        super().__init__(f"El archivo no puede superar los {max_size // (1024 * 1024)} MB")
+
+
+class SizeLimitedStream:
+    """
+    Iterador de chunks que lleva la cuenta de bytes, calcula el SHA-256
+    del contenido y corta al superar el límite
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes], max_size: int = MAX_FILE_SIZE):
+        self.chunks = chunks
+        self.max_size = max_size
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+
+    async def __aiter__(self):
+        async for chunk in self.chunks:
+            self.size += len(chunk)
+
+            if self.size > self.max_size:
+                raise FileTooLargeError(self.max_size)
+
+            self.sha256.update(chunk)
+            yield chunk
 
 
 class UploadDocumentUseCase:
     """Caso de uso para subir documentos"""
-    
+
     def __init__(
         self,
         document_repository: IDocumentRepository,
-        storage_repository: IStorageRepository
+        storage_repository: IStorageRepository,
+        storage_layout: Optional[StorageLayout] = None
     ):
         self.document_repository = document_repository
         self.storage_repository = storage_repository
-    
+        self.storage_layout = storage_layout or StorageLayout()
+
     async def execute(
         self,
-        file_content: bytes,
+        chunks: AsyncIterator[bytes],
         filename: str,
-        file_size: int,
         mime_type: str,
         user_document: str,
         application_id: str,
         document_type: str,
-        uploaded_by: Optional[str]
+        uploaded_by: Optional[str],
+        file_size: Optional[int] = None
     ) -> Document:
         """
-        Subir documento al storage y guardar metadata en BD
-        
+        Subir documento al storage en streaming y guardar metadata en BD
+
         Args:
-            file_content: Contenido del archivo en bytes
+            chunks: Contenido del archivo como iterador asíncrono de bytes
             filename: Nombre del archivo
-            file_size: Tamaño del archivo en bytes
             mime_type: Tipo MIME del archivo
             user_document: Número de documento del usuario
             application_id: ID de la postulación
             document_type: Tipo de documento (cv, carta_presentacion, etc)
             uploaded_by: ID del usuario que sube el archivo
-            
+            file_size: Tamaño declarado por el cliente, si se conoce
+
         Returns:
             Document: Documento creado
-            
+
+        Raises:
+            FileTooLargeError: Si el archivo supera el tamaño máximo
+            ValueError: Si los datos son inválidos
+            Exception: Si falla el upload al storage
+        """
+        document = await self.store(
+            chunks=chunks,
+            filename=filename,
+            mime_type=mime_type,
+            user_document=user_document,
+            application_id=application_id,
+            document_type=document_type,
+            uploaded_by=uploaded_by,
+            file_size=file_size
+        )
+
+        return await self.save(document)
+
+    async def save(self, document: Document) -> Document:
+        """
+        Guardar la metadata de un documento devuelto por `store` o `adopt`,
+        soltando el blob si falla
+
+        Args:
+            document: Documento listo para guardar
+
+        Returns:
+            Document: Documento guardado
+        """
+        try:
+            return await self.document_repository.save(document)
+        except Exception:
+            await self.discard(document)
+            raise
+
+    async def store(
+        self,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        mime_type: str,
+        user_document: str,
+        application_id: str,
+        document_type: str,
+        uploaded_by: Optional[str],
+        file_size: Optional[int] = None
+    ) -> Document:
+        """
+        Subir el contenido al storage y registrar el blob, sin guardar la
+        fila del documento. Si luego no se guarda, hay que llamar a `discard`
+
+        Args:
+            Los mismos que `execute`
+
+        Returns:
+            Document: Documento listo para guardar
+
         Raises:
+            FileTooLargeError: Si el archivo supera el tamaño máximo
             ValueError: Si los datos son inválidos
             Exception: Si falla el upload al storage
         """
-        # Validaciones
-        if file_size > 10 * 1024 * 1024:  # 10 MB
-            raise ValueError("El archivo no puede superar los 10 MB")
-        
-        allowed_types = [
-            'application/pdf',
-            'application/msword',
-            'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            'image/jpeg',
-            'image/png'
-        ]
-        
-        if mime_type not in allowed_types:
+        # Validaciones previas a leer el contenido
+        if file_size is not None and file_size > MAX_FILE_SIZE:
+            raise FileTooLargeError()
+
+        if mime_type not in ALLOWED_MIME_TYPES:
             raise ValueError(f"Tipo de archivo no permitido: {mime_type}")
-        
+
         # Generar ID único para el documento
         document_id = str(uuid.uuid4())
-        
-        # Generar ruta del archivo con timestamp para evitar colisiones
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-        extension = filename.split('.')[-1]
-        new_filename = f"{document_type}_{timestamp}.{extension}"
-        
-        # Subir archivo al storage
+        extension = self.storage_layout.extension(filename)
+
+        # Subir a una ruta temporal mientras se calcula el hash del contenido
+        stream = SizeLimitedStream(chunks)
+
         try:
-            stored_path = await self.storage_repository.upload_file(
-                file_content=file_content,
-                filename=new_filename,
+            staged_path = await self.storage_repository.upload_stream(
+                chunks=stream,
+                filename=f"tmp_{document_id}.{extension}",
                 content_type=mime_type
             )
+        except ValueError:
+            raise
         except Exception as e:
             raise Exception(f"Error al subir archivo: {str(e)}")
-        
-        # Crear entidad Document
-        document = Document(
+
+        if stream.size == 0:
+            await self.storage_repository.delete_file(staged_path)
+            raise ValueError("El archivo está vacío")
+
+        return await self.adopt(
+            staged_path=staged_path,
+            content_hash=stream.sha256.hexdigest(),
+            file_size=stream.size,
+            filename=filename,
+            mime_type=mime_type,
+            user_document=user_document,
+            application_id=application_id,
+            document_type=document_type,
+            uploaded_by=uploaded_by,
+            document_id=document_id
+        )
+
+    async def adopt(
+        self,
+        staged_path: str,
+        content_hash: str,
+        file_size: int,
+        filename: str,
+        mime_type: str,
+        user_document: str,
+        application_id: str,
+        document_type: str,
+        uploaded_by: Optional[str],
+        document_id: Optional[str] = None,
+        keep_staged: bool = False
+    ) -> Document:
+        """
+        Registrar como blob un archivo ya presente en el storage con hash
+        verificado, sin guardar la fila del documento
+
+        Args:
+            staged_path: Ruta temporal del archivo
+            content_hash: SHA-256 del contenido
+            file_size: Tamaño del archivo en bytes
+            keep_staged: Copiar en lugar de mover, dejando el temporal a quien lo creó
+            Los demás, igual que `execute`
+
+        Returns:
+            Document: Documento listo para guardar
+        """
+        document_id = document_id or str(uuid.uuid4())
+
+        # Nombre visible derivado del UUID: no colisiona aunque lleguen
+        # varias subidas del mismo tipo en el mismo segundo. La extensión
+        # pasa por el layout: el nombre lo elige el cliente y podría traer
+        # "/" o no tener punto
+        extension = self.storage_layout.extension(filename)
+        new_filename = self.storage_layout.document_filename(document_type, document_id, extension)
+
+        # Direccionar el contenido por hash: archivos idénticos comparten blob
+        file_path, created = await self.document_repository.acquire_blob(
+            content_hash=content_hash,
+            file_path=self.storage_layout.blob_path(content_hash, extension),
+            file_size=file_size,
+            mime_type=mime_type
+        )
+
+        try:
+            # Un blob existente puede no tener aún su archivo: la subida que
+            # lo creó registra la referencia antes de mover el contenido, y si
+            # el move falla lo suelta sin haberlo escrito. En ese caso se
+            # coloca la copia propia, que tiene el mismo contenido
+            place = created or await self.storage_repository.stat_file(file_path) is None
+
+            if place and keep_staged:
+                await self.storage_repository.copy_file(staged_path, file_path)
+            elif place:
+                await self.storage_repository.move_file(staged_path, file_path)
+            elif not keep_staged:
+                await self.storage_repository.delete_file(staged_path)
+        except Exception:
+            await self._release(content_hash)
+            raise
+
+        return Document(
             id=document_id,
             user_document=user_document,
             application_id=application_id,
             filename=new_filename,
             original_filename=filename,
-            file_path=stored_path,
+            file_path=file_path,
             file_size=file_size,
             mime_type=mime_type,
             document_type=document_type,
             uploaded_at=datetime.utcnow(),
-            uploaded_by=uploaded_by
+            uploaded_by=uploaded_by,
+            content_hash=content_hash
         )
-        
-        # Guardar metadata en base de datos
-        saved_document = await self.document_repository.save(document)
-        
-        return saved_document
+
+    async def discard(self, document: Document) -> None:
+        """
+        Deshacer `store` para un documento que no llegó a guardarse
+
+        Args:
+            document: Documento devuelto por `store`
+        """
+        await self._release(document.content_hash)
+
+    async def _release(self, content_hash: str) -> None:
+        """
+        Soltar la referencia al blob
+
+        Si quedó huérfano, el archivo no se borra aquí: entre el release y
+        el borrado otra subida del mismo contenido podría volver a crear el
+        blob en la misma ruta. Lo borra el worker de limpieza desde la outbox.
+        """
+        await self.document_repository.release_blob(content_hash)
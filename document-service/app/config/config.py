@@ -21,14 +21,45 @@ class Settings(BaseSettings):
     db_password: str = "postgres"
     db_min_pool_size: int = 5
     db_max_pool_size: int = 20
+    db_statement_cache_size: int = 100  # Caché implícita de asyncpg por conexión (0 = desactivada)
+    db_statement_cache_lifetime: int = 0  # Segundos que una sentencia sin uso sigue en la caché (0 = sin límite)
+    db_prepare_statements: bool = False  # Comprobar el SQL del repositorio al abrir cada conexión (un round trip por sentencia)
+    
+    # Caché de metadata de documentos
+    document_cache_size: int = 10000
+    document_cache_ttl: int = 60  # Segundos
+    document_cache_negative_ttl: int = 5  # Segundos para IDs inexistentes
     
     # JWT
     jwt_secret: str = "your_jwt_secret_change_in_production"
     jwt_algorithm: str = "HS256"
+    jwt_cache_size: int = 10000  # Tokens verificados en caché
+    jwt_cache_ttl: int = 300  # Segundos (nunca más allá del exp del token)
+    
+    # Carga masiva
+    bulk_upload_concurrency: int = 4  # Archivos subidos al storage en paralelo por petición
+    
+    # Subidas reanudables
+    upload_session_ttl: int = 86400  # Segundos que una sesión sin finalizar conserva sus chunks
+    
+    # Worker de limpieza del storage (outbox storage_deletions)
+    storage_cleanup_enabled: bool = True
+    storage_cleanup_batch_size: int = 100  # Filas reclamadas por iteración
+    storage_cleanup_concurrency: int = 4  # Borrados simultáneos (cada uno ocupa una conexión)
+    storage_cleanup_interval: float = 1.0  # Segundos de espera cuando la cola está vacía
+    storage_cleanup_max_attempts: int = 10  # Después queda en la tabla para revisión manual
+    storage_cleanup_lease: int = 300  # Segundos que una fila reclamada queda reservada
+    
+    # Miniaturas de imágenes
+    thumbnail_max_size: int = 320  # Lado máximo en píxeles
+    thumbnail_quality: int = 80  # Calidad WebP
+    thumbnail_workers: int = 2  # Procesos del pool de generación
     
     # Storage
-    storage_type: str = "local"  # "local" o "s3"
+    storage_type: str = "local"  # "local", "s3" o "memory" (solo desarrollo y benchmarks)
     storage_base_path: str = "./storage"
+    storage_fanout_depth: int = 2  # Niveles de directorios por prefijo del hash
+    storage_fanout_width: int = 2  # Caracteres del hash por nivel
     
     # AWS S3
     aws_access_key_id: str = ""
@@ -36,6 +67,31 @@ class Settings(BaseSettings):
     aws_region: str = "us-east-1"
     s3_bucket_name: str = ""
     s3_url_expiration: int = 3600  # 1 hora
+    s3_endpoint_url: str = ""  # Servicio compatible con S3 (MinIO, LocalStack); vacío = AWS
+    s3_upload_url_expiration: int = 900  # Validez de las URLs de subida directa
+    s3_max_pool_connections: int = 32  # Conexiones HTTP reutilizables del cliente
+    s3_io_threads: int = 32  # Hilos del pool que ejecuta las llamadas a boto3 (<= conexiones)
+    s3_connect_timeout: float = 5.0  # Segundos
+    s3_read_timeout: float = 30.0  # Segundos
+    s3_max_attempts: int = 3  # Intentos por llamada, con reintentos estándar de botocore
+    s3_multipart_chunk_size: int = 5242880  # 5 MB (mínimo de S3); memoria máxima por subida y umbral del PUT único
+    
+    # Caché de URLs firmadas
+    url_cache_size: int = 10000
+    url_cache_safety_margin: int = 300  # Segundos antes de que expire la firma
+    
+    # Métricas
+    metrics_enabled: bool = True  # Middleware HTTP, timing de repositorios y /metrics
+    
+    # Tracing
+    tracing_enabled: bool = False
+    tracing_sample_rate: float = 0.01  # Fracción de peticiones trazadas completas (1.0 = todas)
+    tracing_slow_threshold_ms: float = 0  # Conservar además toda petición más lenta (0 = desactivado)
+    tracing_exporter: str = "jsonl"  # "jsonl" u "otlp"
+    tracing_jsonl_path: str = "./traces/spans.jsonl"
+    tracing_otlp_endpoint: str = "http://localhost:4318"  # Base del collector (se envía a /v1/traces)
+    tracing_export_interval: float = 2.0  # Segundos entre envíos
+    tracing_max_pending: int = 2048  # Trazas en espera de exportar; las siguientes se descartan
     
     # CORS
     cors_origins: list = ["http://localhost:3000", "http://localhost:5173"]
@@ -1,19 +1,53 @@
 ﻿"""
 Contenedor de dependencias - Dependency Injection
 """
-import asyncpg
 from functools import lru_cache
 from ..config.config import get_settings
+from ..domain.services.storage_layout import StorageLayout
 from ..infrastructure.persistence.postgres_document_repository import PostgresDocumentRepository
+from ..infrastructure.persistence.postgres_upload_session_repository import PostgresUploadSessionRepository
+from ..infrastructure.persistence.cached_document_repository import CachedDocumentRepository
+from ..infrastructure.persistence.db_pool import create_instrumented_pool
 from ..infrastructure.storage.local_storage import LocalStorageRepository
 from ..infrastructure.storage.s3_storage import S3StorageRepository
+from ..infrastructure.storage.memory_storage import MemoryStorageRepository
 from ..infrastructure.auth.jwt_service import JWTService
+from ..infrastructure.auth.cached_jwt_service import CachedJWTService
+from ..infrastructure.cache.url_cache import PresignedUrlCache
+from ..infrastructure.workers.storage_cleanup_worker import StorageCleanupWorker
+from ..infrastructure.workers.span_export_worker import SpanExportWorker
+from ..infrastructure.imaging.thumbnail_renderer import ThumbnailRenderer
+from ..infrastructure.metrics import (
+    MetricsRegistry,
+    InstrumentedDocumentRepository,
+    InstrumentedStorageRepository,
+    register_pool_metrics,
+    register_cache_metrics,
+    register_worker_metrics
+)
+from ..infrastructure.tracing import (
+    Tracer,
+    SpanExporter,
+    JsonlSpanExporter,
+    OtlpJsonSpanExporter,
+    TracedPool,
+    TracedDocumentRepository,
+    TracedStorageRepository,
+    TracedUploadDocumentUseCase
+)
 from ..application.usecases import (
     UploadDocumentUseCase,
+    BulkUploadDocumentsUseCase,
     GetDocumentUrlUseCase,
+    GetDocumentUrlsUseCase,
+    GetDocumentContentUseCase,
+    GetDocumentThumbnailUseCase,
     GetDocumentsByApplicationUseCase,
     GetDocumentsByUserUseCase,
-    DeleteDocumentUseCase
+    DeleteDocumentUseCase,
+    DeleteApplicationDocumentsUseCase,
+    ResumableUploadUseCase,
+    DirectUploadUseCase
 )
 from ..presentation.controllers.document_controller import DocumentController
 
@@ -26,19 +60,46 @@ class Container:
         self.db_pool = None
         self._jwt_service = None
         self._storage_repository = None
+        self._storage_backend = None
+        self._storage_layout = None
         self._document_repository = None
+        self._upload_session_repository = None
+        self._url_cache = None
+        self._storage_cleanup_worker = None
+        self._thumbnail_renderer = None
+        self._get_document_thumbnail_usecase = None
+        self._metrics_registry = None
+        self._tracer = None
+        self._traced_pool = None
+        self._span_export_worker = None
     
     async def init_db_pool(self):
         """Inicializar pool de conexiones a PostgreSQL"""
         if self.db_pool is None:
-            self.db_pool = await asyncpg.create_pool(
+            # La caché implícita de asyncpg guarda cada sentencia del repositorio
+            # tras su primer uso en la conexión: debe tener sitio para todas y,
+            # con vida 0, no las descarta aunque la conexión pase un rato ociosa.
+            # El hook `init` opcional solo comprueba el SQL al abrir cada conexión
+            init = None
+            statement_cache_size = self.settings.db_statement_cache_size
+            if statement_cache_size > 0:
+                statement_cache_size = max(
+                    statement_cache_size, len(PostgresDocumentRepository.STATEMENTS)
+                )
+            if self.settings.db_prepare_statements:
+                init = PostgresDocumentRepository.prepare_statements
+            
+            self.db_pool = await create_instrumented_pool(
                 host=self.settings.db_host,
                 port=self.settings.db_port,
                 database=self.settings.db_name,
                 user=self.settings.db_user,
                 password=self.settings.db_password,
                 min_size=self.settings.db_min_pool_size,
-                max_size=self.settings.db_max_pool_size
+                max_size=self.settings.db_max_pool_size,
+                statement_cache_size=statement_cache_size,
+                max_cached_statement_lifetime=self.settings.db_statement_cache_lifetime,
+                init=init
             )
     
     async def close_db_pool(self):
@@ -46,13 +107,16 @@ class Container:
         if self.db_pool is not None:
             await self.db_pool.close()
             self.db_pool = None
+            self._traced_pool = None
     
     def jwt_service(self) -> JWTService:
         """Obtener servicio JWT"""
         if self._jwt_service is None:
-            self._jwt_service = JWTService(
+            self._jwt_service = CachedJWTService(
                 secret_key=self.settings.jwt_secret,
-                algorithm=self.settings.jwt_algorithm
+                algorithm=self.settings.jwt_algorithm,
+                cache_size=self.settings.jwt_cache_size,
+                cache_ttl=self.settings.jwt_cache_ttl
             )
         return self._jwt_service
     
@@ -60,43 +124,242 @@ class Container:
         """Obtener repositorio de storage segÃºn configuraciÃ³n"""
         if self._storage_repository is None:
             if self.settings.storage_type == "s3":
-                self._storage_repository = S3StorageRepository(
+                self._storage_backend = S3StorageRepository(
                     aws_access_key_id=self.settings.aws_access_key_id,
                     aws_secret_access_key=self.settings.aws_secret_access_key,
                     region_name=self.settings.aws_region,
                     bucket_name=self.settings.s3_bucket_name,
-                    url_expiration=self.settings.s3_url_expiration
+                    url_expiration=self.settings.s3_url_expiration,
+                    endpoint_url=self.settings.s3_endpoint_url,
+                    max_pool_connections=self.settings.s3_max_pool_connections,
+                    io_threads=self.settings.s3_io_threads,
+                    connect_timeout=self.settings.s3_connect_timeout,
+                    read_timeout=self.settings.s3_read_timeout,
+                    max_attempts=self.settings.s3_max_attempts,
+                    multipart_chunk_size=self.settings.s3_multipart_chunk_size
                 )
+            elif self.settings.storage_type == "memory":
+                self._storage_backend = MemoryStorageRepository()
             else:
-                self._storage_repository = LocalStorageRepository(
+                self._storage_backend = LocalStorageRepository(
                     storage_path=self.settings.storage_base_path
                 )
+            
+            self._storage_repository = self._storage_backend
+            if self.settings.metrics_enabled:
+                self._storage_repository = InstrumentedStorageRepository(
+                    self._storage_repository, self.metrics_registry()
+                )
+            if self.settings.tracing_enabled:
+                self._storage_repository = TracedStorageRepository(self._storage_repository, self.tracer())
         return self._storage_repository
     
+    def shutdown_storage(self) -> None:
+        """Liberar los recursos del storage (el pool de hilos de S3)"""
+        if isinstance(self._storage_backend, S3StorageRepository):
+            self._storage_backend.shutdown()
+    
+    def storage_layout(self) -> StorageLayout:
+        """Obtener la organización de rutas del storage"""
+        if self._storage_layout is None:
+            self._storage_layout = StorageLayout(
+                fanout_depth=self.settings.storage_fanout_depth,
+                fanout_width=self.settings.storage_fanout_width
+            )
+        return self._storage_layout
+    
+    def url_cache(self) -> PresignedUrlCache:
+        """Obtener caché de URLs firmadas compartida por los casos de uso"""
+        if self._url_cache is None:
+            self._url_cache = PresignedUrlCache(
+                expiration=self.settings.s3_url_expiration,
+                safety_margin=self.settings.url_cache_safety_margin,
+                max_size=self.settings.url_cache_size
+            )
+        return self._url_cache
+    
     def document_repository(self):
         """Obtener repositorio de documentos"""
         if self._document_repository is None:
             if self.db_pool is None:
                 raise RuntimeError("Database pool not initialized")
-            self._document_repository = PostgresDocumentRepository(self.db_pool)
+            repository = PostgresDocumentRepository(self.query_pool())
+            # Debajo de la caché: se miden solo las llamadas que llegan a la BD
+            if self.settings.metrics_enabled:
+                repository = InstrumentedDocumentRepository(repository, self.metrics_registry())
+            if self.settings.tracing_enabled:
+                repository = TracedDocumentRepository(repository, self.tracer())
+            self._document_repository = CachedDocumentRepository(
+                repository,
+                max_size=self.settings.document_cache_size,
+                ttl=self.settings.document_cache_ttl,
+                negative_ttl=self.settings.document_cache_negative_ttl
+            )
         return self._document_repository
     
+    def upload_session_repository(self) -> PostgresUploadSessionRepository:
+        """Obtener repositorio de sesiones de subida reanudable"""
+        if self._upload_session_repository is None:
+            if self.db_pool is None:
+                raise RuntimeError("Database pool not initialized")
+            self._upload_session_repository = PostgresUploadSessionRepository(self.query_pool())
+        return self._upload_session_repository
+    
+    def metrics_registry(self) -> MetricsRegistry:
+        """Obtener registro de métricas del proceso"""
+        if self._metrics_registry is None:
+            registry = MetricsRegistry()
+            
+            # Se leen al exponer: los componentes se crean después que el registro
+            register_pool_metrics(registry, lambda: self.db_pool)
+            register_cache_metrics(registry, {
+                'document': self._document_cache_counts,
+                'presigned_url': lambda: {'hit': self.url_cache().hits, 'miss': self.url_cache().misses},
+                'jwt': lambda: {'hit': self.jwt_service().cache.hits, 'miss': self.jwt_service().cache.misses}
+            })
+            register_worker_metrics(registry, lambda: self._storage_cleanup_worker)
+            self._metrics_registry = registry
+        return self._metrics_registry
+    
+    def _document_cache_counts(self) -> dict:
+        if self._document_repository is None:
+            return {}
+        stats = self._document_repository.stats()
+        return {'hit': stats['hits'], 'negative_hit': stats['negative_hits'], 'miss': stats['misses']}
+    
+    def tracer(self) -> Tracer:
+        """Obtener tracer del proceso"""
+        if self._tracer is None:
+            slow_threshold = self.settings.tracing_slow_threshold_ms
+            self._tracer = Tracer(
+                sample_rate=self.settings.tracing_sample_rate,
+                slow_threshold=slow_threshold / 1000 if slow_threshold > 0 else None,
+                max_pending=self.settings.tracing_max_pending
+            )
+        return self._tracer
+    
+    def query_pool(self):
+        """Pool que usan los repositorios: con tracing, cada consulta es un span"""
+        if self.db_pool is None:
+            raise RuntimeError("Database pool not initialized")
+        if not self.settings.tracing_enabled:
+            return self.db_pool
+        if self._traced_pool is None:
+            statements = dict(PostgresDocumentRepository.STATEMENTS)
+            statements.update({
+                'upload_session.' + name[:-len('_QUERY')].lower(): query
+                for name, query in vars(PostgresUploadSessionRepository).items()
+                if name.endswith('_QUERY')
+            })
+            self._traced_pool = TracedPool(self.db_pool, self.tracer(), statements)
+        return self._traced_pool
+    
+    def span_exporter(self) -> SpanExporter:
+        """Crear el exportador de spans según configuración"""
+        if self.settings.tracing_exporter == "otlp":
+            return OtlpJsonSpanExporter(
+                endpoint=self.settings.tracing_otlp_endpoint,
+                service_name=self.settings.app_name
+            )
+        return JsonlSpanExporter(self.settings.tracing_jsonl_path)
+    
+    def span_export_worker(self) -> SpanExportWorker:
+        """Obtener worker que envía los spans terminados al exportador"""
+        if self._span_export_worker is None:
+            self._span_export_worker = SpanExportWorker(
+                tracer=self.tracer(),
+                exporter=self.span_exporter(),
+                interval=self.settings.tracing_export_interval
+            )
+        return self._span_export_worker
+    
+    def storage_cleanup_worker(self) -> StorageCleanupWorker:
+        """Obtener worker que vacía la outbox de borrados del storage"""
+        if self._storage_cleanup_worker is None:
+            if self.db_pool is None:
+                raise RuntimeError("Database pool not initialized")
+            self._storage_cleanup_worker = StorageCleanupWorker(
+                db_pool=self.db_pool,
+                storage_repository=self.storage_repository(),
+                batch_size=self.settings.storage_cleanup_batch_size,
+                concurrency=self.settings.storage_cleanup_concurrency,
+                interval=self.settings.storage_cleanup_interval,
+                max_attempts=self.settings.storage_cleanup_max_attempts,
+                lease=self.settings.storage_cleanup_lease,
+                storage_layout=self.storage_layout(),
+                upload_session_repository=self.upload_session_repository()
+            )
+        return self._storage_cleanup_worker
+    
+    def thumbnail_renderer(self) -> ThumbnailRenderer:
+        """Obtener generador de miniaturas (singleton: un solo pool de procesos)"""
+        if self._thumbnail_renderer is None:
+            self._thumbnail_renderer = ThumbnailRenderer(
+                max_workers=self.settings.thumbnail_workers,
+                max_size=self.settings.thumbnail_max_size,
+                quality=self.settings.thumbnail_quality
+            )
+        return self._thumbnail_renderer
+    
     # Use Cases
     
     def upload_document_usecase(self) -> UploadDocumentUseCase:
         """Obtener caso de uso para subir documentos"""
+        if self.settings.tracing_enabled:
+            return TracedUploadDocumentUseCase(
+                document_repository=self.document_repository(),
+                storage_repository=self.storage_repository(),
+                tracer=self.tracer(),
+                storage_layout=self.storage_layout()
+            )
         return UploadDocumentUseCase(
             document_repository=self.document_repository(),
-            storage_repository=self.storage_repository()
+            storage_repository=self.storage_repository(),
+            storage_layout=self.storage_layout()
+        )
+    
+    def bulk_upload_documents_usecase(self) -> BulkUploadDocumentsUseCase:
+        """Obtener caso de uso para subir varios documentos a la vez"""
+        return BulkUploadDocumentsUseCase(
+            upload_document_usecase=self.upload_document_usecase(),
+            document_repository=self.document_repository(),
+            max_concurrency=self.settings.bulk_upload_concurrency
         )
     
     def get_document_url_usecase(self) -> GetDocumentUrlUseCase:
         """Obtener caso de uso para obtener URL de documento"""
         return GetDocumentUrlUseCase(
+            document_repository=self.document_repository(),
+            storage_repository=self.storage_repository(),
+            url_cache=self.url_cache()
+        )
+    
+    def get_document_urls_usecase(self) -> GetDocumentUrlsUseCase:
+        """Obtener caso de uso para resolver URLs de varios documentos"""
+        return GetDocumentUrlsUseCase(
+            document_repository=self.document_repository(),
+            storage_repository=self.storage_repository(),
+            url_cache=self.url_cache()
+        )
+    
+    def get_document_content_usecase(self) -> GetDocumentContentUseCase:
+        """Obtener caso de uso para descargar el contenido de documentos"""
+        return GetDocumentContentUseCase(
             document_repository=self.document_repository(),
             storage_repository=self.storage_repository()
         )
     
+    def get_document_thumbnail_usecase(self) -> GetDocumentThumbnailUseCase:
+        """Obtener caso de uso de miniaturas (singleton: comparte las generaciones en curso)"""
+        if self._get_document_thumbnail_usecase is None:
+            self._get_document_thumbnail_usecase = GetDocumentThumbnailUseCase(
+                document_repository=self.document_repository(),
+                storage_repository=self.storage_repository(),
+                renderer=self.thumbnail_renderer(),
+                storage_layout=self.storage_layout()
+            )
+        return self._get_document_thumbnail_usecase
+    
     def get_documents_by_application_usecase(self) -> GetDocumentsByApplicationUseCase:
         """Obtener caso de uso para listar documentos por postulaciÃ³n"""
         return GetDocumentsByApplicationUseCase(
@@ -112,8 +375,33 @@ class Container:
     def delete_document_usecase(self) -> DeleteDocumentUseCase:
         """Obtener caso de uso para eliminar documentos"""
         return DeleteDocumentUseCase(
-            document_repository=self.document_repository(),
-            storage_repository=self.storage_repository()
+            document_repository=self.document_repository()
+        )
+    
+    def delete_application_documents_usecase(self) -> DeleteApplicationDocumentsUseCase:
+        """Obtener caso de uso para eliminar los documentos de una postulación"""
+        return DeleteApplicationDocumentsUseCase(
+            document_repository=self.document_repository()
+        )
+    
+    def resumable_upload_usecase(self) -> ResumableUploadUseCase:
+        """Obtener caso de uso de subidas reanudables"""
+        return ResumableUploadUseCase(
+            upload_session_repository=self.upload_session_repository(),
+            storage_repository=self.storage_repository(),
+            upload_document_usecase=self.upload_document_usecase(),
+            session_ttl=self.settings.upload_session_ttl
+        )
+    
+    def direct_upload_usecase(self) -> DirectUploadUseCase:
+        """Obtener caso de uso de subidas directas al storage"""
+        return DirectUploadUseCase(
+            upload_session_repository=self.upload_session_repository(),
+            storage_repository=self.storage_repository(),
+            upload_document_usecase=self.upload_document_usecase(),
+            storage_layout=self.storage_layout(),
+            session_ttl=self.settings.upload_session_ttl,
+            url_expiration=self.settings.s3_upload_url_expiration
         )
     
     # Controllers
@@ -122,10 +410,18 @@ class Container:
         """Obtener controlador de documentos"""
         return DocumentController(
             upload_document_usecase=self.upload_document_usecase(),
+            bulk_upload_documents_usecase=self.bulk_upload_documents_usecase(),
             get_document_url_usecase=self.get_document_url_usecase(),
+            get_document_urls_usecase=self.get_document_urls_usecase(),
+            get_document_content_usecase=self.get_document_content_usecase(),
+            get_document_thumbnail_usecase=self.get_document_thumbnail_usecase(),
             get_documents_by_application_usecase=self.get_documents_by_application_usecase(),
             get_documents_by_user_usecase=self.get_documents_by_user_usecase(),
-            delete_document_usecase=self.delete_document_usecase()
+            delete_document_usecase=self.delete_document_usecase(),
+            delete_application_documents_usecase=self.delete_application_documents_usecase(),
+            resumable_upload_usecase=self.resumable_upload_usecase(),
+            direct_upload_usecase=self.direct_upload_usecase(),
+            jwt_service=self.jwt_service()
         )
 
 
@@ -1,6 +1,7 @@
 """
 Domain entities
 """
-from .document import Document
+from .document import Document, DOCUMENT_FIELDS
+from .upload_session import UploadSession
 
-__all__ = ["Document"]
+__all__ = ["Document", "DOCUMENT_FIELDS", "UploadSession"]
@@ -6,6 +6,23 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 
+# Campos que se pueden proyectar en los listados (orden de la respuesta)
+DOCUMENT_FIELDS = [
+    'id',
+    'user_document',
+    'application_id',
+    'filename',
+    'original_filename',
+    'file_path',
+    'file_size',
+    'mime_type',
+    'document_type',
+    'uploaded_at',
+    'uploaded_by',
+    'content_hash'
+]
+
+
 class Document(BaseModel):
     """Entidad Document - representa un archivo subido"""
     
@@ -20,6 +37,7 @@ class Document(BaseModel):
     document_type: str = Field(..., description="Tipo de documento")
     uploaded_at: datetime = Field(default_factory=datetime.utcnow, description="Fecha de subida")
     uploaded_by: Optional[str] = Field(None, description="UUID del usuario que subio")
+    content_hash: Optional[str] = Field(None, description="SHA-256 del contenido (blob compartido)")
     
     class Config:
         json_schema_extra = {
@@ -27,14 +45,15 @@ class Document(BaseModel):
                 "id": "123e4567-e89b-12d3-a456-426614174000",
                 "user_document": "1234567890",
                 "application_id": "123e4567-e89b-12d3-a456-426614174001",
-                "filename": "cv_20251113_120000.pdf",
+                "filename": "cv_123e4567-e89b-12d3-a456-426614174000.pdf",
                 "original_filename": "Mi CV.pdf",
-                "file_path": "2025/11/cv_20251113_120000.pdf",
+                "file_path": "blobs/9f/86/9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08.pdf",
                 "file_size": 524288,
                 "mime_type": "application/pdf",
                 "document_type": "cv",
                 "uploaded_at": "2025-11-13T12:00:00",
-                "uploaded_by": "system"
+                "uploaded_by": "system",
+                "content_hash": "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"
             }
         }
 
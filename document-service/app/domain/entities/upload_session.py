@@ -0,0 +1,32 @@
+"""
+UploadSession Entity - Clean Architecture
+"""
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class UploadSession(BaseModel):
+    """Entidad UploadSession - subida reanudable en curso"""
+    
+    id: str = Field(..., description="UUID de la sesión")
+    user_document: str = Field(..., description="Número de documento del usuario")
+    application_id: str = Field(..., description="UUID de la postulación")
+    document_type: str = Field(..., description="Tipo de documento")
+    filename: str = Field(..., description="Nombre original del archivo")
+    mime_type: str = Field(..., description="Tipo MIME del archivo")
+    file_size: int = Field(..., description="Tamaño total declarado en bytes")
+    received_size: int = Field(0, description="Bytes recibidos (offset del próximo chunk)")
+    status: str = Field("open", description="open o completing")
+    uploaded_by: Optional[str] = Field(None, description="UUID del usuario que sube")
+    content_hash: Optional[str] = Field(None, description="SHA-256 declarado; solo en subidas directas al storage")
+    created_at: datetime = Field(default_factory=datetime.utcnow, description="Fecha de creación")
+    expires_at: Optional[datetime] = Field(None, description="Fecha a partir de la cual se descarta")
+    
+    @property
+    def is_complete(self) -> bool:
+        return self.received_size == self.file_size
+    
+    @property
+    def is_direct(self) -> bool:
+        return self.content_hash is not None
@@ -1,7 +1,16 @@
 """
 Domain Repositories
 """
-from .storage_repository import IStorageRepository
+from .storage_repository import IStorageRepository, StoredFile, FileMetadata, PresignedUpload
 from .document_repository import IDocumentRepository
+from .upload_session_repository import IUploadSessionRepository, UploadPart
 
-__all__ = ['IStorageRepository', 'IDocumentRepository']
+__all__ = [
+    'IStorageRepository',
+    'StoredFile',
+    'FileMetadata',
+    'PresignedUpload',
+    'IDocumentRepository',
+    'IUploadSessionRepository',
+    'UploadPart'
+]
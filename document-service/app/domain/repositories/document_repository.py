@@ -2,6 +2,7 @@
 Interfaz del repositorio de documentos
 """
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional
 from ..entities.document import Document
 
@@ -14,27 +15,160 @@ class IDocumentRepository(ABC):
         """Guardar documento en la base de datos"""
         pass
     
+    @abstractmethod
+    async def save_many(self, documents: list[Document]) -> list[Document]:
+        """
+        Guardar varios documentos en una sola transacción
+        
+        Returns:
+            Los documentos tal como quedaron guardados, en el orden recibido
+        """
+        pass
+    
     @abstractmethod
     async def find_by_id(self, document_id: str) -> Optional[Document]:
         """Buscar documento por ID"""
         pass
     
     @abstractmethod
-    async def find_by_user_document(self, user_document: str) -> list[Document]:
-        """Buscar todos los documentos de un usuario por su número de documento"""
+    async def find_by_ids(self, document_ids: list[str]) -> list[Document]:
+        """Buscar varios documentos por ID en una sola consulta"""
+        pass
+    
+    @abstractmethod
+    async def find_by_user_document(
+        self,
+        user_document: str,
+        limit: Optional[int] = None,
+        after: Optional[tuple[datetime, str]] = None
+    ) -> list[Document]:
+        """
+        Buscar documentos de un usuario por su número de documento
+        
+        Ordenados por (uploaded_at, id) descendente. `after` es la clave
+        (uploaded_at, id) del último documento de la página anterior.
+        """
+        pass
+    
+    @abstractmethod
+    async def find_by_application_id(
+        self,
+        application_id: str,
+        limit: Optional[int] = None,
+        after: Optional[tuple[datetime, str]] = None
+    ) -> list[Document]:
+        """
+        Buscar documentos de una postulación
+        
+        Ordenados por (uploaded_at, id) descendente. `after` es la clave
+        (uploaded_at, id) del último documento de la página anterior.
+        """
         pass
     
     @abstractmethod
-    async def find_by_application_id(self, application_id: str) -> list[Document]:
-        """Buscar todos los documentos de una postulación"""
+    async def find_json_by_user_document(
+        self,
+        user_document: str,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        fields: Optional[list[str]] = None
+    ) -> tuple[str, Optional[tuple[datetime, str]]]:
+        """
+        Página de documentos de un usuario serializada a JSON por la BD
+        
+        Returns:
+            Tupla (array JSON con hasta `limit` documentos, clave
+            (uploaded_at, id) para la siguiente página o None)
+        """
+        pass
+    
+    @abstractmethod
+    async def find_json_by_application_id(
+        self,
+        application_id: str,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        fields: Optional[list[str]] = None
+    ) -> tuple[str, Optional[tuple[datetime, str]]]:
+        """
+        Página de documentos de una postulación serializada a JSON por la BD
+        
+        Returns:
+            Tupla (array JSON con hasta `limit` documentos, clave
+            (uploaded_at, id) para la siguiente página o None)
+        """
+        pass
+    
+    @abstractmethod
+    async def list_version_by_user_document(self, user_document: str) -> str:
+        """
+        Validador barato del listado de un usuario
+        
+        Returns:
+            str: Valor opaco que cambia cuando se agrega o elimina un documento
+        """
+        pass
+    
+    @abstractmethod
+    async def list_version_by_application_id(self, application_id: str) -> str:
+        """
+        Validador barato del listado de una postulación
+        
+        Returns:
+            str: Valor opaco que cambia cuando se agrega o elimina un documento
+        """
         pass
     
     @abstractmethod
     async def delete(self, document_id: str) -> bool:
-        """Eliminar documento de la base de datos"""
+        """Eliminar documento y encolar el borrado de su archivo si queda sin referencias"""
+        pass
+    
+    @abstractmethod
+    async def delete_by_application_id(self, application_id: str) -> tuple[list[str], list[str]]:
+        """
+        Eliminar todos los documentos de una postulación y liberar sus blobs
+        
+        Returns:
+            tuple: IDs eliminados y rutas de archivos encoladas para borrar del storage
+        """
         pass
     
     @abstractmethod
     async def exists_by_id(self, document_id: str) -> bool:
         """Verificar si existe un documento por ID"""
         pass
+    
+    @abstractmethod
+    async def acquire_blob(
+        self,
+        content_hash: str,
+        file_path: str,
+        file_size: int,
+        mime_type: str
+    ) -> tuple[str, bool]:
+        """
+        Registrar una referencia a un blob identificado por su hash
+        
+        Si el blob no existe se crea con `file_path`; si ya existe se
+        incrementa su contador de referencias. La referencia se registra
+        antes de que el creador escriba el archivo, así que un blob
+        existente no garantiza que su archivo esté ya en el storage.
+        
+        Returns:
+            Tupla (ruta del blob en storage, True si el blob es nuevo)
+        """
+        pass
+    
+    @abstractmethod
+    async def release_blob(self, content_hash: str) -> Optional[str]:
+        """
+        Liberar una referencia a un blob
+        
+        Si era la última, el archivo se encola en `storage_deletions` en la
+        misma sentencia y lo elimina el worker de limpieza.
+        
+        Returns:
+            Ruta del archivo encolada si era la última referencia, None en otro caso
+        """
+        pass
@@ -2,7 +2,30 @@
 Storage Repository Interface - Clean Architecture
 """
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Optional
+from datetime import datetime
+from typing import AsyncIterator, BinaryIO, NamedTuple, Optional
+
+
+class StoredFile(NamedTuple):
+    """Archivo presente en el storage"""
+    path: str
+    size: int
+    modified: datetime
+
+
+class FileMetadata(NamedTuple):
+    """Metadata de un archivo obtenida sin leer su contenido"""
+    size: int
+    content_type: Optional[str]
+    sha256: Optional[str]  # Hex; None si el storage no guarda el checksum
+
+
+class PresignedUpload(NamedTuple):
+    """Petición firmada para que el cliente suba un archivo directo al storage"""
+    url: str
+    method: str
+    headers: dict  # Headers que el cliente debe enviar tal cual
+    expires_in: int
 
 
 class IStorageRepository(ABC):
@@ -28,6 +51,68 @@ class IStorageRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def upload_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        content_type: str
+    ) -> str:
+        """
+        Subir archivo al storage a partir de un flujo de chunks
+        
+        Los chunks se envían al storage a medida que llegan, sin
+        acumular el archivo completo en memoria. Si el iterador lanza
+        una excepción, no debe quedar ningún archivo parcial.
+        
+        Args:
+            chunks: Iterador asíncrono con el contenido del archivo
+            filename: Nombre del archivo
+            content_type: Tipo MIME del archivo
+            
+        Returns:
+            Ruta del archivo en storage
+        """
+        pass
+    
+    @abstractmethod
+    def open_range(
+        self,
+        file_path: str,
+        start: int = 0,
+        end: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Leer un archivo (o un rango de bytes) por chunks
+        
+        Args:
+            file_path: Ruta del archivo
+            start: Primer byte a leer
+            end: Último byte a leer, inclusive (None = hasta el final)
+            
+        Returns:
+            Iterador asíncrono con el contenido
+            
+        Raises:
+            FileNotFoundError: Si el archivo no existe (al pedir el primer chunk)
+        """
+        pass
+    
+    @abstractmethod
+    def get_local_path(self, file_path: str) -> Optional[str]:
+        """
+        Ruta en el sistema de archivos local, si el storage la tiene
+        
+        Permite enviar el archivo sin copiarlo por el proceso (sendfile).
+        
+        Args:
+            file_path: Ruta del archivo en storage
+            
+        Returns:
+            Ruta absoluta, o None si el storage es remoto
+        """
+        pass
+    
     @abstractmethod
     async def get_file_url(self, file_path: str, expiration: int = 3600) -> str:
         """
@@ -55,6 +140,80 @@ class IStorageRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def move_file(self, source_path: str, target_path: str) -> str:
+        """
+        Mover un archivo a otra ruta dentro del storage
+        
+        Args:
+            source_path: Ruta actual del archivo
+            target_path: Ruta destino (se sobrescribe si existe)
+            
+        Returns:
+            Ruta destino del archivo
+        """
+        pass
+    
+    @abstractmethod
+    async def copy_file(self, source_path: str, target_path: str) -> str:
+        """
+        Copiar un archivo a otra ruta dentro del storage
+        
+        Args:
+            source_path: Ruta del archivo original (se conserva)
+            target_path: Ruta destino (se sobrescribe si existe)
+            
+        Returns:
+            Ruta destino del archivo
+            
+        Raises:
+            FileNotFoundError: Si el archivo original no existe
+        """
+        pass
+    
+    @abstractmethod
+    async def generate_upload_url(
+        self,
+        file_path: str,
+        content_type: str,
+        file_size: int,
+        sha256: str,
+        expiration: int = 900
+    ) -> PresignedUpload:
+        """
+        Firmar una subida directa del cliente al storage
+        
+        La firma cubre el tipo, el tamaño y el checksum SHA-256: el storage
+        rechaza cualquier subida que no coincida con lo declarado.
+        
+        Args:
+            file_path: Ruta destino del archivo
+            content_type: Tipo MIME exigido
+            file_size: Tamaño exacto exigido en bytes
+            sha256: Checksum SHA-256 exigido (hex)
+            expiration: Validez de la firma en segundos
+            
+        Returns:
+            PresignedUpload con la URL, el método y los headers a enviar
+            
+        Raises:
+            NotImplementedError: Si el storage no admite subidas directas
+        """
+        pass
+    
+    @abstractmethod
+    async def stat_file(self, file_path: str) -> Optional[FileMetadata]:
+        """
+        Obtener tamaño, tipo y checksum de un archivo sin descargarlo
+        
+        Args:
+            file_path: Ruta del archivo
+            
+        Returns:
+            FileMetadata o None si el archivo no existe
+        """
+        pass
+    
     @abstractmethod
     async def file_exists(self, file_path: str) -> bool:
         """
@@ -67,3 +226,26 @@ class IStorageRepository(ABC):
             True si existe
         """
         pass
+    
+    @abstractmethod
+    def list_files(
+        self,
+        prefix: str = "",
+        start_after: Optional[str] = None
+    ) -> AsyncIterator[StoredFile]:
+        """
+        Recorrer los archivos del storage en orden de bytes de la ruta
+        
+        El orden coincide con `ORDER BY file_path COLLATE "C"` en
+        PostgreSQL, de modo que ambos listados se pueden cruzar en un solo
+        recorrido. Los archivos se obtienen por páginas, sin cargar el
+        listado completo en memoria.
+        
+        Args:
+            prefix: Solo rutas que empiezan por este prefijo
+            start_after: Solo rutas estrictamente mayores (para reanudar)
+            
+        Returns:
+            Iterador asíncrono de StoredFile (fecha de modificación en UTC)
+        """
+        pass
@@ -0,0 +1,93 @@
+"""
+Interfaz del repositorio de sesiones de subida reanudable
+"""
+from abc import ABC, abstractmethod
+from typing import NamedTuple, Optional
+from ..entities.upload_session import UploadSession
+
+
+class UploadPart(NamedTuple):
+    """Chunk recibido de una sesión, guardado como archivo en el storage"""
+    offset: int
+    size: int
+    file_path: str
+
+
+class IUploadSessionRepository(ABC):
+    """Interfaz para el repositorio de sesiones de subida"""
+    
+    @abstractmethod
+    async def create(self, session: UploadSession, ttl: int, staged_path: Optional[str] = None) -> UploadSession:
+        """
+        Guardar una sesión nueva
+        
+        Args:
+            session: Sesión a guardar
+            ttl: Segundos hasta que la sesión vence
+            staged_path: Ruta donde el cliente subirá el archivo directamente;
+                se registra como chunk para que se borre junto con la sesión
+            
+        Returns:
+            UploadSession: Sesión guardada, con su fecha de vencimiento
+        """
+        pass
+    
+    @abstractmethod
+    async def find_by_id(self, session_id: str) -> Optional[UploadSession]:
+        """Buscar una sesión vigente (no vencida) por ID"""
+        pass
+    
+    @abstractmethod
+    async def add_part(self, session_id: str, offset: int, size: int, file_path: str) -> Optional[int]:
+        """
+        Registrar un chunk si la sesión sigue abierta en ese offset
+        
+        Returns:
+            int: Nuevo offset, o None si otro chunk llegó antes o la sesión cambió
+        """
+        pass
+    
+    @abstractmethod
+    async def list_parts(self, session_id: str) -> list[UploadPart]:
+        """Chunks de la sesión ordenados por offset"""
+        pass
+    
+    @abstractmethod
+    async def begin_completion(self, session_id: str) -> Optional[UploadSession]:
+        """
+        Pasar la sesión de open a completing si recibió todos los bytes
+        (las subidas directas se verifican en el storage después)
+        
+        Returns:
+            UploadSession o None si no está abierta o está incompleta
+        """
+        pass
+    
+    @abstractmethod
+    async def cancel_completion(self, session_id: str) -> None:
+        """Volver a abrir una sesión cuya finalización falló"""
+        pass
+    
+    @abstractmethod
+    async def delete(self, session_id: str, status: Optional[str] = None) -> Optional[list[str]]:
+        """
+        Eliminar la sesión y encolar el borrado de sus chunks
+        
+        Args:
+            session_id: ID de la sesión
+            status: Eliminarla solo si está en este estado
+            
+        Returns:
+            list[str]: Rutas encoladas, o None si la sesión no existía
+        """
+        pass
+    
+    @abstractmethod
+    async def delete_expired(self, limit: int) -> int:
+        """
+        Eliminar sesiones vencidas y encolar el borrado de sus chunks
+        
+        Returns:
+            int: Número de sesiones eliminadas
+        """
+        pass
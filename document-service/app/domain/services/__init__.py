@@ -0,0 +1,6 @@
+"""
+Domain Services
+"""
+from .storage_layout import StorageLayout
+
+__all__ = ['StorageLayout']
@@ -0,0 +1,78 @@
+"""
+Organización de las rutas dentro del storage
+"""
+import re
+from typing import Optional
+
+
+class StorageLayout:
+    """
+    Rutas de los archivos en el storage, derivadas de hashes y UUIDs
+
+    Los blobs y las miniaturas se reparten en directorios por los primeros
+    caracteres del hash (`fanout_depth` niveles de `fanout_width`
+    caracteres): con 2 niveles de 2 caracteres hay 65.536 directorios y
+    ninguno crece sin límite. Como los nombres salen del hash o del UUID
+    del documento, dos subidas nunca producen la misma ruta.
+
+    Las subidas directas al storage llegan primero a `incoming/`, con el
+    ID de la sesión como nombre, y se copian al blob al verificarlas.
+    """
+
+    BLOB_PREFIX = 'blobs/'
+    THUMBNAIL_PREFIX = 'thumbnails/'
+    INCOMING_PREFIX = 'incoming/'
+
+    BLOB_PATH = re.compile(r'^blobs/(?:[0-9a-f]+/)*(?P<hash>[0-9a-f]{64})\.[^/.]+$')
+    THUMBNAIL_PATH = re.compile(r'^thumbnails/(?:[0-9a-f]+/)*(?P<hash>[0-9a-f]{64})\.webp$')
+    EXTENSION = re.compile(r'[a-z0-9]{1,10}')
+
+    def __init__(self, fanout_depth: int = 2, fanout_width: int = 2):
+        if fanout_depth < 0 or fanout_width < 1 or fanout_depth * fanout_width > 32:
+            raise ValueError("Configuración de fan-out del storage inválida")
+
+        self.fanout_depth = fanout_depth
+        self.fanout_width = fanout_width
+
+    def blob_path(self, content_hash: str, extension: str) -> str:
+        """Ruta del blob con el contenido `content_hash`"""
+        return f"{self.BLOB_PREFIX}{self._shard(content_hash)}{content_hash}.{extension}"
+
+    def thumbnail_path(self, content_hash: str) -> str:
+        """Ruta de la miniatura de un blob, compartida por documentos iguales"""
+        return f"{self.THUMBNAIL_PREFIX}{self._shard(content_hash)}{content_hash}.webp"
+
+    def incoming_path(self, session_id: str, extension: str) -> str:
+        """Ruta donde el cliente sube directamente el archivo de una sesión"""
+        return f"{self.INCOMING_PREFIX}{session_id}.{extension}"
+
+    def document_filename(self, document_type: str, document_id: str, extension: str) -> str:
+        """Nombre visible del documento, único por construcción"""
+        return f"{document_type}_{document_id}.{extension}"
+
+    def blob_hash(self, file_path: str) -> Optional[str]:
+        """Hash de un blob a partir de su ruta, con cualquier fan-out"""
+        match = self.BLOB_PATH.match(file_path)
+        return match.group('hash') if match else None
+
+    def thumbnail_hash(self, file_path: str) -> Optional[str]:
+        """Hash del blob de una miniatura a partir de su ruta"""
+        match = self.THUMBNAIL_PATH.match(file_path)
+        return match.group('hash') if match else None
+
+    @classmethod
+    def extension(cls, file_path: str) -> str:
+        """
+        Extensión de una ruta, sin el punto
+
+        Solo se aceptan extensiones alfanuméricas de hasta 10 caracteres:
+        el resto (vacías, con espacios, `%` o `\\`...) pasan a `bin` para
+        que un nombre enviado por el cliente no acabe en la ruta del blob.
+        """
+        name = file_path.rsplit('/', 1)[-1]
+        extension = name.rsplit('.', 1)[-1].lower() if '.' in name else ''
+        return extension if cls.EXTENSION.fullmatch(extension) else 'bin'
+
+    def _shard(self, key: str) -> str:
+        width = self.fanout_width
+        return ''.join(f"{key[i * width:(i + 1) * width]}/" for i in range(self.fanout_depth))
@@ -2,5 +2,6 @@
 Auth Infrastructure
 """
 from .jwt_service import JWTService
+from .cached_jwt_service import CachedJWTService
 
-__all__ = ['JWTService']
+__all__ = ['JWTService', 'CachedJWTService']
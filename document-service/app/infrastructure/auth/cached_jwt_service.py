@@ -0,0 +1,48 @@
+"""
+JWT Service con caché de tokens verificados
+"""
+import hashlib
+import time
+from typing import Optional
+from .jwt_service import JWTService
+from ..cache.ttl_cache import TTLCache
+
+
+class CachedJWTService(JWTService):
+    """
+    JWTService que recuerda los payloads ya verificados
+    
+    La clave es un digest SHA-256 del token (el token no se guarda en
+    memoria) y cada entrada vive como máximo hasta el `exp` del token.
+    """
+    
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str = 'HS256',
+        cache_size: int = 10000,
+        cache_ttl: int = 300
+    ):
+        super().__init__(secret_key, algorithm)
+        self.cache = TTLCache(max_size=cache_size, ttl=cache_ttl)
+    
+    def verify_token(self, token: str) -> Optional[dict]:
+        """Verificar token usando la caché antes de decodificarlo"""
+        key = hashlib.sha256(token.encode()).digest()
+        payload = self.cache.get(key)
+        
+        if payload is not None:
+            return payload
+        
+        payload = super().verify_token(token)
+        
+        if payload is None:
+            return None
+        
+        ttl = self.cache.ttl
+        exp = payload.get('exp')
+        if isinstance(exp, (int, float)):
+            ttl = min(ttl, exp - time.time())
+        
+        self.cache.set(key, payload, ttl)
+        return payload
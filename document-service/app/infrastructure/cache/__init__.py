@@ -0,0 +1,7 @@
+"""
+Cache Infrastructure
+"""
+from .ttl_cache import TTLCache
+from .url_cache import PresignedUrlCache
+
+__all__ = ['TTLCache', 'PresignedUrlCache']
@@ -0,0 +1,71 @@
+"""
+Caché LRU en memoria con expiración por entrada
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Caché LRU acotada en tamaño donde cada entrada expira tras su TTL
+    
+    No es thread-safe: está pensada para usarse desde el event loop.
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Obtener un valor vigente o `default` si no existe o expiró"""
+        entry = self._entries.get(key)
+        
+        if entry is None:
+            self.misses += 1
+            return default
+        
+        expires_at, value = entry
+        
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.misses += 1
+            return default
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Guardar un valor; con `ttl` <= 0 no se guarda"""
+        ttl = self.ttl if ttl is None else ttl
+        
+        if ttl <= 0:
+            self._entries.pop(key, None)
+            return
+        
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def delete(self, key: Hashable) -> None:
+        """Eliminar una entrada si existe"""
+        self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Vaciar la caché"""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,48 @@
+"""
+Caché de URLs de acceso a documentos
+"""
+from typing import Optional
+from .ttl_cache import TTLCache
+
+
+class PresignedUrlCache:
+    """
+    Caché de URLs firmadas indexada por `file_path`
+    
+    Cada URL se conserva hasta `safety_margin` segundos antes de que
+    expire la firma. No guarda la relación documento -> ruta: la
+    existencia y la ruta de cada documento se consultan siempre al
+    repositorio (con su propia caché corta), así un borrado en otro
+    worker o una ruta cambiada por la migración de layout no se siguen
+    firmando durante casi una hora.
+    """
+    
+    def __init__(self, expiration: int = 3600, safety_margin: int = 300, max_size: int = 10000):
+        self.expiration = expiration
+        self.safety_margin = safety_margin
+        self._urls = TTLCache(max_size=max_size, ttl=max(expiration - safety_margin, 0))
+    
+    def get_url(self, file_path: str) -> Optional[str]:
+        """URL vigente para una ruta en storage"""
+        return self._urls.get(file_path)
+    
+    def put_url(self, file_path: str, url: str) -> None:
+        """
+        Guardar una URL recién firmada
+        
+        Solo debe llamarse justo después de firmar: el TTL cuenta desde
+        este momento.
+        """
+        self._urls.set(file_path, url)
+    
+    def invalidate_url(self, file_path: str) -> None:
+        """Olvidar la URL de un archivo eliminado"""
+        self._urls.delete(file_path)
+    
+    @property
+    def hits(self) -> int:
+        return self._urls.hits
+    
+    @property
+    def misses(self) -> int:
+        return self._urls.misses
@@ -0,0 +1,6 @@
+"""
+Imaging Infrastructure
+"""
+from .thumbnail_renderer import ThumbnailRenderer, render_thumbnail
+
+__all__ = ['ThumbnailRenderer', 'render_thumbnail']
@@ -0,0 +1,103 @@
+"""
+Generación de miniaturas con Pillow en un pool de procesos
+"""
+import asyncio
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+from PIL import Image, ImageOps
+
+
+def render_thumbnail(data: bytes, max_size: int, quality: int) -> bytes:
+    """
+    Reducir una imagen a WebP dentro de un cuadrado de `max_size` píxeles
+
+    Se ejecuta en un proceso hijo: debe ser una función de módulo para
+    poder serializarse.
+
+    Args:
+        data: Contenido de la imagen original
+        max_size: Lado máximo de la miniatura
+        quality: Calidad WebP (0-100)
+
+    Returns:
+        bytes: Miniatura en formato WebP
+    """
+    with Image.open(io.BytesIO(data)) as image:
+        # En JPEG decodifica directamente a 1/2, 1/4 o 1/8 de la resolución
+        image.draft('RGB', (max_size, max_size))
+        thumbnail = ImageOps.exif_transpose(image)
+        thumbnail.thumbnail((max_size, max_size))
+
+        if thumbnail.mode not in ('RGB', 'RGBA'):
+            has_alpha = 'A' in thumbnail.getbands() or 'transparency' in thumbnail.info
+            thumbnail = thumbnail.convert('RGBA' if has_alpha else 'RGB')
+
+        output = io.BytesIO()
+        thumbnail.save(output, 'WEBP', quality=quality, method=4)
+        return output.getvalue()
+
+
+class ThumbnailRenderer:
+    """
+    Ejecuta `render_thumbnail` fuera del event loop
+
+    Decodificar y redimensionar es trabajo de CPU que retiene el GIL, así
+    que va a un ProcessPoolExecutor. Los procesos se crean con `spawn` (no
+    heredan el estado del loop ni las conexiones del padre) al pedir la
+    primera miniatura, y se reemplazan cada `max_tasks_per_child` tareas.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_size: int = 320,
+        quality: int = 80,
+        max_tasks_per_child: int = 100
+    ):
+        self.max_workers = max_workers
+        self.max_size = max_size
+        self.quality = quality
+        self.max_tasks_per_child = max_tasks_per_child
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    async def render(self, data: bytes) -> bytes:
+        """
+        Generar la miniatura de una imagen
+
+        Args:
+            data: Contenido de la imagen original
+
+        Returns:
+            bytes: Miniatura en formato WebP
+
+        Raises:
+            PIL.UnidentifiedImageError: Si el contenido no es una imagen válida
+        """
+        loop = asyncio.get_running_loop()
+
+        try:
+            return await loop.run_in_executor(
+                self._get_executor(), render_thumbnail, data, self.max_size, self.quality
+            )
+        except BrokenProcessPool:
+            # Un hijo murió (p. ej. sin memoria): el pool no se recupera solo
+            self.shutdown()
+            raise
+
+    def shutdown(self) -> None:
+        """Terminar los procesos del pool sin esperar tareas pendientes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                max_tasks_per_child=self.max_tasks_per_child
+            )
+        return self._executor
@@ -0,0 +1,20 @@
+"""
+Metrics Infrastructure
+"""
+from .registry import MetricsRegistry, Counter, Gauge, Histogram, LATENCY_BUCKETS, SIZE_BUCKETS
+from .instrumented_repositories import InstrumentedDocumentRepository, InstrumentedStorageRepository
+from .collectors import register_pool_metrics, register_cache_metrics, register_worker_metrics
+
+__all__ = [
+    'MetricsRegistry',
+    'Counter',
+    'Gauge',
+    'Histogram',
+    'LATENCY_BUCKETS',
+    'SIZE_BUCKETS',
+    'InstrumentedDocumentRepository',
+    'InstrumentedStorageRepository',
+    'register_pool_metrics',
+    'register_cache_metrics',
+    'register_worker_metrics'
+]
@@ -0,0 +1,100 @@
+"""
+Collectors que exponen los contadores que ya llevan otros componentes
+"""
+from typing import Callable, Optional
+from .registry import MetricsRegistry
+
+
+def register_pool_metrics(registry: MetricsRegistry, get_pool: Callable[[], Optional[object]]) -> None:
+    """
+    Exponer `InstrumentedPool.stats()`: ocupación y espera del pool
+
+    Args:
+        registry: Registro de métricas
+        get_pool: Devuelve el pool actual o None si aún no existe
+    """
+    def stats() -> dict:
+        pool = get_pool()
+        return pool.stats() if pool is not None else {}
+
+    def connections():
+        current = stats()
+        for state in ('in_use', 'idle'):
+            if state in current:
+                yield '', {'state': state}, current[state]
+
+    def limits():
+        current = stats()
+        for bound in ('min_size', 'max_size'):
+            if bound in current:
+                yield '', {'bound': bound}, current[bound]
+
+    def waiting():
+        current = stats()
+        if 'waiting' in current:
+            yield '', {}, current['waiting']
+
+    def acquires():
+        current = stats()
+        if 'acquire_count' in current:
+            yield '', {}, current['acquire_count']
+
+    def acquire_wait():
+        current = stats()
+        if 'acquire_wait_max_ms' in current:
+            yield '', {'stat': 'avg'}, current['acquire_wait_avg_ms'] / 1000
+            yield '', {'stat': 'max'}, current['acquire_wait_max_ms'] / 1000
+
+    registry.register_collector('db_pool_connections', 'Conexiones del pool por estado', connections)
+    registry.register_collector('db_pool_size_limit', 'Tamaño mínimo y máximo configurado del pool', limits)
+    registry.register_collector('db_pool_waiting', 'Peticiones esperando una conexión libre', waiting)
+    registry.register_collector('db_pool_acquires_total', 'Conexiones obtenidas del pool', acquires, 'counter')
+    registry.register_collector(
+        'db_pool_acquire_wait_seconds', 'Espera por una conexión desde el arranque', acquire_wait
+    )
+
+
+def register_cache_metrics(registry: MetricsRegistry, caches: dict[str, Callable[[], dict]]) -> None:
+    """
+    Exponer aciertos y fallos de las cachés como `cache_requests_total{cache,result}`
+
+    Args:
+        registry: Registro de métricas
+        caches: Nombre de cada caché y una función que devuelve
+            {resultado: total}, por ejemplo {'hit': 10, 'miss': 2}
+    """
+    def collect():
+        for name, counts in caches.items():
+            for result, value in counts().items():
+                yield '', {'cache': name, 'result': result}, value
+
+    registry.register_collector(
+        'cache_requests_total', 'Consultas a las cachés en memoria por resultado', collect, 'counter'
+    )
+
+
+def register_worker_metrics(registry: MetricsRegistry, get_worker: Callable[[], Optional[object]]) -> None:
+    """
+    Exponer `StorageCleanupWorker.stats()`
+
+    Args:
+        registry: Registro de métricas
+        get_worker: Devuelve el worker o None si está desactivado
+    """
+    def processed():
+        worker = get_worker()
+        if worker is None:
+            return
+        current = worker.stats()
+        for result in ('deleted', 'skipped', 'failed', 'expired_sessions'):
+            yield '', {'result': result}, current[result]
+
+    def running():
+        worker = get_worker()
+        if worker is not None:
+            yield '', {}, 1 if worker.stats()['running'] else 0
+
+    registry.register_collector(
+        'storage_cleanup_processed_total', 'Filas de la outbox de borrados procesadas por resultado', processed, 'counter'
+    )
+    registry.register_collector('storage_cleanup_running', 'Si el worker de limpieza está en marcha', running)
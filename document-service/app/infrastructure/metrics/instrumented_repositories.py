@@ -0,0 +1,215 @@
+"""
+Decoradores que miden la duración de las llamadas a los repositorios
+"""
+import time
+from datetime import datetime
+from typing import AsyncIterator, Optional
+from ...domain.entities.document import Document
+from ...domain.repositories.document_repository import IDocumentRepository
+from ...domain.repositories.storage_repository import (
+    IStorageRepository,
+    StoredFile,
+    FileMetadata,
+    PresignedUpload
+)
+from .registry import MetricsRegistry
+
+
+class _CallMetrics:
+    """Histograma de duración y contador de errores por operación"""
+
+    def __init__(self, registry: MetricsRegistry, prefix: str, subject: str):
+        self.duration = registry.histogram(
+            f"{prefix}_duration_seconds",
+            f"Duración de las llamadas al {subject}",
+            ('operation',)
+        )
+        self.errors = registry.counter(
+            f"{prefix}_errors_total",
+            f"Llamadas al {subject} que lanzaron una excepción",
+            ('operation',)
+        )
+
+    async def call(self, operation: str, awaitable):
+        started = time.perf_counter()
+
+        try:
+            return await awaitable
+        except BaseException:
+            self.errors.inc(operation)
+            raise
+        finally:
+            self.duration.observe(operation, value=time.perf_counter() - started)
+
+    async def iterate(self, operation: str, iterator: AsyncIterator):
+        """Medir hasta el primer elemento: la latencia del storage, no la del consumidor"""
+        started = time.perf_counter()
+        first = True
+
+        try:
+            async for item in iterator:
+                if first:
+                    self.duration.observe(operation, value=time.perf_counter() - started)
+                    first = False
+                yield item
+        except GeneratorExit:
+            raise
+        except BaseException:
+            self.errors.inc(operation)
+            raise
+        finally:
+            if first:
+                self.duration.observe(operation, value=time.perf_counter() - started)
+
+
+class InstrumentedDocumentRepository(IDocumentRepository):
+    """Repositorio de documentos que mide cada llamada al repositorio envuelto"""
+
+    def __init__(self, repository: IDocumentRepository, registry: MetricsRegistry):
+        self.repository = repository
+        self._metrics = _CallMetrics(registry, 'document_repository', 'repositorio de documentos')
+
+    async def save(self, document: Document) -> Document:
+        return await self._metrics.call('save', self.repository.save(document))
+
+    async def save_many(self, documents: list[Document]) -> list[Document]:
+        return await self._metrics.call('save_many', self.repository.save_many(documents))
+
+    async def find_by_id(self, document_id: str) -> Optional[Document]:
+        return await self._metrics.call('find_by_id', self.repository.find_by_id(document_id))
+
+    async def find_by_ids(self, document_ids: list[str]) -> list[Document]:
+        return await self._metrics.call('find_by_ids', self.repository.find_by_ids(document_ids))
+
+    async def find_by_user_document(
+        self,
+        user_document: str,
+        limit: Optional[int] = None,
+        after: Optional[tuple[datetime, str]] = None
+    ) -> list[Document]:
+        return await self._metrics.call(
+            'find_by_user_document', self.repository.find_by_user_document(user_document, limit, after)
+        )
+
+    async def find_by_application_id(
+        self,
+        application_id: str,
+        limit: Optional[int] = None,
+        after: Optional[tuple[datetime, str]] = None
+    ) -> list[Document]:
+        return await self._metrics.call(
+            'find_by_application_id', self.repository.find_by_application_id(application_id, limit, after)
+        )
+
+    async def find_json_by_user_document(
+        self,
+        user_document: str,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        fields: Optional[list[str]] = None
+    ) -> tuple[str, Optional[tuple[datetime, str]]]:
+        return await self._metrics.call(
+            'find_json_by_user_document',
+            self.repository.find_json_by_user_document(user_document, limit, after, fields)
+        )
+
+    async def find_json_by_application_id(
+        self,
+        application_id: str,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        fields: Optional[list[str]] = None
+    ) -> tuple[str, Optional[tuple[datetime, str]]]:
+        return await self._metrics.call(
+            'find_json_by_application_id',
+            self.repository.find_json_by_application_id(application_id, limit, after, fields)
+        )
+
+    async def list_version_by_user_document(self, user_document: str) -> str:
+        return await self._metrics.call(
+            'list_version_by_user_document', self.repository.list_version_by_user_document(user_document)
+        )
+
+    async def list_version_by_application_id(self, application_id: str) -> str:
+        return await self._metrics.call(
+            'list_version_by_application_id', self.repository.list_version_by_application_id(application_id)
+        )
+
+    async def delete(self, document_id: str) -> bool:
+        return await self._metrics.call('delete', self.repository.delete(document_id))
+
+    async def delete_by_application_id(self, application_id: str) -> tuple[list[str], list[str]]:
+        return await self._metrics.call(
+            'delete_by_application_id', self.repository.delete_by_application_id(application_id)
+        )
+
+    async def exists_by_id(self, document_id: str) -> bool:
+        return await self._metrics.call('exists_by_id', self.repository.exists_by_id(document_id))
+
+    async def acquire_blob(
+        self,
+        content_hash: str,
+        file_path: str,
+        file_size: int,
+        mime_type: str
+    ) -> tuple[str, bool]:
+        return await self._metrics.call(
+            'acquire_blob', self.repository.acquire_blob(content_hash, file_path, file_size, mime_type)
+        )
+
+    async def release_blob(self, content_hash: str) -> Optional[str]:
+        return await self._metrics.call('release_blob', self.repository.release_blob(content_hash))
+
+
+class InstrumentedStorageRepository(IStorageRepository):
+    """Storage que mide cada llamada al storage envuelto"""
+
+    def __init__(self, storage: IStorageRepository, registry: MetricsRegistry):
+        self.storage = storage
+        self._metrics = _CallMetrics(registry, 'storage', 'storage')
+
+    async def upload_file(self, file_content: bytes, filename: str, content_type: str) -> str:
+        return await self._metrics.call('upload_file', self.storage.upload_file(file_content, filename, content_type))
+
+    async def upload_stream(self, chunks: AsyncIterator[bytes], filename: str, content_type: str) -> str:
+        return await self._metrics.call('upload_stream', self.storage.upload_stream(chunks, filename, content_type))
+
+    def open_range(self, file_path: str, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        return self._metrics.iterate('open_range', self.storage.open_range(file_path, start, end))
+
+    def get_local_path(self, file_path: str) -> Optional[str]:
+        return self.storage.get_local_path(file_path)
+
+    async def get_file_url(self, file_path: str, expiration: int = 3600) -> str:
+        return await self._metrics.call('get_file_url', self.storage.get_file_url(file_path, expiration))
+
+    async def delete_file(self, file_path: str) -> bool:
+        return await self._metrics.call('delete_file', self.storage.delete_file(file_path))
+
+    async def move_file(self, source_path: str, target_path: str) -> str:
+        return await self._metrics.call('move_file', self.storage.move_file(source_path, target_path))
+
+    async def copy_file(self, source_path: str, target_path: str) -> str:
+        return await self._metrics.call('copy_file', self.storage.copy_file(source_path, target_path))
+
+    async def generate_upload_url(
+        self,
+        file_path: str,
+        content_type: str,
+        file_size: int,
+        sha256: str,
+        expiration: int = 900
+    ) -> PresignedUpload:
+        return await self._metrics.call(
+            'generate_upload_url',
+            self.storage.generate_upload_url(file_path, content_type, file_size, sha256, expiration)
+        )
+
+    async def stat_file(self, file_path: str) -> Optional[FileMetadata]:
+        return await self._metrics.call('stat_file', self.storage.stat_file(file_path))
+
+    async def file_exists(self, file_path: str) -> bool:
+        return await self._metrics.call('file_exists', self.storage.file_exists(file_path))
+
+    def list_files(self, prefix: str = "", start_after: Optional[str] = None) -> AsyncIterator[StoredFile]:
+        return self._metrics.iterate('list_files', self.storage.list_files(prefix, start_after))
@@ -0,0 +1,222 @@
+"""
+Métricas en memoria con exposición en el formato de texto de Prometheus
+"""
+import math
+from bisect import bisect_left
+from typing import Callable, Iterable, Optional
+
+
+# Segundos: desde consultas cacheadas (~1 ms) hasta subidas lentas
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Bytes: de 1 KB al máximo de 10 MB de un documento
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 2097152, 4194304, 10485760)
+
+Sample = tuple[str, dict, float]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base de las métricas: nombre, ayuda y una serie por combinación de labels"""
+
+    TYPE = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._series: dict[tuple, object] = {}
+
+    def _key(self, labels: tuple) -> tuple:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} espera los labels {self.labelnames}")
+        return labels
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"]
+        lines.extend(self._render_series())
+        return lines
+
+    def _render_series(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in self._series.items()
+        ]
+
+
+class Counter(_Metric):
+    """Contador monótono"""
+
+    TYPE = 'counter'
+
+    def inc(self, *labels, amount: float = 1.0) -> None:
+        key = self._key(labels)
+        self._series[key] = self._series.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """Valor que sube y baja"""
+
+    TYPE = 'gauge'
+
+    def set(self, *labels, value: float) -> None:
+        self._series[self._key(labels)] = value
+
+    def inc(self, *labels, amount: float = 1.0) -> None:
+        key = self._key(labels)
+        self._series[key] = self._series.get(key, 0.0) + amount
+
+    def dec(self, *labels, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    """
+    Histograma con buckets fijos
+
+    Cada serie guarda un contador por bucket (no acumulado), la suma y el
+    total; observar un valor es una búsqueda binaria y dos sumas. Los
+    acumulados que exige Prometheus se calculan al exponer.
+    """
+
+    TYPE = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, *labels, value: float) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+
+        if series is None:
+            # [contadores por bucket (+Inf al final), suma]
+            series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def _render_series(self) -> list[str]:
+        lines = []
+        bounds = self.buckets + (math.inf,)
+
+        for labels, (counts, total) in self._series.items():
+            cumulative = 0
+
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Registro de métricas del proceso
+
+    Las métricas se actualizan desde el event loop, sin locks: no es
+    thread-safe. Los valores que ya llevan otros componentes (pool de
+    conexiones, cachés, worker) se leen con collectors al exponer, en
+    lugar de duplicarlos en cada operación.
+    """
+
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[tuple[str, str, str, Callable[[], Iterable[Sample]]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], Iterable[Sample]],
+        metric_type: str = 'gauge'
+    ) -> None:
+        """
+        Registrar una métrica calculada al exponer
+
+        Args:
+            name: Nombre de la métrica
+            documentation: Texto de ayuda
+            collect: Devuelve tuplas (sufijo, labels, valor); el sufijo se
+                añade al nombre ('' para la métrica en sí)
+            metric_type: gauge o counter
+        """
+        self._collectors.append((name, documentation, metric_type, collect))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Todas las métricas en el formato de texto de Prometheus"""
+        lines = []
+
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+
+        for name, documentation, metric_type, collect in self._collectors:
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {metric_type}")
+
+            for suffix, labels, value in collect():
+                names = tuple(labels)
+                values = tuple(labels.values())
+                lines.append(f"{name}{suffix}{_format_labels(names, values)} {_format_value(value)}")
+
+        return '\n'.join(lines) + '\n'
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+
+        if existing is not None:
+            if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                raise ValueError(f"La métrica {metric.name} ya existe con otra definición")
+            return existing
+
+        self._metrics[metric.name] = metric
+        return metric
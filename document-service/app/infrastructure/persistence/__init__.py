@@ -2,5 +2,14 @@
 Infrastructure Persistence Layer
 """
 from .postgres_document_repository import PostgresDocumentRepository
+from .cached_document_repository import CachedDocumentRepository
+from .postgres_upload_session_repository import PostgresUploadSessionRepository
+from .db_pool import InstrumentedPool, create_instrumented_pool
 
-__all__ = ['PostgresDocumentRepository']
+__all__ = [
+    'PostgresDocumentRepository',
+    'CachedDocumentRepository',
+    'PostgresUploadSessionRepository',
+    'InstrumentedPool',
+    'create_instrumented_pool'
+]
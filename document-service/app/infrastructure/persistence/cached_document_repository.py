@@ -0,0 +1,209 @@
+"""
+Decorador con caché de lectura para el repositorio de documentos
+"""
+from datetime import datetime
+from typing import Optional
+from ...domain.entities.document import Document
+from ...domain.repositories.document_repository import IDocumentRepository
+from ..cache.ttl_cache import TTLCache
+
+
+class CachedDocumentRepository(IDocumentRepository):
+    """
+    Repositorio de documentos con caché read-through sobre otro repositorio
+    
+    Los documentos encontrados se guardan en una LRU con TTL y los IDs
+    inexistentes en una caché negativa de vida corta, para que ráfagas de
+    404 no lleguen a PostgreSQL. `save` y `delete` invalidan las entradas.
+    """
+    
+    def __init__(
+        self,
+        repository: IDocumentRepository,
+        max_size: int = 10000,
+        ttl: float = 60.0,
+        negative_ttl: float = 5.0
+    ):
+        self.repository = repository
+        self._documents = TTLCache(max_size=max_size, ttl=ttl)
+        self._missing = TTLCache(max_size=max_size, ttl=negative_ttl)
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+    
+    async def save(self, document: Document) -> Document:
+        """Guardar y cachear el documento"""
+        saved = await self.repository.save(document)
+        self._missing.delete(saved.id)
+        self._documents.set(saved.id, saved)
+        return saved
+    
+    async def save_many(self, documents: list[Document]) -> list[Document]:
+        """Guardar y cachear varios documentos"""
+        saved = await self.repository.save_many(documents)
+        
+        for document in saved:
+            self._missing.delete(document.id)
+            self._documents.set(document.id, document)
+        
+        return saved
+    
+    async def find_by_id(self, document_id: str) -> Optional[Document]:
+        """Buscar por ID consultando primero la caché"""
+        document = self._lookup(document_id)
+        
+        if document is not None or self._is_missing(document_id):
+            return document
+        
+        self.misses += 1
+        document = await self.repository.find_by_id(document_id)
+        self._remember(document_id, document)
+        return document
+    
+    async def find_by_ids(self, document_ids: list[str]) -> list[Document]:
+        """Buscar varios IDs consultando solo los que no están en caché"""
+        documents = []
+        pending_ids = []
+        
+        for document_id in document_ids:
+            document = self._lookup(document_id)
+            
+            if document is not None:
+                documents.append(document)
+            elif not self._is_missing(document_id):
+                pending_ids.append(document_id)
+        
+        if pending_ids:
+            self.misses += len(pending_ids)
+            found = await self.repository.find_by_ids(pending_ids)
+            
+            for document in found:
+                self._documents.set(document.id, document)
+            
+            documents.extend(found)
+        
+        return documents
+    
+    async def find_by_user_document(
+        self,
+        user_document: str,
+        limit: Optional[int] = None,
+        after: Optional[tuple[datetime, str]] = None
+    ) -> list[Document]:
+        """Listar documentos de un usuario (sin caché) y cachear cada uno"""
+        return self._warm(await self.repository.find_by_user_document(user_document, limit, after))
+    
+    async def find_by_application_id(
+        self,
+        application_id: str,
+        limit: Optional[int] = None,
+        after: Optional[tuple[datetime, str]] = None
+    ) -> list[Document]:
+        """Listar documentos de una postulación (sin caché) y cachear cada uno"""
+        return self._warm(await self.repository.find_by_application_id(application_id, limit, after))
+    
+    async def find_json_by_user_document(
+        self,
+        user_document: str,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        fields: Optional[list[str]] = None
+    ) -> tuple[str, Optional[tuple[datetime, str]]]:
+        """Delegar el listado JSON de un usuario (sin caché)"""
+        return await self.repository.find_json_by_user_document(user_document, limit, after, fields)
+    
+    async def find_json_by_application_id(
+        self,
+        application_id: str,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        fields: Optional[list[str]] = None
+    ) -> tuple[str, Optional[tuple[datetime, str]]]:
+        """Delegar el listado JSON de una postulación (sin caché)"""
+        return await self.repository.find_json_by_application_id(application_id, limit, after, fields)
+    
+    async def list_version_by_user_document(self, user_document: str) -> str:
+        """Delegar el validador del listado de un usuario (sin caché)"""
+        return await self.repository.list_version_by_user_document(user_document)
+    
+    async def list_version_by_application_id(self, application_id: str) -> str:
+        """Delegar el validador del listado de una postulación (sin caché)"""
+        return await self.repository.list_version_by_application_id(application_id)
+    
+    async def delete(self, document_id: str) -> bool:
+        """Eliminar e invalidar la entrada en caché"""
+        deleted = await self.repository.delete(document_id)
+        self._documents.delete(document_id)
+        self._missing.set(document_id, True)
+        return deleted
+    
+    async def delete_by_application_id(self, application_id: str) -> tuple[list[str], list[str]]:
+        """Eliminar e invalidar todos los documentos de la postulación"""
+        deleted_ids, orphan_paths = await self.repository.delete_by_application_id(application_id)
+        
+        for document_id in deleted_ids:
+            self._documents.delete(document_id)
+            self._missing.set(document_id, True)
+        
+        return deleted_ids, orphan_paths
+    
+    async def exists_by_id(self, document_id: str) -> bool:
+        """Verificar existencia consultando primero la caché"""
+        if self._lookup(document_id) is not None:
+            return True
+        
+        if self._is_missing(document_id):
+            return False
+        
+        self.misses += 1
+        return await self.repository.exists_by_id(document_id)
+    
+    async def acquire_blob(
+        self,
+        content_hash: str,
+        file_path: str,
+        file_size: int,
+        mime_type: str
+    ) -> tuple[str, bool]:
+        """Delegar el registro del blob"""
+        return await self.repository.acquire_blob(content_hash, file_path, file_size, mime_type)
+    
+    async def release_blob(self, content_hash: str) -> Optional[str]:
+        """Delegar la liberación del blob"""
+        return await self.repository.release_blob(content_hash)
+    
+    def stats(self) -> dict:
+        """Contadores de aciertos y fallos de la caché"""
+        return {
+            'hits': self.hits,
+            'negative_hits': self.negative_hits,
+            'misses': self.misses,
+            'size': len(self._documents),
+            'negative_size': len(self._missing)
+        }
+    
+    def _lookup(self, document_id: str) -> Optional[Document]:
+        document = self._documents.get(document_id)
+        
+        if document is not None:
+            self.hits += 1
+        
+        return document
+    
+    def _is_missing(self, document_id: str) -> bool:
+        if self._missing.get(document_id) is None:
+            return False
+        
+        self.negative_hits += 1
+        return True
+    
+    def _remember(self, document_id: str, document: Optional[Document]) -> None:
+        if document is None:
+            self._missing.set(document_id, True)
+        else:
+            self._documents.set(document_id, document)
+    
+    def _warm(self, documents: list[Document]) -> list[Document]:
+        for document in documents:
+            self._documents.set(document.id, document)
+        return documents
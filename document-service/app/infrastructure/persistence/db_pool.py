@@ -0,0 +1,113 @@
+"""
+Pool de conexiones PostgreSQL instrumentado
+"""
+import asyncpg
+import time
+from typing import Awaitable, Callable, Optional
+
+
+class _AcquireContext:
+    """Context manager de `InstrumentedPool.acquire` que mide la espera"""
+
+    def __init__(self, pool: 'InstrumentedPool', timeout: Optional[float]):
+        self._pool = pool
+        self._timeout = timeout
+        self._conn = None
+
+    async def __aenter__(self):
+        self._conn = await self._pool._acquire(self._timeout)
+        return self._conn
+
+    async def __aexit__(self, *exc):
+        conn, self._conn = self._conn, None
+        await self._pool._release(conn)
+
+
+class InstrumentedPool:
+    """
+    Envoltorio de asyncpg.Pool que registra cuánto esperan las peticiones
+    por una conexión y cuántas conexiones hay en uso u ociosas
+    """
+
+    def __init__(self, pool: asyncpg.Pool):
+        self._pool = pool
+        self.acquire_count = 0
+        self.acquire_wait_total = 0.0
+        self.acquire_wait_max = 0.0
+        self.waiting = 0
+
+    def acquire(self, *, timeout: Optional[float] = None) -> _AcquireContext:
+        """Obtener una conexión (`async with pool.acquire() as conn`)"""
+        return _AcquireContext(self, timeout)
+
+    async def _acquire(self, timeout: Optional[float]):
+        started = time.perf_counter()
+        self.waiting += 1
+
+        try:
+            conn = await self._pool.acquire(timeout=timeout)
+        finally:
+            self.waiting -= 1
+
+        wait = time.perf_counter() - started
+        self.acquire_count += 1
+        self.acquire_wait_total += wait
+        self.acquire_wait_max = max(self.acquire_wait_max, wait)
+        return conn
+
+    async def _release(self, conn) -> None:
+        await self._pool.release(conn)
+
+    async def close(self) -> None:
+        """Cerrar el pool subyacente"""
+        await self._pool.close()
+
+    def stats(self) -> dict:
+        """
+        Métricas actuales del pool
+
+        Returns:
+            dict: Tamaño, conexiones en uso/ociosas, peticiones esperando y
+                tiempos de espera acumulados para `acquire`
+        """
+        size = self._pool.get_size()
+        idle = self._pool.get_idle_size()
+
+        return {
+            'min_size': self._pool.get_min_size(),
+            'max_size': self._pool.get_max_size(),
+            'size': size,
+            'in_use': size - idle,
+            'idle': idle,
+            'waiting': self.waiting,
+            'acquire_count': self.acquire_count,
+            'acquire_wait_avg_ms': (
+                self.acquire_wait_total / self.acquire_count * 1000 if self.acquire_count else 0.0
+            ),
+            'acquire_wait_max_ms': self.acquire_wait_max * 1000,
+        }
+
+    def __getattr__(self, name):
+        # El resto de la API (fetch, execute, get_size...) pasa al pool real
+        return getattr(self._pool, name)
+
+
+async def create_instrumented_pool(
+    dsn: Optional[str] = None,
+    *,
+    init: Optional[Callable[[asyncpg.Connection], Awaitable[None]]] = None,
+    **kwargs
+) -> InstrumentedPool:
+    """
+    Crear un pool de asyncpg instrumentado
+
+    Args:
+        dsn: Cadena de conexión opcional
+        init: Hook que se ejecuta al abrir cada conexión (p. ej. preparar sentencias)
+        **kwargs: Resto de argumentos de `asyncpg.create_pool`
+
+    Returns:
+        InstrumentedPool: Pool listo para usar
+    """
+    pool = await asyncpg.create_pool(dsn, init=init, **kwargs)
+    return InstrumentedPool(pool)
@@ -4,30 +4,251 @@ Implementación PostgreSQL del repositorio de documentos
 import asyncpg
 from typing import Optional
 from datetime import datetime
-from ...domain.entities.document import Document
+from ...domain.entities.document import Document, DOCUMENT_FIELDS
 from ...domain.repositories.document_repository import IDocumentRepository
 
 
-class PostgresDocumentRepository(IDocumentRepository):
-    """Repositorio de documentos usando PostgreSQL"""
+def _page_query(column: str, with_cursor: bool) -> str:
+    """
+    Consulta keyset sobre (uploaded_at, id) usando el índice compuesto
+    (column, uploaded_at DESC, id DESC). Un LIMIT NULL devuelve todas las filas
+    """
+    cursor = "AND (uploaded_at, id) < ($3, $4::uuid)" if with_cursor else ""
     
-    def __init__(self, db_pool: asyncpg.Pool):
-        self.db_pool = db_pool
+    return f"""
+        SELECT * FROM documents
+        WHERE {column} = $1 {cursor}
+        ORDER BY uploaded_at DESC, id DESC
+        LIMIT $2
+    """
+
+
+def _page_json_query(column: str, with_cursor: bool, partial: bool = False) -> str:
+    """
+    Misma consulta keyset que `_page_query`, pero PostgreSQL construye
+    el JSON de la respuesta con una proyección explícita de columnas.
+    Se lee una fila de más ($2 = limit + 1) para saber si existe otra página
+
+    Con `partial` los campos llegan como último parámetro (text[]) y cada
+    objeto conserva solo esas claves, en el orden pedido: el texto de la
+    sentencia no depende de los campos que elija el cliente
+
+    Cada objeto lleva `"url": null`, igual que `DocumentResponse` en los
+    listados que pasan por las entidades
+    """
+    cursor = "AND (uploaded_at, id) < ($3, $4::uuid)" if with_cursor else ""
+    projection = ', '.join([*(f"page.{field}" for field in DOCUMENT_FIELDS), 'NULL::text AS url'])
+    item = f"(SELECT item FROM (SELECT {projection}) item)"
+
+    if partial:
+        fields = '$5::text[]' if with_cursor else '$3::text[]'
+        item = f"""(
+            SELECT json_object_agg(field.key, field.value ORDER BY array_position({fields}, field.key))
+            FROM json_each(row_to_json({item})) field
+            WHERE field.key = ANY({fields})
+        )"""
     
-    async def save(self, document: Document) -> Document:
-        """Guardar documento en la base de datos"""
-        query = """
+    return f"""
+        WITH page AS (
+            SELECT *, row_number() OVER (ORDER BY uploaded_at DESC, id DESC) AS rn
+            FROM documents
+            WHERE {column} = $1 {cursor}
+            ORDER BY uploaded_at DESC, id DESC
+            LIMIT $2
+        )
+        SELECT
+            COALESCE(
+                json_agg({item} ORDER BY rn) FILTER (WHERE rn < $2),
+                '[]'::json
+            ) AS items,
+            max(uploaded_at) FILTER (WHERE rn = $2 - 1) AS last_uploaded_at,
+            max(id::text) FILTER (WHERE rn = $2 - 1) AS last_id,
+            count(*) AS fetched
+        FROM page
+    """
+
+
+def _delete_query(condition: str) -> str:
+    """
+    Borrado de documentos en una sola sentencia: elimina las filas, descuenta
+    las referencias de cada blob agrupadas por hash y encola en
+    `storage_deletions` los archivos que quedaron sin referencias. Los blobs
+    en cero se conservan hasta que el worker de limpieza borra el archivo.
+    También sube la versión de borrado de los listados afectados
+    """
+    return f"""
+        WITH deleted AS (
+            DELETE FROM documents WHERE {condition}
+            RETURNING id, user_document, application_id, file_path, content_hash
+        ),
+        released AS (
+            UPDATE document_blobs AS blob
+            SET ref_count = blob.ref_count - refs.count
+            FROM (
+                SELECT content_hash, count(*) AS count
+                FROM deleted
+                WHERE content_hash IS NOT NULL
+                GROUP BY content_hash
+            ) AS refs
+            WHERE blob.content_hash = refs.content_hash
+            RETURNING blob.content_hash, blob.file_path, blob.ref_count
+        ),
+        queued AS (
+            INSERT INTO storage_deletions (file_path, content_hash)
+            SELECT file_path, content_hash FROM released WHERE ref_count <= 0
+            UNION ALL
+            SELECT file_path, NULL FROM deleted WHERE content_hash IS NULL
+            RETURNING file_path
+        ),
+        versioned AS (
+            INSERT INTO document_list_versions (scope, scope_key, version)
+            SELECT 'user_document', user_document, 1 FROM deleted
+            UNION
+            SELECT 'application_id', application_id::text, 1 FROM deleted
+            ON CONFLICT (scope, scope_key)
+            DO UPDATE SET version = document_list_versions.version + 1
+        )
+        SELECT
+            (SELECT COALESCE(array_agg(id::text), '{{}}') FROM deleted) AS deleted_ids,
+            (SELECT COALESCE(array_agg(file_path), '{{}}') FROM queued) AS queued_paths
+    """
+
+
+def _list_version_query(column: str) -> str:
+    """
+    Validador de un listado: conteo y último uploaded_at salen del índice
+    compuesto (column, uploaded_at DESC, id DESC) con un index-only scan,
+    y la versión de borrado de `document_list_versions` por clave primaria.
+    El conteo no basta por sí solo: un borrado seguido de una subida con
+    fecha anterior lo dejaría igual
+    """
+    return f"""
+        SELECT
+            count(*) AS count,
+            max(uploaded_at) AS last_uploaded_at,
+            COALESCE((
+                SELECT version FROM document_list_versions
+                WHERE scope = '{column}' AND scope_key = $2
+            ), 0) AS version
+        FROM documents
+        WHERE {column} = $1
+    """
+
+
+def _build_statements() -> dict[str, str]:
+    """Registro de las sentencias fijas del repositorio, por nombre"""
+    statements = {
+        # La ruta se toma del blob bloqueado: si la migración de layout lo
+        # movió después de acquire_blob, el documento apunta a la nueva
+        'save': """
             INSERT INTO documents (
                 id, user_document, application_id, filename, original_filename, 
                 file_path, file_size, mime_type, document_type,
-                uploaded_at, uploaded_by
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+                uploaded_at, uploaded_by, content_hash
+            ) VALUES (
+                $1, $2, $3, $4, $5,
+                COALESCE((SELECT file_path FROM document_blobs WHERE content_hash = $12 FOR SHARE), $6),
+                $7, $8, $9, $10, $11, $12
+            )
             RETURNING *
+        """,
+        # Mismo INSERT que `save` para N filas en una sola sentencia (un solo
+        # viaje y atomicidad sin transacción explícita); RETURNING devuelve
+        # los valores guardados, incluida la ruta tomada del blob
+        'save_many': """
+            INSERT INTO documents (
+                id, user_document, application_id, filename, original_filename,
+                file_path, file_size, mime_type, document_type,
+                uploaded_at, uploaded_by, content_hash
+            )
+            SELECT
+                d.id, d.user_document, d.application_id, d.filename, d.original_filename,
+                COALESCE((SELECT file_path FROM document_blobs WHERE content_hash = d.content_hash FOR SHARE), d.file_path),
+                d.file_size, d.mime_type, d.document_type, d.uploaded_at, d.uploaded_by, d.content_hash
+            FROM unnest(
+                $1::uuid[], $2::text[], $3::uuid[], $4::text[], $5::text[], $6::text[],
+                $7::int[], $8::text[], $9::text[], $10::timestamp[], $11::uuid[], $12::text[]
+            ) AS d(
+                id, user_document, application_id, filename, original_filename, file_path,
+                file_size, mime_type, document_type, uploaded_at, uploaded_by, content_hash
+            )
+            RETURNING *
+        """,
+        'find_by_id': "SELECT * FROM documents WHERE id = $1",
+        'find_by_ids': "SELECT * FROM documents WHERE id = ANY($1::uuid[])",
+        'delete': _delete_query("id = $1"),
+        'delete_by_application_id': _delete_query("application_id = $1"),
+        'exists_by_id': "SELECT EXISTS(SELECT 1 FROM documents WHERE id = $1)",
+        # xmax = 0 solo en filas recién insertadas (no en las actualizadas)
+        'acquire_blob': """
+            INSERT INTO document_blobs (content_hash, file_path, file_size, mime_type, ref_count)
+            VALUES ($1, $2, $3, $4, 1)
+            ON CONFLICT (content_hash)
+            DO UPDATE SET ref_count = document_blobs.ref_count + 1
+            RETURNING file_path, (xmax = 0) AS created
+        """,
+        # El blob en cero se conserva y el archivo pasa a la outbox: el worker
+        # lo borra con la fila del blob bloqueada, así una subida concurrente
+        # del mismo contenido nunca pierde su archivo
+        'release_blob': """
+            WITH released AS (
+                UPDATE document_blobs SET ref_count = ref_count - 1
+                WHERE content_hash = $1
+                RETURNING content_hash, file_path, ref_count
+            )
+            INSERT INTO storage_deletions (file_path, content_hash)
+            SELECT file_path, content_hash FROM released WHERE ref_count <= 0
+            RETURNING file_path
+        """,
+    }
+    
+    for column in ('user_document', 'application_id'):
+        statements[f'page_by_{column}'] = _page_query(column, False)
+        statements[f'page_by_{column}_after'] = _page_query(column, True)
+        statements[f'json_page_by_{column}'] = _page_json_query(column, False)
+        statements[f'json_page_by_{column}_after'] = _page_json_query(column, True)
+        statements[f'json_fields_page_by_{column}'] = _page_json_query(column, False, partial=True)
+        statements[f'json_fields_page_by_{column}_after'] = _page_json_query(column, True, partial=True)
+        statements[f'list_version_by_{column}'] = _list_version_query(column)
+    
+    return statements
+
+
+class PostgresDocumentRepository(IDocumentRepository):
+    """Repositorio de documentos usando PostgreSQL"""
+    
+    # Todas las sentencias del repositorio: la caché implícita de cada
+    # conexión se dimensiona para ellas y el hook `init` puede comprobarlas
+    STATEMENTS = _build_statements()
+    
+    def __init__(self, db_pool: asyncpg.Pool):
+        self.db_pool = db_pool
+    
+    @classmethod
+    async def prepare_statements(cls, conn: asyncpg.Connection) -> None:
         """
+        Comprobar todas las sentencias del repositorio en una conexión nueva
         
+        Cada sentencia pasa por el parser y el planificador del servidor con
+        `Connection.prepare`, así que un error de SQL o un esquema sin migrar
+        hace fallar la apertura de la conexión en lugar de la primera
+        petición que la usa. Es solo una comprobación de arranque:
+        `prepare` no llena la caché implícita de asyncpg, de modo que cada
+        consulta se vuelve a preparar en su primer uso y abrir una conexión
+        cuesta un round trip más por sentencia. Por eso está desactivada
+        por defecto (`DB_PREPARE_STATEMENTS`).
+        
+        Args:
+            conn: Conexión recién abierta por el pool (hook `init`)
+        """
+        for query in cls.STATEMENTS.values():
+            await conn.prepare(query)
+    
+    async def save(self, document: Document) -> Document:
+        """Guardar documento en la base de datos"""
         async with self.db_pool.acquire() as conn:
             row = await conn.fetchrow(
-                query,
+                self.STATEMENTS['save'],
                 document.id,
                 document.user_document,
                 document.application_id,
@@ -38,68 +259,212 @@ class PostgresDocumentRepository(IDocumentRepository):
                 document.mime_type,
                 document.document_type,
                 document.uploaded_at,
-                document.uploaded_by
+                document.uploaded_by,
+                document.content_hash
             )
             
             return self._row_to_document(row)
     
+    async def save_many(self, documents: list[Document]) -> list[Document]:
+        """Guardar varios documentos en una sola sentencia, en el orden recibido"""
+        if not documents:
+            return []
+        
+        async with self.db_pool.acquire() as conn:
+            rows = await conn.fetch(
+                self.STATEMENTS['save_many'],
+                [document.id for document in documents],
+                [document.user_document for document in documents],
+                [document.application_id for document in documents],
+                [document.filename for document in documents],
+                [document.original_filename for document in documents],
+                [document.file_path for document in documents],
+                [document.file_size for document in documents],
+                [document.mime_type for document in documents],
+                [document.document_type for document in documents],
+                [document.uploaded_at for document in documents],
+                [document.uploaded_by for document in documents],
+                [document.content_hash for document in documents]
+            )
+        
+        saved = {str(row['id']): self._row_to_document(row) for row in rows}
+        return [saved[document.id] for document in documents]
+    
     async def find_by_id(self, document_id: str) -> Optional[Document]:
         """Buscar documento por ID"""
-        query = "SELECT * FROM documents WHERE id = $1"
-        
         async with self.db_pool.acquire() as conn:
-            row = await conn.fetchrow(query, document_id)
+            row = await conn.fetchrow(self.STATEMENTS['find_by_id'], document_id)
             
             if row is None:
                 return None
             
             return self._row_to_document(row)
     
-    async def find_by_user_document(self, user_document: str) -> list[Document]:
-        """Buscar todos los documentos de un usuario"""
-        query = """
-            SELECT * FROM documents 
-            WHERE user_document = $1 
-            ORDER BY uploaded_at DESC
-        """
+    async def find_by_ids(self, document_ids: list[str]) -> list[Document]:
+        """Buscar varios documentos por ID"""
+        if not document_ids:
+            return []
         
         async with self.db_pool.acquire() as conn:
-            rows = await conn.fetch(query, user_document)
+            rows = await conn.fetch(self.STATEMENTS['find_by_ids'], document_ids)
             
             return [self._row_to_document(row) for row in rows]
     
-    async def find_by_application_id(self, application_id: str) -> list[Document]:
-        """Buscar todos los documentos de una postulación"""
-        query = """
-            SELECT * FROM documents 
-            WHERE application_id = $1 
-            ORDER BY uploaded_at DESC
-        """
-        
+    async def find_by_user_document(
+        self,
+        user_document: str,
+        limit: Optional[int] = None,
+        after: Optional[tuple[datetime, str]] = None
+    ) -> list[Document]:
+        """Buscar documentos de un usuario"""
+        return await self._find_page('user_document', user_document, limit, after)
+    
+    async def find_by_application_id(
+        self,
+        application_id: str,
+        limit: Optional[int] = None,
+        after: Optional[tuple[datetime, str]] = None
+    ) -> list[Document]:
+        """Buscar documentos de una postulación"""
+        return await self._find_page('application_id', application_id, limit, after)
+    
+    async def find_json_by_user_document(
+        self,
+        user_document: str,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        fields: Optional[list[str]] = None
+    ) -> tuple[str, Optional[tuple[datetime, str]]]:
+        """Página de documentos de un usuario renderizada con json_agg"""
+        return await self._find_page_json('user_document', user_document, limit, after, fields)
+    
+    async def find_json_by_application_id(
+        self,
+        application_id: str,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        fields: Optional[list[str]] = None
+    ) -> tuple[str, Optional[tuple[datetime, str]]]:
+        """Página de documentos de una postulación renderizada con json_agg"""
+        return await self._find_page_json('application_id', application_id, limit, after, fields)
+    
+    async def list_version_by_user_document(self, user_document: str) -> str:
+        """Validador del listado de un usuario"""
+        return await self._list_version('user_document', user_document)
+    
+    async def list_version_by_application_id(self, application_id: str) -> str:
+        """Validador del listado de una postulación"""
+        return await self._list_version('application_id', application_id)
+    
+    async def delete(self, document_id: str) -> bool:
+        """Eliminar documento y encolar su archivo si queda sin referencias"""
         async with self.db_pool.acquire() as conn:
-            rows = await conn.fetch(query, application_id)
+            row = await conn.fetchrow(self.STATEMENTS['delete'], document_id)
             
-            return [self._row_to_document(row) for row in rows]
+            return len(row['deleted_ids']) > 0
     
-    async def delete(self, document_id: str) -> bool:
-        """Eliminar documento de la base de datos"""
-        query = "DELETE FROM documents WHERE id = $1"
-        
+    async def delete_by_application_id(self, application_id: str) -> tuple[list[str], list[str]]:
+        """Eliminar los documentos de una postulación en una sola sentencia"""
         async with self.db_pool.acquire() as conn:
-            result = await conn.execute(query, document_id)
+            row = await conn.fetchrow(self.STATEMENTS['delete_by_application_id'], application_id)
             
-            # result será "DELETE 1" si se eliminó un registro
-            return result == "DELETE 1"
+            return list(row['deleted_ids']), list(row['queued_paths'])
     
     async def exists_by_id(self, document_id: str) -> bool:
         """Verificar si existe un documento"""
-        query = "SELECT EXISTS(SELECT 1 FROM documents WHERE id = $1)"
-        
         async with self.db_pool.acquire() as conn:
-            exists = await conn.fetchval(query, document_id)
+            exists = await conn.fetchval(self.STATEMENTS['exists_by_id'], document_id)
             
             return exists
     
+    async def acquire_blob(
+        self,
+        content_hash: str,
+        file_path: str,
+        file_size: int,
+        mime_type: str
+    ) -> tuple[str, bool]:
+        """Crear el blob o sumar una referencia si ya existe"""
+        async with self.db_pool.acquire() as conn:
+            row = await conn.fetchrow(
+                self.STATEMENTS['acquire_blob'], content_hash, file_path, file_size, mime_type
+            )
+            
+            return row['file_path'], row['created']
+    
+    async def release_blob(self, content_hash: str) -> Optional[str]:
+        """Restar una referencia y encolar el archivo si llega a cero"""
+        async with self.db_pool.acquire() as conn:
+            return await conn.fetchval(self.STATEMENTS['release_blob'], content_hash)
+    
+    async def _find_page(
+        self,
+        column: str,
+        value: str,
+        limit: Optional[int],
+        after: Optional[tuple[datetime, str]]
+    ) -> list[Document]:
+        """Página keyset de documentos filtrada por `column`"""
+        name = f'page_by_{column}'
+        params = [value, limit]
+        
+        if after is not None:
+            name += '_after'
+            params.extend(after)
+        
+        async with self.db_pool.acquire() as conn:
+            rows = await conn.fetch(self.STATEMENTS[name], *params)
+            
+            return [self._row_to_document(row) for row in rows]
+    
+    async def _list_version(self, column: str, value: str) -> str:
+        """Conteo, último uploaded_at y versión de borrado, como texto opaco"""
+        async with self.db_pool.acquire() as conn:
+            row = await conn.fetchrow(self.STATEMENTS[f'list_version_by_{column}'], value, value)
+            
+            last_uploaded_at = row['last_uploaded_at']
+            timestamp = last_uploaded_at.strftime('%Y%m%d%H%M%S%f') if last_uploaded_at else '0'
+            
+            return f"{row['count']}-{timestamp}-{row['version']}"
+    
+    async def _find_page_json(
+        self,
+        column: str,
+        value: str,
+        limit: int,
+        after: Optional[tuple[datetime, str]],
+        fields: Optional[list[str]]
+    ) -> tuple[str, Optional[tuple[datetime, str]]]:
+        """Página keyset renderizada como JSON por PostgreSQL"""
+        fields = fields or DOCUMENT_FIELDS
+        unknown = set(fields) - set(DOCUMENT_FIELDS)
+        
+        if unknown:
+            raise ValueError(f"Campos no válidos: {', '.join(sorted(unknown))}")
+        
+        params = [value, limit + 1]
+        
+        if after is not None:
+            params.extend(after)
+        
+        name = f'json_page_by_{column}'
+        
+        if list(fields) != DOCUMENT_FIELDS:
+            # Una sola sentencia para cualquier selección de campos
+            name = f'json_fields_page_by_{column}'
+            params.append(list(dict.fromkeys([*fields, 'url'])))
+        
+        if after is not None:
+            name += '_after'
+        
+        async with self.db_pool.acquire() as conn:
+            row = await conn.fetchrow(self.STATEMENTS[name], *params)
+        
+        if row['fetched'] <= limit:
+            return row['items'], None
+        
+        return row['items'], (row['last_uploaded_at'], row['last_id'])
+    
     def _row_to_document(self, row) -> Document:
         """Convertir fila de base de datos a entidad Document"""
         return Document(
@@ -113,5 +478,6 @@ class PostgresDocumentRepository(IDocumentRepository):
             mime_type=row['mime_type'],
             document_type=row['document_type'],
             uploaded_at=row['uploaded_at'],
-            uploaded_by=str(row['uploaded_by']) if row['uploaded_by'] else None
+            uploaded_by=str(row['uploaded_by']) if row['uploaded_by'] else None,
+            content_hash=row['content_hash']
         )
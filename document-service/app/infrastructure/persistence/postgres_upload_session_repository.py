@@ -0,0 +1,193 @@
+"""
+Implementación PostgreSQL del repositorio de sesiones de subida
+"""
+import asyncpg
+from typing import Optional
+from ...domain.entities.upload_session import UploadSession
+from ...domain.repositories.upload_session_repository import IUploadSessionRepository, UploadPart
+
+
+def _delete_sessions_query(selection: str) -> str:
+    """
+    Eliminar sesiones y sus chunks en una sola sentencia, encolando los
+    archivos en `storage_deletions` para el worker de limpieza
+    """
+    return f"""
+        WITH sessions AS (
+            {selection}
+        ),
+        parts AS (
+            DELETE FROM upload_session_parts
+            WHERE session_id IN (SELECT id FROM sessions)
+            RETURNING file_path
+        ),
+        deleted AS (
+            DELETE FROM upload_sessions
+            WHERE id IN (SELECT id FROM sessions)
+            RETURNING id
+        ),
+        queued AS (
+            INSERT INTO storage_deletions (file_path)
+            SELECT file_path FROM parts
+            RETURNING file_path
+        )
+        SELECT
+            (SELECT count(*) FROM deleted) AS deleted,
+            (SELECT COALESCE(array_agg(file_path), '{{}}') FROM queued) AS queued_paths
+    """
+
+
+class PostgresUploadSessionRepository(IUploadSessionRepository):
+    """Repositorio de sesiones de subida usando PostgreSQL"""
+    
+    # El archivo de una subida directa se registra como chunk único
+    CREATE_QUERY = """
+        WITH session AS (
+            INSERT INTO upload_sessions (
+                id, user_document, application_id, document_type, filename,
+                mime_type, file_size, uploaded_by, content_hash, expires_at
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, CURRENT_TIMESTAMP + make_interval(secs => $10))
+            RETURNING *
+        ),
+        staged AS (
+            INSERT INTO upload_session_parts (session_id, part_offset, size, file_path)
+            SELECT id, 0, file_size, $11 FROM session
+            WHERE $11::varchar IS NOT NULL
+        )
+        SELECT * FROM session
+    """
+    
+    FIND_QUERY = "SELECT * FROM upload_sessions WHERE id = $1 AND expires_at > CURRENT_TIMESTAMP"
+    
+    # El offset avanza solo si nadie más escribió en él (compare-and-set)
+    ADD_PART_QUERY = """
+        WITH advanced AS (
+            UPDATE upload_sessions SET received_size = received_size + $3
+            WHERE id = $1
+              AND received_size = $2
+              AND status = 'open'
+              AND expires_at > CURRENT_TIMESTAMP
+              AND received_size + $3 <= file_size
+            RETURNING id, received_size
+        ),
+        part AS (
+            INSERT INTO upload_session_parts (session_id, part_offset, size, file_path)
+            SELECT id, $2, $3, $4 FROM advanced
+        )
+        SELECT received_size FROM advanced
+    """
+    
+    LIST_PARTS_QUERY = """
+        SELECT part_offset, size, file_path FROM upload_session_parts
+        WHERE session_id = $1
+        ORDER BY part_offset
+    """
+    
+    BEGIN_COMPLETION_QUERY = """
+        UPDATE upload_sessions SET status = 'completing'
+        WHERE id = $1
+          AND status = 'open'
+          AND (received_size = file_size OR content_hash IS NOT NULL)
+          AND expires_at > CURRENT_TIMESTAMP
+        RETURNING *
+    """
+    
+    CANCEL_COMPLETION_QUERY = "UPDATE upload_sessions SET status = 'open' WHERE id = $1 AND status = 'completing'"
+    
+    DELETE_QUERY = _delete_sessions_query(
+        "SELECT id FROM upload_sessions WHERE id = $1 AND ($2::varchar IS NULL OR status = $2) FOR UPDATE"
+    )
+    
+    DELETE_EXPIRED_QUERY = _delete_sessions_query("""
+            SELECT id FROM upload_sessions
+            WHERE expires_at <= CURRENT_TIMESTAMP
+            ORDER BY expires_at
+            LIMIT $1
+            FOR UPDATE SKIP LOCKED
+    """)
+    
+    def __init__(self, db_pool: asyncpg.Pool):
+        self.db_pool = db_pool
+    
+    async def create(self, session: UploadSession, ttl: int, staged_path: Optional[str] = None) -> UploadSession:
+        """Guardar una sesión nueva con vencimiento relativo al reloj de la BD"""
+        async with self.db_pool.acquire() as conn:
+            row = await conn.fetchrow(
+                self.CREATE_QUERY,
+                session.id,
+                session.user_document,
+                session.application_id,
+                session.document_type,
+                session.filename,
+                session.mime_type,
+                session.file_size,
+                session.uploaded_by,
+                session.content_hash,
+                float(ttl),
+                staged_path
+            )
+            
+            return self._row_to_session(row)
+    
+    async def find_by_id(self, session_id: str) -> Optional[UploadSession]:
+        """Buscar una sesión vigente"""
+        async with self.db_pool.acquire() as conn:
+            row = await conn.fetchrow(self.FIND_QUERY, session_id)
+            
+            return self._row_to_session(row) if row else None
+    
+    async def add_part(self, session_id: str, offset: int, size: int, file_path: str) -> Optional[int]:
+        """Registrar un chunk y avanzar el offset en una sola sentencia"""
+        async with self.db_pool.acquire() as conn:
+            return await conn.fetchval(self.ADD_PART_QUERY, session_id, offset, size, file_path)
+    
+    async def list_parts(self, session_id: str) -> list[UploadPart]:
+        """Chunks de la sesión ordenados por offset"""
+        async with self.db_pool.acquire() as conn:
+            rows = await conn.fetch(self.LIST_PARTS_QUERY, session_id)
+            
+            return [UploadPart(row['part_offset'], row['size'], row['file_path']) for row in rows]
+    
+    async def begin_completion(self, session_id: str) -> Optional[UploadSession]:
+        """Reservar la sesión para finalizarla"""
+        async with self.db_pool.acquire() as conn:
+            row = await conn.fetchrow(self.BEGIN_COMPLETION_QUERY, session_id)
+            
+            return self._row_to_session(row) if row else None
+    
+    async def cancel_completion(self, session_id: str) -> None:
+        """Volver a abrir la sesión"""
+        async with self.db_pool.acquire() as conn:
+            await conn.execute(self.CANCEL_COMPLETION_QUERY, session_id)
+    
+    async def delete(self, session_id: str, status: Optional[str] = None) -> Optional[list[str]]:
+        """Eliminar la sesión y encolar sus chunks"""
+        async with self.db_pool.acquire() as conn:
+            row = await conn.fetchrow(self.DELETE_QUERY, session_id, status)
+            
+            return list(row['queued_paths']) if row['deleted'] else None
+    
+    async def delete_expired(self, limit: int) -> int:
+        """Eliminar un lote de sesiones vencidas"""
+        async with self.db_pool.acquire() as conn:
+            row = await conn.fetchrow(self.DELETE_EXPIRED_QUERY, limit)
+            
+            return row['deleted']
+    
+    def _row_to_session(self, row) -> UploadSession:
+        """Convertir fila de base de datos a entidad UploadSession"""
+        return UploadSession(
+            id=str(row['id']),
+            user_document=row['user_document'],
+            application_id=str(row['application_id']),
+            document_type=row['document_type'],
+            filename=row['filename'],
+            mime_type=row['mime_type'],
+            file_size=row['file_size'],
+            received_size=row['received_size'],
+            status=row['status'],
+            uploaded_by=str(row['uploaded_by']) if row['uploaded_by'] else None,
+            content_hash=row['content_hash'],
+            created_at=row['created_at'],
+            expires_at=row['expires_at']
+        )
@@ -0,0 +1,8 @@
+"""
+Storage Infrastructure
+"""
+from .local_storage import LocalStorageRepository
+from .s3_storage import S3StorageRepository
+from .memory_storage import MemoryStorageRepository
+
+__all__ = ['LocalStorageRepository', 'S3StorageRepository', 'MemoryStorageRepository']
@@ -0,0 +1,234 @@
+"""
+Implementación de storage en sistema de archivos local
+"""
+import asyncio
+import mimetypes
+import os
+import shutil
+import uuid
+import aiofiles
+import aiofiles.os
+from datetime import datetime, timezone
+from typing import AsyncIterator, Optional
+from ...domain.repositories.storage_repository import (
+    IStorageRepository,
+    StoredFile,
+    FileMetadata,
+    PresignedUpload
+)
+
+
+class LocalStorageRepository(IStorageRepository):
+    """Repositorio de archivos sobre el sistema de archivos local"""
+    
+    READ_CHUNK_SIZE = 256 * 1024
+    
+    def __init__(self, storage_path: str, base_url: str = "/storage"):
+        self.storage_path = storage_path
+        self.base_url = base_url.rstrip('/')
+        os.makedirs(self.storage_path, exist_ok=True)
+    
+    async def upload_file(
+        self,
+        file_content: bytes,
+        filename: str,
+        content_type: str
+    ) -> str:
+        """Guardar archivo completo en disco"""
+        file_path = self._build_file_path(filename)
+        full_path = self._full_path(file_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        
+        async with aiofiles.open(full_path, 'wb') as f:
+            await f.write(file_content)
+        
+        return file_path
+    
+    async def upload_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        content_type: str
+    ) -> str:
+        """Guardar archivo en disco chunk a chunk"""
+        file_path = self._build_file_path(filename)
+        full_path = self._full_path(file_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        
+        # Escribir en un archivo temporal y renombrar al terminar para
+        # no dejar archivos a medias si el flujo se corta
+        temp_path = f"{full_path}.{uuid.uuid4().hex}.part"
+        
+        try:
+            async with aiofiles.open(temp_path, 'wb') as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+            os.replace(temp_path, full_path)
+        except BaseException:
+            try:
+                await aiofiles.os.remove(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        
+        return file_path
+    
+    async def open_range(
+        self,
+        file_path: str,
+        start: int = 0,
+        end: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """Leer el archivo desde disco a partir de `start`"""
+        remaining = None if end is None else end - start + 1
+        
+        async with aiofiles.open(self._full_path(file_path), 'rb') as f:
+            await f.seek(start)
+            
+            while remaining is None or remaining > 0:
+                size = self.READ_CHUNK_SIZE if remaining is None else min(self.READ_CHUNK_SIZE, remaining)
+                chunk = await f.read(size)
+                
+                if not chunk:
+                    break
+                
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+    
+    def get_local_path(self, file_path: str) -> Optional[str]:
+        """Ruta absoluta del archivo en disco"""
+        return self._full_path(file_path)
+    
+    async def get_file_url(self, file_path: str, expiration: int = 3600) -> str:
+        """URL pública servida por el montaje /storage"""
+        return f"{self.base_url}/{file_path}"
+    
+    async def delete_file(self, file_path: str) -> bool:
+        """Eliminar archivo del disco"""
+        try:
+            await aiofiles.os.remove(self._full_path(file_path))
+            return True
+        except FileNotFoundError:
+            return False
+    
+    async def move_file(self, source_path: str, target_path: str) -> str:
+        """Renombrar el archivo dentro del directorio de storage"""
+        full_target = self._full_path(target_path)
+        os.makedirs(os.path.dirname(full_target), exist_ok=True)
+        await aiofiles.os.replace(self._full_path(source_path), full_target)
+        return target_path
+    
+    async def copy_file(self, source_path: str, target_path: str) -> str:
+        """Enlace duro si el sistema de archivos lo permite; si no, copia"""
+        full_target = self._full_path(target_path)
+        os.makedirs(os.path.dirname(full_target), exist_ok=True)
+        await asyncio.to_thread(self._copy, self._full_path(source_path), full_target)
+        return target_path
+    
+    @staticmethod
+    def _copy(source: str, target: str) -> None:
+        # Copiar a un temporal y renombrar: el destino nunca queda a medias
+        temp_path = f"{target}.{uuid.uuid4().hex}.part"
+        
+        try:
+            try:
+                os.link(source, temp_path)
+            except FileNotFoundError:
+                raise
+            except OSError:
+                shutil.copyfile(source, temp_path)
+            os.replace(temp_path, target)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+    
+    async def generate_upload_url(
+        self,
+        file_path: str,
+        content_type: str,
+        file_size: int,
+        sha256: str,
+        expiration: int = 900
+    ) -> PresignedUpload:
+        """El disco local no recibe subidas sin pasar por el servicio"""
+        raise NotImplementedError("El storage local no admite subidas directas")
+    
+    async def stat_file(self, file_path: str) -> Optional[FileMetadata]:
+        """Tamaño del archivo y tipo deducido de la extensión (sin checksum)"""
+        try:
+            stat = await aiofiles.os.stat(self._full_path(file_path))
+        except FileNotFoundError:
+            return None
+        
+        return FileMetadata(stat.st_size, mimetypes.guess_type(file_path)[0], None)
+    
+    async def file_exists(self, file_path: str) -> bool:
+        """Verificar si el archivo existe en disco"""
+        return await aiofiles.os.path.isfile(self._full_path(file_path))
+    
+    async def list_files(
+        self,
+        prefix: str = "",
+        start_after: Optional[str] = None
+    ) -> AsyncIterator[StoredFile]:
+        """Recorrer el directorio de storage en orden de bytes de la ruta"""
+        async for stored_file in self._walk("", prefix, start_after):
+            yield stored_file
+    
+    async def _walk(
+        self,
+        directory: str,
+        prefix: str,
+        start_after: Optional[str]
+    ) -> AsyncIterator[StoredFile]:
+        """
+        Recorrido en profundidad de un directorio
+        
+        Los directorios se ordenan como `nombre/` para que el recorrido
+        siga el mismo orden que la ruta completa ("a/x" < "a.pdf" es falso
+        en orden de bytes porque "/" > ".").
+        """
+        entries = await asyncio.to_thread(self._scan_dir, directory)
+        
+        for name, is_dir, size, modified in entries:
+            path = f"{directory}{name}"
+            
+            if is_dir:
+                path += '/'
+                # Saltar subárboles que no pueden contener rutas pedidas
+                if not (path.startswith(prefix) or prefix.startswith(path)):
+                    continue
+                if start_after is not None and path < start_after and not start_after.startswith(path):
+                    continue
+                
+                async for stored_file in self._walk(path, prefix, start_after):
+                    yield stored_file
+            elif path.startswith(prefix) and (start_after is None or path > start_after):
+                yield StoredFile(path, size, modified)
+    
+    def _scan_dir(self, directory: str) -> list[tuple[str, bool, int, datetime]]:
+        """Entradas de un directorio ordenadas por su clave de recorrido"""
+        entries = []
+        
+        with os.scandir(os.path.join(self.storage_path, directory)) as iterator:
+            for entry in iterator:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                stat = entry.stat(follow_symlinks=False)
+                modified = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+                entries.append((entry.name, is_dir, stat.st_size, modified))
+        
+        entries.sort(key=lambda entry: entry[0] + '/' if entry[1] else entry[0])
+        return entries
+    
+    def _build_file_path(self, filename: str) -> str:
+        """Ruta relativa organizada por año y mes"""
+        now = datetime.utcnow()
+        return f"{now.strftime('%Y')}/{now.strftime('%m')}/{filename}"
+    
+    def _full_path(self, file_path: str) -> str:
+        """Ruta absoluta dentro del directorio de storage"""
+        return os.path.join(self.storage_path, file_path)
@@ -0,0 +1,189 @@
+"""
+Implementación de storage en memoria
+"""
+import hashlib
+import mimetypes
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import AsyncIterator, NamedTuple, Optional
+from ...domain.repositories.storage_repository import (
+    IStorageRepository,
+    StoredFile,
+    FileMetadata,
+    PresignedUpload
+)
+
+
+class _StoredObject(NamedTuple):
+    content: bytes
+    content_type: Optional[str]
+    sha256: str
+    modified: datetime
+
+
+class MemoryStorageRepository(IStorageRepository):
+    """
+    Repositorio de archivos en memoria del proceso
+
+    Sigue la semántica de `LocalStorageRepository` (rutas por año y mes,
+    FileNotFoundError al leer, mover o copiar archivos inexistentes) sin
+    tocar el disco ni la red: sirve de referencia para la suite de
+    conformidad y para aislar el coste del resto del servicio en los
+    benchmarks. El contenido se pierde al reiniciar y no se comparte entre
+    procesos, así que no es apto para producción.
+
+    No es thread-safe: está pensado para usarse desde el event loop.
+    """
+
+    READ_CHUNK_SIZE = 256 * 1024
+
+    def __init__(self, base_url: str = "memory://"):
+        self.base_url = base_url
+        self._files: dict[str, _StoredObject] = {}
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes ocupados por el contenido de todos los archivos"""
+        return sum(len(stored.content) for stored in self._files.values())
+
+    async def upload_file(
+        self,
+        file_content: bytes,
+        filename: str,
+        content_type: str
+    ) -> str:
+        """Guardar una copia inmutable del contenido"""
+        file_path = self._build_file_path(filename)
+        self._store(file_path, bytes(file_content), content_type)
+        return file_path
+
+    async def upload_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        content_type: str
+    ) -> str:
+        """Acumular los chunks y publicar el archivo solo al terminar el flujo"""
+        file_path = self._build_file_path(filename)
+        parts = []
+
+        async for chunk in chunks:
+            parts.append(bytes(chunk))
+
+        self._store(file_path, b''.join(parts), content_type)
+        return file_path
+
+    async def open_range(
+        self,
+        file_path: str,
+        start: int = 0,
+        end: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """Leer el contenido por chunks a partir de `start`"""
+        stored = self._files.get(file_path)
+
+        if stored is None:
+            raise FileNotFoundError(file_path)
+
+        content = memoryview(stored.content)
+        stop = len(content) if end is None else min(end + 1, len(content))
+
+        for offset in range(start, stop, self.READ_CHUNK_SIZE):
+            yield bytes(content[offset:min(offset + self.READ_CHUNK_SIZE, stop)])
+
+    def get_local_path(self, file_path: str) -> Optional[str]:
+        """Sin archivo en disco: el contenido se envía con open_range"""
+        return None
+
+    async def get_file_url(self, file_path: str, expiration: int = 3600) -> str:
+        """URL simbólica: el contenido solo es accesible desde el propio proceso"""
+        return f"{self.base_url}{file_path}"
+
+    async def delete_file(self, file_path: str) -> bool:
+        """Eliminar el archivo"""
+        return self._files.pop(file_path, None) is not None
+
+    async def move_file(self, source_path: str, target_path: str) -> str:
+        """Reasignar el contenido a la ruta destino"""
+        stored = self._files.pop(source_path, None)
+
+        if stored is None:
+            raise FileNotFoundError(source_path)
+
+        self._files[target_path] = stored._replace(modified=datetime.now(timezone.utc))
+        return target_path
+
+    async def copy_file(self, source_path: str, target_path: str) -> str:
+        """Compartir el contenido (inmutable) entre ambas rutas"""
+        stored = self._files.get(source_path)
+
+        if stored is None:
+            raise FileNotFoundError(source_path)
+
+        self._files[target_path] = stored._replace(modified=datetime.now(timezone.utc))
+        return target_path
+
+    async def generate_upload_url(
+        self,
+        file_path: str,
+        content_type: str,
+        file_size: int,
+        sha256: str,
+        expiration: int = 900
+    ) -> PresignedUpload:
+        """La memoria del proceso no recibe subidas sin pasar por el servicio"""
+        raise NotImplementedError("El storage en memoria no admite subidas directas")
+
+    async def stat_file(self, file_path: str) -> Optional[FileMetadata]:
+        """Tamaño, tipo y checksum calculado al guardar"""
+        stored = self._files.get(file_path)
+
+        if stored is None:
+            return None
+
+        return FileMetadata(len(stored.content), stored.content_type, stored.sha256)
+
+    async def file_exists(self, file_path: str) -> bool:
+        """Verificar si el archivo existe"""
+        return file_path in self._files
+
+    async def list_files(
+        self,
+        prefix: str = "",
+        start_after: Optional[str] = None
+    ) -> AsyncIterator[StoredFile]:
+        """
+        Recorrer las rutas en orden de bytes
+
+        El orden por code point de str coincide con el de bytes en UTF-8.
+        Se recorre una foto de las rutas: las que se eliminen mientras
+        tanto se saltan.
+        """
+        paths = sorted(self._files)
+
+        # Las rutas con un mismo prefijo son contiguas y empiezan en él
+        position = bisect_left(paths, prefix)
+        if start_after is not None:
+            position = max(position, bisect_right(paths, start_after))
+
+        for path in paths[position:]:
+            if not path.startswith(prefix):
+                break
+
+            stored = self._files.get(path)
+
+            if stored is not None:
+                yield StoredFile(path, len(stored.content), stored.modified)
+
+    def _store(self, file_path: str, content: bytes, content_type: Optional[str]) -> None:
+        self._files[file_path] = _StoredObject(
+            content=content,
+            content_type=content_type or mimetypes.guess_type(file_path)[0],
+            sha256=hashlib.sha256(content).hexdigest(),
+            modified=datetime.now(timezone.utc)
+        )
+
+    def _build_file_path(self, filename: str) -> str:
+        """Ruta relativa organizada por año y mes, igual que el storage local"""
+        now = datetime.utcnow()
+        return f"{now.strftime('%Y')}/{now.strftime('%m')}/{filename}"
@@ -0,0 +1,364 @@
+"""
+Implementación de storage en AWS S3
+"""
+import asyncio
+import base64
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from datetime import datetime
+from typing import AsyncIterator, Optional
+from ...domain.repositories.storage_repository import (
+    IStorageRepository,
+    StoredFile,
+    FileMetadata,
+    PresignedUpload
+)
+
+
+class S3StorageRepository(IStorageRepository):
+    """
+    Repositorio de archivos sobre un bucket de S3
+    
+    boto3 es síncrono: todas las llamadas al cliente se ejecutan en un pool
+    de hilos propio y acotado (`io_threads`), nunca en el event loop ni en
+    el executor por defecto de asyncio, que comparten otras tareas. El pool
+    HTTP del cliente tiene `max_pool_connections` conexiones, así que cada
+    hilo dispone de una conexión reutilizable sin esperar.
+    """
+    
+    # S3 exige partes de al menos 5 MB (salvo la última) en multipart
+    MIN_MULTIPART_CHUNK_SIZE = 5 * 1024 * 1024
+    READ_CHUNK_SIZE = 256 * 1024
+    
+    def __init__(
+        self,
+        aws_access_key_id: str,
+        aws_secret_access_key: str,
+        region_name: str,
+        bucket_name: str,
+        url_expiration: int = 3600,
+        endpoint_url: Optional[str] = None,
+        max_pool_connections: int = 32,
+        io_threads: Optional[int] = None,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        max_attempts: int = 3,
+        multipart_chunk_size: int = MIN_MULTIPART_CHUNK_SIZE
+    ):
+        if multipart_chunk_size < self.MIN_MULTIPART_CHUNK_SIZE:
+            raise ValueError("Las partes de un multipart upload deben ser de al menos 5 MB")
+        
+        self.bucket_name = bucket_name
+        self.url_expiration = url_expiration
+        self.multipart_chunk_size = multipart_chunk_size
+        # endpoint_url permite usar un servicio compatible con S3 (MinIO, LocalStack);
+        # SigV4 es necesario para que las URLs firmadas cubran los headers
+        self.client = boto3.client(
+            's3',
+            aws_access_key_id=aws_access_key_id or None,
+            aws_secret_access_key=aws_secret_access_key or None,
+            region_name=region_name,
+            endpoint_url=endpoint_url or None,
+            config=Config(
+                signature_version='s3v4',
+                max_pool_connections=max_pool_connections,
+                connect_timeout=connect_timeout,
+                read_timeout=read_timeout,
+                retries={'max_attempts': max_attempts, 'mode': 'standard'}
+            )
+        )
+        # Más hilos que conexiones solo harían esperar por una conexión libre
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(io_threads or max_pool_connections, max_pool_connections),
+            thread_name_prefix='s3-io'
+        )
+    
+    async def _call(self, method, /, *args, **kwargs):
+        """Ejecutar una llamada bloqueante del cliente en el pool de hilos de S3"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(method, *args, **kwargs))
+    
+    def shutdown(self) -> None:
+        """Liberar el pool de hilos; las llamadas en curso terminan antes"""
+        self._executor.shutdown(wait=True)
+    
+    async def upload_file(
+        self,
+        file_content: bytes,
+        filename: str,
+        content_type: str
+    ) -> str:
+        """Subir archivo completo con un único PUT"""
+        key = self._build_key(filename)
+        
+        await self._call(
+            self.client.put_object,
+            Bucket=self.bucket_name,
+            Key=key,
+            Body=file_content,
+            ContentType=content_type
+        )
+        
+        return key
+    
+    async def upload_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        content_type: str
+    ) -> str:
+        """
+        Subir archivo por partes con multipart upload
+        
+        Solo se mantiene en memoria la parte en curso, que se envía tal
+        cual (sin copiarla) en cuanto llega a `multipart_chunk_size`: cada
+        subida ocupa como mucho `multipart_chunk_size` más el último chunk
+        recibido (unos 5 MB con la configuración por defecto). Los archivos
+        más pequeños que una parte se suben con un único PUT.
+        """
+        key = self._build_key(filename)
+        buffer = bytearray()
+        parts = []
+        upload_id = None
+        
+        try:
+            async for chunk in chunks:
+                buffer.extend(chunk)
+                
+                if len(buffer) >= self.multipart_chunk_size:
+                    if upload_id is None:
+                        response = await self._call(
+                            self.client.create_multipart_upload,
+                            Bucket=self.bucket_name,
+                            Key=key,
+                            ContentType=content_type
+                        )
+                        upload_id = response['UploadId']
+                    
+                    # boto3 termina de leer el cuerpo antes de devolver el control
+                    parts.append(await self._upload_part(key, upload_id, len(parts) + 1, buffer))
+                    buffer = bytearray()
+            
+            if upload_id is None:
+                await self._call(
+                    self.client.put_object,
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    Body=buffer,
+                    ContentType=content_type
+                )
+                return key
+            
+            if buffer:
+                parts.append(await self._upload_part(key, upload_id, len(parts) + 1, buffer))
+            
+            await self._call(
+                self.client.complete_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts}
+            )
+        except BaseException:
+            if upload_id is not None:
+                await self._call(
+                    self.client.abort_multipart_upload,
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    UploadId=upload_id
+                )
+            raise
+        
+        return key
+    
+    async def open_range(
+        self,
+        file_path: str,
+        start: int = 0,
+        end: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Leer el objeto con un GET por rango y reenviar el cuerpo por chunks
+        
+        Solo hay un chunk en memoria a la vez; las lecturas del cuerpo son
+        bloqueantes y se hacen en el pool de hilos para no frenar el event loop.
+        """
+        params = {'Bucket': self.bucket_name, 'Key': file_path}
+        
+        if start > 0 or end is not None:
+            params['Range'] = f"bytes={start}-{'' if end is None else end}"
+        
+        try:
+            response = await self._call(self.client.get_object, **params)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                raise FileNotFoundError(file_path) from e
+            raise
+        
+        body = response['Body']
+        
+        try:
+            while True:
+                chunk = await self._call(body.read, self.READ_CHUNK_SIZE)
+                
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            await self._call(body.close)
+    
+    def get_local_path(self, file_path: str) -> Optional[str]:
+        """Los objetos de S3 no tienen ruta local"""
+        return None
+    
+    async def get_file_url(self, file_path: str, expiration: int = 3600) -> str:
+        """
+        Generar URL firmada para el objeto
+        
+        Firmar no usa la red, pero renovar credenciales temporales (STS,
+        metadata de la instancia) sí, así que también pasa por el pool.
+        """
+        return await self._call(
+            self.client.generate_presigned_url,
+            'get_object',
+            Params={'Bucket': self.bucket_name, 'Key': file_path},
+            ExpiresIn=expiration or self.url_expiration
+        )
+    
+    async def delete_file(self, file_path: str) -> bool:
+        """Eliminar objeto del bucket"""
+        await self._call(self.client.delete_object, Bucket=self.bucket_name, Key=file_path)
+        return True
+    
+    async def move_file(self, source_path: str, target_path: str) -> str:
+        """Copiar el objeto en el servidor y eliminar el original"""
+        await self._call(
+            self.client.copy_object,
+            Bucket=self.bucket_name,
+            Key=target_path,
+            CopySource={'Bucket': self.bucket_name, 'Key': source_path}
+        )
+        await self._call(self.client.delete_object, Bucket=self.bucket_name, Key=source_path)
+        return target_path
+    
+    async def copy_file(self, source_path: str, target_path: str) -> str:
+        """Copiar el objeto en el servidor, sin descargarlo"""
+        try:
+            await self._call(
+                self.client.copy_object,
+                Bucket=self.bucket_name,
+                Key=target_path,
+                CopySource={'Bucket': self.bucket_name, 'Key': source_path}
+            )
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                raise FileNotFoundError(source_path)
+            raise
+        return target_path
+    
+    async def generate_upload_url(
+        self,
+        file_path: str,
+        content_type: str,
+        file_size: int,
+        sha256: str,
+        expiration: int = 900
+    ) -> PresignedUpload:
+        """
+        Firmar un PUT directo al bucket
+        
+        Content-Type, Content-Length y x-amz-checksum-sha256 forman parte
+        de la firma: S3 rechaza la subida si el cliente envía otros valores
+        o si el contenido no coincide con el checksum.
+        """
+        checksum = base64.b64encode(bytes.fromhex(sha256)).decode('ascii')
+        url = await self._call(
+            self.client.generate_presigned_url,
+            'put_object',
+            Params={
+                'Bucket': self.bucket_name,
+                'Key': file_path,
+                'ContentType': content_type,
+                'ContentLength': file_size,
+                'ChecksumSHA256': checksum
+            },
+            ExpiresIn=expiration
+        )
+        headers = {
+            'Content-Type': content_type,
+            'Content-Length': str(file_size),
+            'x-amz-checksum-sha256': checksum
+        }
+        return PresignedUpload(url, 'PUT', headers, expiration)
+    
+    async def stat_file(self, file_path: str) -> Optional[FileMetadata]:
+        """HEAD del objeto pidiendo también el checksum guardado"""
+        try:
+            response = await self._call(
+                self.client.head_object,
+                Bucket=self.bucket_name,
+                Key=file_path,
+                ChecksumMode='ENABLED'
+            )
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            raise
+        
+        checksum = response.get('ChecksumSHA256')
+        # Los objetos multipart guardan un checksum de checksums ("...-N"), no el del contenido
+        sha256 = base64.b64decode(checksum).hex() if checksum and '-' not in checksum else None
+        return FileMetadata(response['ContentLength'], response.get('ContentType'), sha256)
+    
+    async def file_exists(self, file_path: str) -> bool:
+        """Verificar si el objeto existe con un HEAD"""
+        try:
+            await self._call(self.client.head_object, Bucket=self.bucket_name, Key=file_path)
+            return True
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+    
+    async def list_files(
+        self,
+        prefix: str = "",
+        start_after: Optional[str] = None
+    ) -> AsyncIterator[StoredFile]:
+        """Listar objetos por páginas de 1000 (S3 los devuelve en orden de bytes)"""
+        params = {'Bucket': self.bucket_name, 'Prefix': prefix}
+        
+        if start_after is not None:
+            params['StartAfter'] = start_after
+        
+        # Cada página se pide en el pool de hilos al avanzar el paginador
+        pages = iter(self.client.get_paginator('list_objects_v2').paginate(**params))
+        
+        while True:
+            page = await self._call(next, pages, None)
+            
+            if page is None:
+                break
+            
+            for obj in page.get('Contents', []):
+                yield StoredFile(obj['Key'], obj['Size'], obj['LastModified'])
+    
+    async def _upload_part(self, key: str, upload_id: str, part_number: int, data: bytearray) -> dict:
+        """Subir una parte del multipart upload"""
+        response = await self._call(
+            self.client.upload_part,
+            Bucket=self.bucket_name,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data
+        )
+        return {'ETag': response['ETag'], 'PartNumber': part_number}
+    
+    def _build_key(self, filename: str) -> str:
+        """Clave del objeto organizada por año y mes"""
+        now = datetime.utcnow()
+        return f"{now.strftime('%Y')}/{now.strftime('%m')}/{filename}"
@@ -0,0 +1,22 @@
+"""
+Tracing Infrastructure
+"""
+from .tracer import Tracer, Span, NOOP_SPAN
+from .exporters import SpanExporter, JsonlSpanExporter, OtlpJsonSpanExporter
+from .traced_pool import TracedPool, TracedConnection
+from .traced_repositories import TracedDocumentRepository, TracedStorageRepository
+from .traced_usecases import TracedUploadDocumentUseCase
+
+__all__ = [
+    'Tracer',
+    'Span',
+    'NOOP_SPAN',
+    'SpanExporter',
+    'JsonlSpanExporter',
+    'OtlpJsonSpanExporter',
+    'TracedPool',
+    'TracedConnection',
+    'TracedDocumentRepository',
+    'TracedStorageRepository',
+    'TracedUploadDocumentUseCase'
+]
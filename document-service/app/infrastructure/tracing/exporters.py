@@ -0,0 +1,112 @@
+"""
+Exportadores de spans: archivo JSONL local y OTLP/HTTP con JSON
+"""
+import json
+import os
+import urllib.request
+from abc import ABC, abstractmethod
+from typing import Any
+from .tracer import Span
+
+
+class SpanExporter(ABC):
+    """Destino de los spans terminados; `export` se llama desde un hilo"""
+
+    @abstractmethod
+    def export(self, spans: list[Span]) -> None:
+        """
+        Enviar un lote de spans
+
+        Raises:
+            Exception: Si el destino no está disponible (el lote se descarta)
+        """
+        pass
+
+    def shutdown(self) -> None:
+        """Liberar recursos del exportador"""
+        pass
+
+
+class JsonlSpanExporter(SpanExporter):
+    """
+    Añade cada span como una línea JSON a un archivo local
+
+    Es el formato que lee `scripts/trace_report.py`.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    def export(self, spans: list[Span]) -> None:
+        lines = ''.join(json.dumps(span.to_dict(), default=str) + '\n' for span in spans)
+
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+
+
+class OtlpJsonSpanExporter(SpanExporter):
+    """
+    Envía los spans a un collector OpenTelemetry por OTLP/HTTP con JSON
+
+    `endpoint` es la base del collector (`http://localhost:4318`); los spans
+    se envían a `{endpoint}/v1/traces`. Sirve con el OpenTelemetry Collector,
+    Jaeger o `scripts/trace_collector.py` como sustituto local.
+    """
+
+    SPAN_KINDS = {'internal': 1, 'server': 2, 'client': 3}
+
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 5.0):
+        self.url = endpoint.rstrip('/') + '/v1/traces'
+        self.service_name = service_name
+        self.timeout = timeout
+
+    def export(self, spans: list[Span]) -> None:
+        body = json.dumps(self.encode(spans)).encode()
+        request = urllib.request.Request(
+            self.url, data=body, method='POST', headers={'Content-Type': 'application/json'}
+        )
+
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+    def encode(self, spans: list[Span]) -> dict:
+        """Cuerpo de una ExportTraceServiceRequest en su codificación JSON"""
+        return {
+            'resourceSpans': [{
+                'resource': {'attributes': [_attribute('service.name', self.service_name)]},
+                'scopeSpans': [{
+                    'scope': {'name': 'document-service'},
+                    'spans': [self._encode_span(span) for span in spans]
+                }]
+            }]
+        }
+
+    def _encode_span(self, span: Span) -> dict:
+        encoded = {
+            'traceId': span.trace_id,
+            'spanId': span.span_id,
+            'name': span.name,
+            'kind': self.SPAN_KINDS.get(span.kind, 1),
+            # int64 van como string en OTLP/JSON
+            'startTimeUnixNano': str(span.start_ns),
+            'endTimeUnixNano': str(span.end_ns),
+            'attributes': [_attribute(key, value) for key, value in span.attributes.items()],
+            'status': {'code': 2, 'message': span.error} if span.error else {'code': 1}
+        }
+
+        if span.parent_id is not None:
+            encoded['parentSpanId'] = span.parent_id
+
+        return encoded
+
+
+def _attribute(key: str, value: Any) -> dict:
+    if isinstance(value, bool):
+        return {'key': key, 'value': {'boolValue': value}}
+    if isinstance(value, int):
+        return {'key': key, 'value': {'intValue': str(value)}}
+    if isinstance(value, float):
+        return {'key': key, 'value': {'doubleValue': value}}
+    return {'key': key, 'value': {'stringValue': str(value)}}
@@ -0,0 +1,111 @@
+"""
+Pool de conexiones que crea un span por consulta SQL
+"""
+from typing import Optional
+from .tracer import Tracer, NOOP_SPAN
+
+
+class _TracedAcquireContext:
+    """`async with pool.acquire() as conn` con la espera por la conexión como span"""
+
+    __slots__ = ('_context', '_pool')
+
+    def __init__(self, context, pool: 'TracedPool'):
+        self._context = context
+        self._pool = pool
+
+    async def __aenter__(self):
+        with self._pool.tracer.span('db.acquire'):
+            conn = await self._context.__aenter__()
+        return TracedConnection(conn, self._pool)
+
+    async def __aexit__(self, *exc):
+        return await self._context.__aexit__(*exc)
+
+
+class TracedPool:
+    """
+    Envoltorio del pool que entrega conexiones instrumentadas
+
+    Cada consulta dentro de una traza muestreada genera un span con el
+    texto SQL (`db.statement`, sin los parámetros) y las filas devueltas o
+    afectadas (`db.rows`). Si la sentencia está en `statements`, el span
+    lleva su nombre (`db.save`); si no, el de la operación SQL (`db.select`).
+    El resto de atributos y métodos se delegan en el pool envuelto.
+    """
+
+    def __init__(self, pool, tracer: Tracer, statements: Optional[dict[str, str]] = None):
+        self._pool = pool
+        self.tracer = tracer
+        self._names = {query: name for name, query in (statements or {}).items()}
+
+    def acquire(self, *, timeout: Optional[float] = None) -> _TracedAcquireContext:
+        return _TracedAcquireContext(self._pool.acquire(timeout=timeout), self)
+
+    def __getattr__(self, name):
+        return getattr(self._pool, name)
+
+    def span_name(self, query: str) -> str:
+        name = self._names.get(query)
+
+        if name is None:
+            words = query.split(None, 1)
+            name = words[0].lower() if words else 'query'
+
+        return f"db.{name}"
+
+
+class TracedConnection:
+    """Conexión de asyncpg cuyas consultas se registran como spans"""
+
+    def __init__(self, conn, pool: TracedPool):
+        self._conn = conn
+        self._pool = pool
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    async def fetch(self, query: str, *args, **kwargs):
+        return await self._traced(self._conn.fetch, query, args, kwargs, len)
+
+    async def fetchrow(self, query: str, *args, **kwargs):
+        return await self._traced(self._conn.fetchrow, query, args, kwargs, _count_one)
+
+    async def fetchval(self, query: str, *args, **kwargs):
+        return await self._traced(self._conn.fetchval, query, args, kwargs, _count_one)
+
+    async def execute(self, query: str, *args, **kwargs):
+        return await self._traced(self._conn.execute, query, args, kwargs, _count_status)
+
+    async def executemany(self, query: str, args, **kwargs):
+        rows = len(args) if hasattr(args, '__len__') else None
+        return await self._traced(self._conn.executemany, query, (args,), kwargs, lambda _: rows)
+
+    async def _traced(self, method, query: str, args: tuple, kwargs: dict, count):
+        tracer = self._pool.tracer
+
+        # Fast path: fuera de una traza no se construye nada
+        if tracer.current_span() is NOOP_SPAN:
+            return await method(query, *args, **kwargs)
+
+        with tracer.span(self._pool.span_name(query), {'db.statement': ' '.join(query.split())}) as span:
+            result = await method(query, *args, **kwargs)
+            rows = count(result)
+
+            if rows is not None:
+                span.set_attribute('db.rows', rows)
+
+            return result
+
+
+def _count_one(result) -> int:
+    return 0 if result is None else 1
+
+
+def _count_status(status) -> Optional[int]:
+    """Filas afectadas según el tag de comando ('UPDATE 3', 'INSERT 0 1')"""
+    if isinstance(status, str):
+        last = status.rsplit(' ', 1)[-1]
+        if last.isdigit():
+            return int(last)
+    return None
@@ -0,0 +1,241 @@
+"""
+Decoradores que registran spans para las llamadas a los repositorios
+"""
+import time
+from datetime import datetime
+from typing import AsyncIterator, Optional
+from ...domain.entities.document import Document
+from ...domain.repositories.document_repository import IDocumentRepository
+from ...domain.repositories.storage_repository import (
+    IStorageRepository,
+    StoredFile,
+    FileMetadata,
+    PresignedUpload
+)
+from .tracer import Tracer, NOOP_SPAN
+
+
+class TracedDocumentRepository(IDocumentRepository):
+    """
+    Repositorio de documentos con un span por llamada
+
+    Las consultas SQL quedan como hijos si el repositorio envuelto usa un
+    `TracedPool`; este span agrupa las de una misma operación.
+    """
+
+    def __init__(self, repository: IDocumentRepository, tracer: Tracer):
+        self.repository = repository
+        self.tracer = tracer
+
+    async def _call(self, operation: str, awaitable):
+        with self.tracer.span(f"document_repository.{operation}"):
+            return await awaitable
+
+    async def save(self, document: Document) -> Document:
+        return await self._call('save', self.repository.save(document))
+
+    async def save_many(self, documents: list[Document]) -> list[Document]:
+        return await self._call('save_many', self.repository.save_many(documents))
+
+    async def find_by_id(self, document_id: str) -> Optional[Document]:
+        return await self._call('find_by_id', self.repository.find_by_id(document_id))
+
+    async def find_by_ids(self, document_ids: list[str]) -> list[Document]:
+        return await self._call('find_by_ids', self.repository.find_by_ids(document_ids))
+
+    async def find_by_user_document(
+        self,
+        user_document: str,
+        limit: Optional[int] = None,
+        after: Optional[tuple[datetime, str]] = None
+    ) -> list[Document]:
+        return await self._call(
+            'find_by_user_document', self.repository.find_by_user_document(user_document, limit, after)
+        )
+
+    async def find_by_application_id(
+        self,
+        application_id: str,
+        limit: Optional[int] = None,
+        after: Optional[tuple[datetime, str]] = None
+    ) -> list[Document]:
+        return await self._call(
+            'find_by_application_id', self.repository.find_by_application_id(application_id, limit, after)
+        )
+
+    async def find_json_by_user_document(
+        self,
+        user_document: str,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        fields: Optional[list[str]] = None
+    ) -> tuple[str, Optional[tuple[datetime, str]]]:
+        return await self._call(
+            'find_json_by_user_document',
+            self.repository.find_json_by_user_document(user_document, limit, after, fields)
+        )
+
+    async def find_json_by_application_id(
+        self,
+        application_id: str,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        fields: Optional[list[str]] = None
+    ) -> tuple[str, Optional[tuple[datetime, str]]]:
+        return await self._call(
+            'find_json_by_application_id',
+            self.repository.find_json_by_application_id(application_id, limit, after, fields)
+        )
+
+    async def list_version_by_user_document(self, user_document: str) -> str:
+        return await self._call(
+            'list_version_by_user_document', self.repository.list_version_by_user_document(user_document)
+        )
+
+    async def list_version_by_application_id(self, application_id: str) -> str:
+        return await self._call(
+            'list_version_by_application_id', self.repository.list_version_by_application_id(application_id)
+        )
+
+    async def delete(self, document_id: str) -> bool:
+        return await self._call('delete', self.repository.delete(document_id))
+
+    async def delete_by_application_id(self, application_id: str) -> tuple[list[str], list[str]]:
+        return await self._call('delete_by_application_id', self.repository.delete_by_application_id(application_id))
+
+    async def exists_by_id(self, document_id: str) -> bool:
+        return await self._call('exists_by_id', self.repository.exists_by_id(document_id))
+
+    async def acquire_blob(
+        self,
+        content_hash: str,
+        file_path: str,
+        file_size: int,
+        mime_type: str
+    ) -> tuple[str, bool]:
+        return await self._call(
+            'acquire_blob', self.repository.acquire_blob(content_hash, file_path, file_size, mime_type)
+        )
+
+    async def release_blob(self, content_hash: str) -> Optional[str]:
+        return await self._call('release_blob', self.repository.release_blob(content_hash))
+
+
+class TracedStorageRepository(IStorageRepository):
+    """
+    Storage con un span por llamada y los bytes movidos como atributos
+
+    En `upload_stream` el span distingue el tiempo esperando al origen de
+    los chunks (`upload.source_wait_ms`: leer el multipart o el cuerpo de
+    la petición) del resto, que es escribir en el storage.
+    """
+
+    def __init__(self, storage: IStorageRepository, tracer: Tracer):
+        self.storage = storage
+        self.tracer = tracer
+
+    async def upload_file(self, file_content: bytes, filename: str, content_type: str) -> str:
+        with self.tracer.span('storage.upload_file', {'storage.bytes': len(file_content)}):
+            return await self.storage.upload_file(file_content, filename, content_type)
+
+    async def upload_stream(self, chunks: AsyncIterator[bytes], filename: str, content_type: str) -> str:
+        with self.tracer.span('storage.upload_stream') as span:
+            if span is not NOOP_SPAN:
+                chunks = _metered_source(chunks, span)
+            path = await self.storage.upload_stream(chunks, filename, content_type)
+            span.set_attribute('storage.path', path)
+            return path
+
+    def open_range(self, file_path: str, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        iterator = self.storage.open_range(file_path, start, end)
+        span = self.tracer.start_span('storage.open_range', {'storage.path': file_path, 'storage.bytes': 0})
+
+        if span is NOOP_SPAN:
+            return iterator
+
+        return _counted(iterator, span, 'storage.bytes', len)
+
+    def get_local_path(self, file_path: str) -> Optional[str]:
+        return self.storage.get_local_path(file_path)
+
+    async def get_file_url(self, file_path: str, expiration: int = 3600) -> str:
+        with self.tracer.span('storage.get_file_url', {'storage.path': file_path}):
+            return await self.storage.get_file_url(file_path, expiration)
+
+    async def delete_file(self, file_path: str) -> bool:
+        with self.tracer.span('storage.delete_file', {'storage.path': file_path}):
+            return await self.storage.delete_file(file_path)
+
+    async def move_file(self, source_path: str, target_path: str) -> str:
+        with self.tracer.span('storage.move_file', {'storage.path': target_path}):
+            return await self.storage.move_file(source_path, target_path)
+
+    async def copy_file(self, source_path: str, target_path: str) -> str:
+        with self.tracer.span('storage.copy_file', {'storage.path': target_path}):
+            return await self.storage.copy_file(source_path, target_path)
+
+    async def generate_upload_url(
+        self,
+        file_path: str,
+        content_type: str,
+        file_size: int,
+        sha256: str,
+        expiration: int = 900
+    ) -> PresignedUpload:
+        with self.tracer.span('storage.generate_upload_url', {'storage.path': file_path}):
+            return await self.storage.generate_upload_url(file_path, content_type, file_size, sha256, expiration)
+
+    async def stat_file(self, file_path: str) -> Optional[FileMetadata]:
+        with self.tracer.span('storage.stat_file', {'storage.path': file_path}):
+            return await self.storage.stat_file(file_path)
+
+    async def file_exists(self, file_path: str) -> bool:
+        with self.tracer.span('storage.file_exists', {'storage.path': file_path}):
+            return await self.storage.file_exists(file_path)
+
+    def list_files(self, prefix: str = "", start_after: Optional[str] = None) -> AsyncIterator[StoredFile]:
+        iterator = self.storage.list_files(prefix, start_after)
+        span = self.tracer.start_span('storage.list_files', {'storage.prefix': prefix, 'storage.files': 0})
+
+        if span is NOOP_SPAN:
+            return iterator
+
+        return _counted(iterator, span, 'storage.files', lambda _: 1)
+
+
+async def _metered_source(chunks: AsyncIterator[bytes], span) -> AsyncIterator[bytes]:
+    """Contar bytes y tiempo de espera del iterador que alimenta una subida"""
+    iterator = chunks.__aiter__()
+    waited = 0.0
+    size = 0
+
+    try:
+        while True:
+            started = time.perf_counter()
+            try:
+                chunk = await iterator.__anext__()
+            except StopAsyncIteration:
+                break
+            finally:
+                waited += time.perf_counter() - started
+
+            size += len(chunk)
+            yield chunk
+    finally:
+        span.set_attribute('storage.bytes', size)
+        span.set_attribute('upload.source_wait_ms', round(waited * 1000, 3))
+
+
+async def _counted(iterator: AsyncIterator, span, attribute: str, measure) -> AsyncIterator:
+    """Iterar acumulando en el span y terminarlo al agotar o cerrar el iterador"""
+    try:
+        async for item in iterator:
+            span.add(attribute, measure(item))
+            yield item
+    except GeneratorExit:
+        raise
+    except BaseException as e:
+        span.record_exception(e)
+        raise
+    finally:
+        span.end()
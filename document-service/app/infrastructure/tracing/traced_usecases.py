@@ -0,0 +1,51 @@
+"""
+Casos de uso con spans por etapa
+"""
+from typing import Optional
+from ...application.usecases.upload_document import UploadDocumentUseCase
+from ...domain.entities.document import Document
+from ...domain.repositories.document_repository import IDocumentRepository
+from ...domain.repositories.storage_repository import IStorageRepository
+from ...domain.services.storage_layout import StorageLayout
+from .tracer import Tracer
+
+
+class TracedUploadDocumentUseCase(UploadDocumentUseCase):
+    """
+    `UploadDocumentUseCase` con un span por etapa de la subida
+
+    - upload.store: recibir el contenido en una ruta temporal calculando el hash
+    - upload.adopt: registrar el blob y moverlo a su ruta definitiva
+    - upload.save: insertar la fila del documento
+
+    Bajo cada una quedan los spans del storage y de las consultas SQL.
+    """
+
+    def __init__(
+        self,
+        document_repository: IDocumentRepository,
+        storage_repository: IStorageRepository,
+        tracer: Tracer,
+        storage_layout: Optional[StorageLayout] = None
+    ):
+        super().__init__(document_repository, storage_repository, storage_layout)
+        self.tracer = tracer
+
+    async def execute(self, *args, **kwargs) -> Document:
+        with self.tracer.span('upload.execute') as span:
+            document = await super().execute(*args, **kwargs)
+            span.set_attribute('document.id', document.id)
+            span.set_attribute('document.size', document.file_size)
+            return document
+
+    async def store(self, *args, **kwargs) -> Document:
+        with self.tracer.span('upload.store', {'upload.mime_type': kwargs.get('mime_type')}):
+            return await super().store(*args, **kwargs)
+
+    async def adopt(self, *args, **kwargs) -> Document:
+        with self.tracer.span('upload.adopt', {'upload.bytes': kwargs.get('file_size')}):
+            return await super().adopt(*args, **kwargs)
+
+    async def save(self, document: Document) -> Document:
+        with self.tracer.span('upload.save'):
+            return await super().save(document)
@@ -0,0 +1,258 @@
+"""
+Tracer en proceso: spans por petición propagados con contextvars
+"""
+import random
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Optional
+
+
+_current_span: ContextVar[Optional['Span']] = ContextVar('current_span', default=None)
+
+
+class _Trace:
+    """Spans terminados de una traza, exportados juntos al cerrar la raíz"""
+
+    __slots__ = ('trace_id', 'sampled', 'spans', 'dropped')
+
+    def __init__(self, trace_id: str, sampled: bool):
+        self.trace_id = trace_id
+        self.sampled = sampled
+        self.spans: list['Span'] = []
+        self.dropped = 0
+
+
+class Span:
+    """
+    Una operación con inicio, fin y atributos
+
+    Los atributos siguen las convenciones de OpenTelemetry cuando existen
+    (`db.statement`, `http.route`); los tiempos son en nanosegundos Unix.
+    """
+
+    __slots__ = ('tracer', 'trace', 'span_id', 'parent_id', 'name', 'kind',
+                 'start_ns', 'end_ns', 'attributes', 'error')
+
+    def __init__(
+        self,
+        tracer: 'Tracer',
+        trace: _Trace,
+        name: str,
+        parent_id: Optional[str],
+        attributes: dict,
+        kind: str = 'internal'
+    ):
+        self.tracer = tracer
+        self.trace = trace
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes
+        self.error: Optional[str] = None
+
+    @property
+    def trace_id(self) -> str:
+        return self.trace.trace_id
+
+    @property
+    def duration(self) -> float:
+        """Segundos transcurridos (hasta ahora si no ha terminado)"""
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def add(self, key: str, amount: float) -> None:
+        """Acumular un atributo numérico (bytes, filas)"""
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.error = f"{type(exc).__name__}: {exc}"
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self.tracer._on_end(self)
+
+    def to_dict(self) -> dict:
+        """Forma plana de exportación (una línea del JSONL)"""
+        return {
+            'trace_id': self.trace.trace_id,
+            'span_id': self.span_id,
+            'parent_span_id': self.parent_id,
+            'name': self.name,
+            'kind': self.kind,
+            'start_time_unix_nano': self.start_ns,
+            'end_time_unix_nano': self.end_ns,
+            'duration_ms': round((self.end_ns - self.start_ns) / 1e6, 3),
+            'attributes': self.attributes,
+            'status': 'error' if self.error else 'ok',
+            'error': self.error
+        }
+
+
+class _NoopSpan:
+    """Span que no registra nada: petición fuera de muestreo o sin traza"""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def add(self, key: str, amount: float) -> None:
+        pass
+
+    def record_exception(self, exc: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class _SpanContext:
+    """`with tracer.span(...)`: activa el span como actual mientras dura el bloque"""
+
+    __slots__ = ('_span', '_token')
+
+    def __init__(self, span):
+        self._span = span
+        self._token = None
+
+    def __enter__(self):
+        if self._span is not NOOP_SPAN:
+            self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._token is not None:
+            _current_span.reset(self._token)
+        if exc is not None:
+            self._span.record_exception(exc)
+        self._span.end()
+        return False
+
+
+class Tracer:
+    """
+    Crea spans y acumula las trazas terminadas para exportarlas
+
+    El muestreo se decide en la raíz: una fracción `sample_rate` de las
+    peticiones se traza completa. Si `slow_threshold` está definido se
+    registran todas y al cerrar la raíz se conservan también las que lo
+    superaron, que son las que interesa desglosar; esto cuesta memoria y
+    CPU por petición, así que conviene usarlo con un umbral alto.
+
+    Fuera de una traza muestreada `span()` devuelve un span vacío, de modo
+    que el código instrumentado solo paga una lectura de contextvar.
+    No es thread-safe: está pensado para usarse desde el event loop.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        slow_threshold: Optional[float] = None,
+        max_spans_per_trace: int = 512,
+        max_pending: int = 2048
+    ):
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold
+        self.max_spans_per_trace = max_spans_per_trace
+        self._pending: deque[list[Span]] = deque()
+        self.max_pending = max_pending
+        self.recorded_traces = 0
+        self.dropped_traces = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0 or self.slow_threshold is not None
+
+    def start_trace(self, name: str, attributes: Optional[dict] = None, kind: str = 'server'):
+        """
+        Crear el span raíz de una petición, o NOOP_SPAN si no se registra
+
+        El llamador lo activa con `activate` y lo termina con `end()`.
+        """
+        sampled = self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+        if not sampled and self.slow_threshold is None:
+            return NOOP_SPAN
+
+        trace = _Trace(f"{random.getrandbits(128):032x}", sampled)
+        return Span(self, trace, name, None, attributes or {}, kind)
+
+    def start_span(self, name: str, attributes: Optional[dict] = None):
+        """
+        Crear un span hijo del actual sin activarlo
+
+        Para operaciones que no son un bloque (iteradores): el llamador lo
+        termina con `end()`.
+        """
+        parent = _current_span.get()
+
+        if parent is None:
+            return NOOP_SPAN
+
+        trace = parent.trace
+
+        if len(trace.spans) >= self.max_spans_per_trace:
+            trace.dropped += 1
+            return NOOP_SPAN
+
+        return Span(self, trace, name, parent.span_id, attributes or {})
+
+    def span(self, name: str, attributes: Optional[dict] = None) -> _SpanContext:
+        """`with tracer.span('storage.upload_stream') as span:`"""
+        return _SpanContext(self.start_span(name, attributes))
+
+    @staticmethod
+    def activate(span) -> _SpanContext:
+        """Activar un span ya creado (la raíz) durante un bloque `with`"""
+        return _SpanContext(span)
+
+    @staticmethod
+    def current_span():
+        return _current_span.get() or NOOP_SPAN
+
+    def drain(self) -> list[Span]:
+        """Sacar los spans de todas las trazas pendientes de exportar"""
+        spans = []
+
+        while self._pending:
+            spans.extend(self._pending.popleft())
+
+        return spans
+
+    def stats(self) -> dict:
+        return {
+            'pending_traces': len(self._pending),
+            'recorded_traces': self.recorded_traces,
+            'dropped_traces': self.dropped_traces
+        }
+
+    def _on_end(self, span: Span) -> None:
+        trace = span.trace
+        trace.spans.append(span)
+
+        if span.parent_id is not None:
+            return
+
+        # Terminó la raíz: los hijos que sigan abiertos ya no se exportan
+        if not trace.sampled and span.duration < self.slow_threshold:
+            return
+
+        if trace.dropped:
+            span.attributes['tracing.dropped_spans'] = trace.dropped
+
+        if len(self._pending) >= self.max_pending:
+            self.dropped_traces += 1
+            return
+
+        self._pending.append(list(trace.spans))
+        self.recorded_traces += 1
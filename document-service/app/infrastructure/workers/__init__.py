@@ -0,0 +1,7 @@
+"""
+Background Workers
+"""
+from .storage_cleanup_worker import StorageCleanupWorker
+from .span_export_worker import SpanExportWorker
+
+__all__ = ['StorageCleanupWorker', 'SpanExportWorker']
@@ -0,0 +1,78 @@
+"""
+Worker en segundo plano que envía los spans terminados al exportador
+"""
+import asyncio
+import logging
+from typing import Optional
+from ..tracing.tracer import Tracer
+from ..tracing.exporters import SpanExporter
+
+
+logger = logging.getLogger(__name__)
+
+
+class SpanExportWorker:
+    """
+    Vacía periódicamente las trazas pendientes del tracer
+
+    La exportación (escritura de archivo o POST al collector) corre en un
+    hilo para no bloquear el event loop. Si el exportador falla, el lote se
+    descarta: las trazas son diagnóstico y no deben acumularse sin límite.
+    """
+
+    def __init__(self, tracer: Tracer, exporter: SpanExporter, interval: float = 2.0):
+        self.tracer = tracer
+        self.exporter = exporter
+        self.interval = interval
+        self.exported_spans = 0
+        self.failed_batches = 0
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    def start(self) -> None:
+        """Arrancar el bucle del worker en una tarea de fondo"""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Detener el worker exportando lo que quede pendiente"""
+        if self._task is None:
+            return
+
+        self._stopping.set()
+        await self._task
+        self._task = None
+        await self.flush()
+        self.exporter.shutdown()
+
+    async def flush(self) -> int:
+        """
+        Exportar las trazas pendientes
+
+        Returns:
+            int: Número de spans exportados
+        """
+        spans = self.tracer.drain()
+
+        if not spans:
+            return 0
+
+        try:
+            await asyncio.to_thread(self.exporter.export, spans)
+        except Exception as e:
+            self.failed_batches += 1
+            logger.warning(f"No se pudieron exportar {len(spans)} spans: {str(e)}")
+            return 0
+
+        self.exported_spans += len(spans)
+        return len(spans)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+            await self.flush()
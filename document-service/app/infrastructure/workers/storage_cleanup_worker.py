@@ -0,0 +1,194 @@
+"""
+Worker en segundo plano que vacía la outbox `storage_deletions`
+"""
+import asyncio
+import logging
+from typing import Optional
+from ...domain.repositories.storage_repository import IStorageRepository
+from ...domain.repositories.upload_session_repository import IUploadSessionRepository
+from ...domain.services.storage_layout import StorageLayout
+
+
+logger = logging.getLogger(__name__)
+
+
+class StorageCleanupWorker:
+    """
+    Elimina del storage los archivos encolados al borrar documentos
+
+    Cada iteración reclama un lote con `FOR UPDATE SKIP LOCKED` (varias
+    instancias del servicio pueden trabajar a la vez sin pisarse) y lo
+    reserva durante `lease` segundos; si el proceso muere, las filas vuelven
+    a estar disponibles al vencer la reserva. Los fallos se reintentan con
+    backoff exponencial hasta `max_attempts`.
+
+    Para blobs compartidos, la fila de `document_blobs` con ref_count 0 se
+    elimina en la misma transacción que el archivo: si otra subida volvió a
+    referenciar el contenido, el archivo se conserva. Con el blob se borra
+    también su miniatura, si se llegó a generar.
+
+    Si recibe el repositorio de sesiones de subida, en cada iteración
+    elimina también un lote de sesiones vencidas, cuyos chunks pasan a la
+    misma outbox.
+    """
+
+    CLAIM_QUERY = """
+        UPDATE storage_deletions
+        SET attempts = attempts + 1,
+            available_at = CURRENT_TIMESTAMP + make_interval(secs => $2)
+        WHERE id IN (
+            SELECT id FROM storage_deletions
+            WHERE available_at <= CURRENT_TIMESTAMP AND attempts < $3
+            ORDER BY available_at
+            LIMIT $1
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING id, file_path, content_hash, attempts
+    """
+
+    DELETE_BLOB_QUERY = """
+        DELETE FROM document_blobs
+        WHERE content_hash = $1 AND ref_count <= 0
+        RETURNING file_path
+    """
+
+    DONE_QUERY = "DELETE FROM storage_deletions WHERE id = $1"
+
+    RETRY_QUERY = """
+        UPDATE storage_deletions
+        SET available_at = CURRENT_TIMESTAMP + make_interval(secs => $2),
+            last_error = $3
+        WHERE id = $1
+    """
+
+    def __init__(
+        self,
+        db_pool,
+        storage_repository: IStorageRepository,
+        batch_size: int = 100,
+        concurrency: int = 4,
+        interval: float = 1.0,
+        max_attempts: int = 10,
+        lease: int = 300,
+        retry_delay: float = 5.0,
+        max_retry_delay: float = 3600.0,
+        storage_layout: Optional[StorageLayout] = None,
+        upload_session_repository: Optional[IUploadSessionRepository] = None
+    ):
+        self.db_pool = db_pool
+        self.storage_repository = storage_repository
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.interval = interval
+        self.max_attempts = max_attempts
+        self.lease = lease
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.storage_layout = storage_layout or StorageLayout()
+        self.upload_session_repository = upload_session_repository
+        self.deleted = 0
+        self.skipped = 0
+        self.failed = 0
+        self.expired_sessions = 0
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    def start(self) -> None:
+        """Arrancar el bucle del worker en una tarea de fondo"""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Detener el worker esperando a que termine el lote en curso"""
+        if self._task is None:
+            return
+
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    async def run_once(self) -> int:
+        """
+        Reclamar y procesar un lote
+
+        Returns:
+            int: Número de filas reclamadas
+        """
+        if self.upload_session_repository is not None:
+            try:
+                self.expired_sessions += await self.upload_session_repository.delete_expired(self.batch_size)
+            except Exception:
+                logger.exception("Error al eliminar sesiones de subida vencidas")
+
+        async with self.db_pool.acquire() as conn:
+            rows = await conn.fetch(
+                self.CLAIM_QUERY, self.batch_size, float(self.lease), self.max_attempts
+            )
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def process(row) -> None:
+            async with semaphore:
+                await self._process(row)
+
+        await asyncio.gather(*(process(row) for row in rows))
+        return len(rows)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                claimed = await self.run_once()
+            except Exception:
+                logger.exception("Error en el worker de limpieza del storage")
+                claimed = 0
+
+            # Con lotes llenos se sigue sin esperar; si no, se duerme hasta el próximo sondeo
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _process(self, row) -> None:
+        """Eliminar un archivo y marcar la fila como hecha, o programar el reintento"""
+        async with self.db_pool.acquire() as conn:
+            try:
+                async with conn.transaction():
+                    file_path = row['file_path']
+
+                    if row['content_hash'] is not None:
+                        # Bloquea la fila del blob hasta el commit: un acquire_blob
+                        # concurrente espera y vuelve a crear el blob desde cero
+                        file_path = await conn.fetchval(self.DELETE_BLOB_QUERY, row['content_hash'])
+
+                    if file_path is not None:
+                        await self.storage_repository.delete_file(file_path)
+                        self.deleted += 1
+
+                        if row['content_hash'] is not None:
+                            await self.storage_repository.delete_file(
+                                self.storage_layout.thumbnail_path(row['content_hash'])
+                            )
+                    else:
+                        self.skipped += 1
+
+                    await conn.execute(self.DONE_QUERY, row['id'])
+            except Exception as e:
+                self.failed += 1
+                delay = min(self.retry_delay * 2 ** (row['attempts'] - 1), self.max_retry_delay)
+                logger.warning(
+                    f"No se pudo eliminar {row['file_path']} del storage "
+                    f"(intento {row['attempts']}/{self.max_attempts}): {str(e)}"
+                )
+                await conn.execute(self.RETRY_QUERY, row['id'], float(delay), str(e))
+
+    def stats(self) -> dict:
+        """Contadores del worker desde el arranque"""
+        return {
+            'deleted': self.deleted,
+            'skipped': self.skipped,
+            'failed': self.failed,
+            'expired_sessions': self.expired_sessions,
+            'running': self._task is not None and not self._task.done()
+        }
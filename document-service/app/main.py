@@ -1,9 +1,11 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 from .config.config import get_settings
 from .config.container import get_container
+from .infrastructure.metrics import MetricsRegistry
+from .presentation.middlewares import MetricsMiddleware, TracingMiddleware
 import os
 
 
@@ -16,6 +18,14 @@ def create_app() -> FastAPI:
         await container.init_db_pool()
         print(' Database pool initialized')
 
+        if settings.storage_cleanup_enabled:
+            container.storage_cleanup_worker().start()
+            print(' Storage cleanup worker started')
+
+        if settings.tracing_enabled:
+            container.span_export_worker().start()
+            print(' Span export worker started')
+
         document_controller = container.document_controller()
         app.include_router(
             document_controller.router,
@@ -25,6 +35,17 @@ def create_app() -> FastAPI:
 
         yield
 
+        if settings.storage_cleanup_enabled:
+            await container.storage_cleanup_worker().stop()
+            print(' Storage cleanup worker stopped')
+
+        if settings.tracing_enabled:
+            await container.span_export_worker().stop()
+            print(' Span export worker stopped')
+
+        container.thumbnail_renderer().shutdown()
+        container.shutdown_storage()
+
         await container.close_db_pool()
         print(' Database pool closed')
 
@@ -41,8 +62,16 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=['*'],
         allow_headers=['*'],
+        expose_headers=['X-Next-Cursor', 'ETag', 'Location', 'Upload-Offset', 'X-Trace-Id'],
     )
 
+    if settings.metrics_enabled:
+        # Después de CORS: queda por fuera y mide también los preflight
+        app.add_middleware(MetricsMiddleware, registry=container.metrics_registry())
+
+    if settings.tracing_enabled:
+        app.add_middleware(TracingMiddleware, tracer=container.tracer())
+
     storage_path = '/app/storage'
     if os.path.exists(storage_path):
         app.mount('/storage', StaticFiles(directory=storage_path), name='storage')
@@ -55,6 +84,22 @@ def create_app() -> FastAPI:
             'version': settings.app_version
         }
 
+    @app.get('/health/db', tags=['Health'])
+    async def db_pool_stats():
+        """Métricas del pool de conexiones para dimensionar min/max size"""
+        if container.db_pool is None:
+            return {'status': 'unavailable'}
+        return {'status': 'healthy', 'pool': container.db_pool.stats()}
+
+    if settings.metrics_enabled:
+        @app.get('/metrics', tags=['Health'], include_in_schema=False)
+        async def metrics():
+            """Métricas en el formato de texto de Prometheus"""
+            return Response(
+                content=container.metrics_registry().render(),
+                media_type=MetricsRegistry.CONTENT_TYPE
+            )
+
     return app
 
 
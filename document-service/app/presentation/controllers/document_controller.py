@@ -1,18 +1,67 @@
 """
 Controlador de documentos
 """
-from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException, status, Request
-from fastapi.security import HTTPAuthorizationCredentials
-from typing import List, Optional
-from ..models.document_models import DocumentResponse, DocumentUrlResponse, ErrorResponse
-from ..middlewares.auth_middleware import require_auth, require_roles, security
+from fastapi import APIRouter, UploadFile, File, Form, Query, Header, Depends, HTTPException, status, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import AsyncIterator, List, Optional
+import mimetypes
+import os
+from ..models.document_models import (
+    DocumentResponse,
+    DocumentUrlResponse,
+    DocumentUrlsRequest,
+    DocumentUrlsResponse,
+    BulkUploadError,
+    BulkUploadResponse,
+    DeleteApplicationDocumentsResponse,
+    CreateUploadSessionRequest,
+    UploadSessionResponse,
+    CreateDirectUploadRequest,
+    DirectUploadResponse,
+    ErrorResponse
+)
+from ..middlewares.auth_middleware import require_auth, require_roles
+from ..responses import (
+    ByteRange,
+    RangeNotSatisfiableError,
+    FileRangeResponse,
+    parse_range,
+    etag_matches,
+    content_disposition
+)
 from ...application.usecases import (
     UploadDocumentUseCase,
+    BulkUploadDocumentsUseCase,
+    BulkUploadItem,
     GetDocumentUrlUseCase,
+    GetDocumentUrlsUseCase,
+    GetDocumentContentUseCase,
+    GetDocumentThumbnailUseCase,
+    PreviewNotAvailableError,
     GetDocumentsByApplicationUseCase,
     GetDocumentsByUserUseCase,
-    DeleteDocumentUseCase
+    DeleteDocumentUseCase,
+    DeleteApplicationDocumentsUseCase,
+    ResumableUploadUseCase,
+    UploadConflictError,
+    DirectUploadUseCase,
+    FileTooLargeError
 )
+from ...infrastructure.auth.jwt_service import JWTService
+from ...application.usecases.upload_document import MAX_FILE_SIZE, UPLOAD_CHUNK_SIZE
+from ...application.usecases.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from ...domain.entities.document import Document, DOCUMENT_FIELDS
+
+
+async def iter_upload_file(file: UploadFile, chunk_size: int = UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Leer un UploadFile por chunks sin cargarlo completo en memoria"""
+    while True:
+        chunk = await file.read(chunk_size)
+
+        if not chunk:
+            break
+
+        yield chunk
 
 
 class DocumentController:
@@ -21,20 +70,108 @@ class DocumentController:
     def __init__(
         self,
         upload_document_usecase: UploadDocumentUseCase,
+        bulk_upload_documents_usecase: BulkUploadDocumentsUseCase,
         get_document_url_usecase: GetDocumentUrlUseCase,
+        get_document_urls_usecase: GetDocumentUrlsUseCase,
+        get_document_content_usecase: GetDocumentContentUseCase,
+        get_document_thumbnail_usecase: GetDocumentThumbnailUseCase,
         get_documents_by_application_usecase: GetDocumentsByApplicationUseCase,
         get_documents_by_user_usecase: GetDocumentsByUserUseCase,
-        delete_document_usecase: DeleteDocumentUseCase
+        delete_document_usecase: DeleteDocumentUseCase,
+        delete_application_documents_usecase: DeleteApplicationDocumentsUseCase,
+        resumable_upload_usecase: ResumableUploadUseCase,
+        direct_upload_usecase: DirectUploadUseCase,
+        jwt_service: JWTService
     ):
         self.upload_document_usecase = upload_document_usecase
+        self.bulk_upload_documents_usecase = bulk_upload_documents_usecase
         self.get_document_url_usecase = get_document_url_usecase
+        self.get_document_urls_usecase = get_document_urls_usecase
+        self.get_document_content_usecase = get_document_content_usecase
+        self.get_document_thumbnail_usecase = get_document_thumbnail_usecase
         self.get_documents_by_application_usecase = get_documents_by_application_usecase
         self.get_documents_by_user_usecase = get_documents_by_user_usecase
         self.delete_document_usecase = delete_document_usecase
+        self.delete_application_documents_usecase = delete_application_documents_usecase
+        self.resumable_upload_usecase = resumable_upload_usecase
+        self.direct_upload_usecase = direct_upload_usecase
+
+        # Dependencias de autenticación compartidas por todas las rutas
+        self.require_auth = require_auth(jwt_service)
+        self.require_staff = require_roles(jwt_service, ['admin', 'recruiter'])
 
         self.router = APIRouter()
         self._register_routes()
 
+    async def _list_documents(
+        self,
+        usecase,
+        key: str,
+        limit: int,
+        cursor: Optional[str],
+        fields: Optional[str],
+        include_urls: bool,
+        if_none_match: Optional[str] = None
+    ) -> Response:
+        """
+        Construir la respuesta de un listado paginado
+
+        Sin `include_urls` el JSON lo genera PostgreSQL y se devuelve tal
+        cual; con URLs se pasa por las entidades para poder firmarlas.
+
+        Los listados sin URLs llevan un ETag calculado sin leer las filas,
+        y un `If-None-Match` que coincide se responde con 304. Con URLs no
+        hay ETag: las URLs firmadas vencen aunque los datos no cambien.
+        """
+        field_list = [field.strip() for field in fields.split(',') if field.strip()] if fields else None
+        allowed = set(DOCUMENT_FIELDS) | ({'url'} if include_urls else set())
+        unknown = set(field_list or []) - allowed
+
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Campos no válidos: {', '.join(sorted(unknown))}"
+            )
+
+        headers = {}
+
+        if not include_urls:
+            # Se calcula antes que la página: si los datos cambian en medio,
+            # el ETag viejo no coincidirá en la próxima petición
+            etag = await usecase.etag(key)
+            headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        try:
+            if include_urls:
+                documents, next_cursor = await usecase.execute(key, limit, cursor)
+            else:
+                items, next_cursor = await usecase.execute_json(key, limit, cursor, field_list)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+        if next_cursor:
+            headers['X-Next-Cursor'] = next_cursor
+
+        if not include_urls:
+            return Response(content=items, media_type='application/json', headers=headers)
+
+        urls = await self.get_document_urls_usecase.for_documents(documents) if documents else {}
+        include = set(field_list) | {'url'} if field_list else None
+        content = []
+
+        for doc in documents:
+            document_response = DocumentResponse.model_validate(doc)
+            document_response.url = urls.get(doc.id)
+            content.append(document_response.model_dump(mode='json', include=include))
+
+        return JSONResponse(content=content, headers=headers)
+
     def _register_routes(self):
         """Registrar rutas del controlador"""
 
@@ -62,22 +199,11 @@ class DocumentController:
             - **application_id**: ID de la postulación
             - **document_type**: Tipo de documento (cv, carta_presentacion, certificado, etc)
             """
-            # Leer archivo
-            file_content = await file.read()
-            file_size = len(file_content)
-
-            # Validar tamaño
-            if file_size > 10 * 1024 * 1024:
-                raise HTTPException(
-                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    detail="El archivo no puede superar los 10 MB"
-                )
-
             try:
                 document = await self.upload_document_usecase.execute(
-                    file_content=file_content,
+                    chunks=iter_upload_file(file),
                     filename=file.filename,
-                    file_size=file_size,
+                    file_size=file.size,
                     mime_type=file.content_type,
                     user_document=user_document,
                     application_id=application_id,
@@ -87,6 +213,11 @@ class DocumentController:
 
                 return DocumentResponse.model_validate(document)
 
+            except FileTooLargeError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=str(e)
+                )
             except ValueError as e:
                 import logging
                 logging.error(f"ValueError en upload_document_public: {str(e)}")
@@ -120,7 +251,7 @@ class DocumentController:
             user_document: str = Form(...),
             application_id: str = Form(...),
             document_type: str = Form(...),
-            credentials: HTTPAuthorizationCredentials = Depends(security)
+            payload: dict = Depends(self.require_auth)
         ):
             """
             Subir un documento (requiere autenticación)
@@ -130,53 +261,344 @@ class DocumentController:
             - **application_id**: ID de la postulación
             - **document_type**: Tipo de documento (cv, carta_presentacion, certificado, etc)
             """
-            # Verificar autenticación manualmente
-            from ...infrastructure.auth.jwt_service import JWTService
-            from ...config.config import get_settings
+            user_id = payload.get('sub')
 
-            settings = get_settings()
-            jwt_service = JWTService(settings.jwt_secret)
+            try:
+                document = await self.upload_document_usecase.execute(
+                    chunks=iter_upload_file(file),
+                    filename=file.filename,
+                    file_size=file.size,
+                    mime_type=file.content_type,
+                    user_document=user_document,
+                    application_id=application_id,
+                    document_type=document_type,
+                    uploaded_by=user_id
+                )
 
-            token = credentials.credentials
-            payload = jwt_service.verify_token(token)
+                return DocumentResponse.model_validate(document)
 
-            if payload is None:
+            except FileTooLargeError as e:
                 raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Token inválido o expirado"
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=str(e)
+                )
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                )
+            except Exception as e:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Error al subir documento: {str(e)}"
                 )
 
-            user_id = payload.get('sub')
+        @self.router.post(
+            "/upload/bulk",
+            response_model=BulkUploadResponse,
+            status_code=status.HTTP_201_CREATED,
+            responses={
+                207: {"model": BulkUploadResponse},
+                400: {"model": ErrorResponse}
+            }
+        )
+        async def upload_documents_bulk(
+            response: Response,
+            files: List[UploadFile] = File(...),
+            document_types: List[str] = Form(...),
+            user_document: str = Form(...),
+            application_id: str = Form(...)
+        ):
+            """
+            Subir varios documentos de una postulación en una sola petición (público)
+
+            Los archivos se suben al storage en paralelo y la metadata de
+            todos se guarda en una única transacción. Si algún archivo falla
+            se responde 207 con el detalle por archivo en `errors`.
+
+            - **files**: Archivos a subir (máx 20, cada uno máx 10MB)
+            - **document_types**: Tipo de cada archivo, en el mismo orden que `files`
+            - **user_document**: Número de documento del usuario
+            - **application_id**: ID de la postulación
+            """
+            if len(document_types) != len(files):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Se requiere un document_type por cada archivo"
+                )
 
-            # Leer archivo
-            file_content = await file.read()
-            file_size = len(file_content)
+            items = [
+                BulkUploadItem(
+                    chunks=iter_upload_file(file),
+                    filename=file.filename,
+                    mime_type=file.content_type,
+                    document_type=document_type,
+                    file_size=file.size
+                )
+                for file, document_type in zip(files, document_types)
+            ]
+
+            try:
+                results = await self.bulk_upload_documents_usecase.execute(
+                    items=items,
+                    user_document=user_document,
+                    application_id=application_id,
+                    uploaded_by=None  # Usuario público
+                )
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                )
+
+            documents = []
+            errors = []
+
+            for result in results:
+                if result.document is not None:
+                    documents.append(DocumentResponse.model_validate(result.document))
+                    continue
+
+                if isinstance(result.error, FileTooLargeError):
+                    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+                elif isinstance(result.error, ValueError):
+                    status_code = status.HTTP_400_BAD_REQUEST
+                else:
+                    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+                errors.append(BulkUploadError(
+                    index=result.index,
+                    filename=result.filename,
+                    status_code=status_code,
+                    detail=str(result.error)
+                ))
+
+            if errors:
+                response.status_code = status.HTTP_207_MULTI_STATUS
+
+            return BulkUploadResponse(documents=documents, errors=errors)
+
+        @self.router.put(
+            "/raw",
+            response_model=DocumentResponse,
+            status_code=status.HTTP_201_CREATED,
+            responses={
+                400: {"model": ErrorResponse},
+                413: {"model": ErrorResponse}
+            }
+        )
+        async def upload_document_raw(
+            request: Request,
+            user_document: Optional[str] = Query(None),
+            application_id: Optional[str] = Query(None),
+            document_type: Optional[str] = Query(None),
+            filename: Optional[str] = Query(None),
+            x_user_document: Optional[str] = Header(None),
+            x_application_id: Optional[str] = Header(None),
+            x_document_type: Optional[str] = Header(None),
+            x_filename: Optional[str] = Header(None),
+            content_type: Optional[str] = Header(None),
+            content_length: Optional[int] = Header(None)
+        ):
+            """
+            Subir un documento enviando el archivo como cuerpo crudo (público)
+
+            Evita el parseo multipart: el cuerpo de la petición se envía al
+            storage a medida que llega. Los metadatos pueden ir como query
+            params o como headers `X-User-Document`, `X-Application-Id`,
+            `X-Document-Type` y `X-Filename`.
+
+            - **user_document**: Número de documento del usuario
+            - **application_id**: ID de la postulación
+            - **document_type**: Tipo de documento (cv, carta_presentacion, certificado, etc)
+            - **filename**: Nombre original del archivo
+            """
+            user_document = user_document or x_user_document
+            application_id = application_id or x_application_id
+            document_type = document_type or x_document_type
+            filename = filename or x_filename
+
+            if not all([user_document, application_id, document_type, filename]):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Se requieren user_document, application_id, document_type y filename"
+                )
 
-            # Validar tamaño
-            if file_size > 10 * 1024 * 1024:
+            if content_length is not None and content_length > MAX_FILE_SIZE:
                 raise HTTPException(
                     status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    detail="El archivo no puede superar los 10 MB"
+                    detail=str(FileTooLargeError())
                 )
 
-            # Crear file-like object para el use case
-            from io import BytesIO
-            file_obj = BytesIO(file_content)
+            # Con application/octet-stream el tipo real se deduce del nombre
+            mime_type = (content_type or '').split(';')[0].strip().lower()
+            if not mime_type or mime_type == 'application/octet-stream':
+                mime_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
 
             try:
                 document = await self.upload_document_usecase.execute(
-                    file=file_obj,
-                    filename=file.filename,
-                    file_size=file_size,
-                    mime_type=file.content_type,
+                    chunks=request.stream(),
+                    filename=filename,
+                    file_size=content_length,
+                    mime_type=mime_type,
                     user_document=user_document,
                     application_id=application_id,
                     document_type=document_type,
-                    uploaded_by=user_id
+                    uploaded_by=None  # Usuario público
                 )
 
                 return DocumentResponse.model_validate(document)
 
+            except FileTooLargeError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=str(e)
+                )
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                )
+            except Exception as e:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Error al subir documento: {str(e)}"
+                )
+
+        @self.router.post(
+            "/uploads",
+            response_model=UploadSessionResponse,
+            status_code=status.HTTP_201_CREATED,
+            responses={
+                400: {"model": ErrorResponse},
+                413: {"model": ErrorResponse}
+            }
+        )
+        async def create_upload_session(
+            body: CreateUploadSessionRequest,
+            request: Request,
+            response: Response
+        ):
+            """
+            Iniciar una subida reanudable (público)
+
+            Devuelve la sesión y su URL en el header `Location`. El archivo se
+            envía después en uno o más `PUT` a esa URL, cada uno con el header
+            `Upload-Offset` indicando el byte en el que empieza el chunk.
+            """
+            mime_type = (body.mime_type or '').split(';')[0].strip().lower()
+            if not mime_type or mime_type == 'application/octet-stream':
+                mime_type = mimetypes.guess_type(body.filename)[0] or 'application/octet-stream'
+
+            try:
+                session = await self.resumable_upload_usecase.create(
+                    filename=body.filename,
+                    mime_type=mime_type,
+                    file_size=body.file_size,
+                    user_document=body.user_document,
+                    application_id=body.application_id,
+                    document_type=body.document_type,
+                    uploaded_by=None  # Usuario público
+                )
+            except FileTooLargeError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=str(e)
+                )
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                )
+
+            response.headers['Location'] = str(request.url_for('get_upload_session', session_id=session.id))
+            response.headers['Upload-Offset'] = '0'
+            return UploadSessionResponse.model_validate(session)
+
+        @self.router.post(
+            "/uploads/direct",
+            response_model=DirectUploadResponse,
+            status_code=status.HTTP_201_CREATED,
+            responses={
+                400: {"model": ErrorResponse},
+                413: {"model": ErrorResponse},
+                501: {"model": ErrorResponse}
+            }
+        )
+        async def create_direct_upload(body: CreateDirectUploadRequest):
+            """
+            Iniciar una subida directa al storage (público)
+
+            Devuelve una URL firmada: el cliente envía el archivo con
+            `upload_method` a `upload_url` incluyendo exactamente los
+            `upload_headers`, y luego llama a `/uploads/direct/{id}/complete`.
+            Responde 501 si el storage configurado no admite subidas directas.
+            """
+            mime_type = (body.mime_type or '').split(';')[0].strip().lower()
+            if not mime_type or mime_type == 'application/octet-stream':
+                mime_type = mimetypes.guess_type(body.filename)[0] or 'application/octet-stream'
+
+            try:
+                intent = await self.direct_upload_usecase.create(
+                    filename=body.filename,
+                    mime_type=mime_type,
+                    file_size=body.file_size,
+                    sha256=body.sha256,
+                    user_document=body.user_document,
+                    application_id=body.application_id,
+                    document_type=body.document_type,
+                    uploaded_by=None  # Usuario público
+                )
+            except NotImplementedError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                    detail=str(e)
+                )
+            except FileTooLargeError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=str(e)
+                )
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                )
+
+            return DirectUploadResponse(
+                id=intent.session.id,
+                file_size=intent.session.file_size,
+                expires_at=intent.session.expires_at,
+                upload_url=intent.upload.url,
+                upload_method=intent.upload.method,
+                upload_headers=intent.upload.headers,
+                upload_expires_in=intent.upload.expires_in
+            )
+
+        @self.router.post(
+            "/uploads/direct/{session_id}/complete",
+            response_model=DocumentResponse,
+            status_code=status.HTTP_201_CREATED,
+            responses={
+                400: {"model": ErrorResponse},
+                404: {"model": ErrorResponse},
+                409: {"model": ErrorResponse}
+            }
+        )
+        async def complete_direct_upload(session_id: str):
+            """
+            Verificar el archivo subido directamente al storage y crear el documento (público)
+
+            Responde 409 si el objeto todavía no existe en el storage y 400 si
+            no coincide con el tamaño, tipo o checksum declarados.
+            """
+            try:
+                document = await self.direct_upload_usecase.complete(session_id)
+            except UploadConflictError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=str(e)
+                )
             except ValueError as e:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -188,6 +610,172 @@ class DocumentController:
                     detail=f"Error al subir documento: {str(e)}"
                 )
 
+            if not document:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Subida no encontrada o vencida"
+                )
+
+            return DocumentResponse.model_validate(document)
+
+        @self.router.get(
+            "/uploads/{session_id}",
+            response_model=UploadSessionResponse,
+            responses={
+                404: {"model": ErrorResponse}
+            }
+        )
+        async def get_upload_session(session_id: str, response: Response):
+            """
+            Consultar el estado de una subida reanudable (público)
+
+            El header `Upload-Offset` indica desde qué byte debe continuar el
+            cliente después de un corte.
+            """
+            session = await self.resumable_upload_usecase.get(session_id)
+
+            if not session:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Subida no encontrada o vencida"
+                )
+
+            response.headers['Upload-Offset'] = str(session.received_size)
+            response.headers['Cache-Control'] = 'no-store'
+            return UploadSessionResponse.model_validate(session)
+
+        @self.router.put(
+            "/uploads/{session_id}",
+            response_model=UploadSessionResponse,
+            responses={
+                400: {"model": ErrorResponse},
+                404: {"model": ErrorResponse},
+                409: {"model": ErrorResponse}
+            }
+        )
+        async def append_upload_chunk(
+            session_id: str,
+            request: Request,
+            response: Response,
+            upload_offset: Optional[int] = Header(None)
+        ):
+            """
+            Enviar un chunk de una subida reanudable como cuerpo crudo (público)
+
+            - **Upload-Offset**: Byte en el que empieza el chunk; debe coincidir
+              con el offset actual de la sesión o se responde 409 con el offset
+              correcto en el mismo header
+            """
+            if upload_offset is None or upload_offset < 0:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Se requiere el header Upload-Offset"
+                )
+
+            try:
+                session = await self.resumable_upload_usecase.append(
+                    session_id, upload_offset, request.stream()
+                )
+            except UploadConflictError as e:
+                return JSONResponse(
+                    status_code=status.HTTP_409_CONFLICT,
+                    content={'detail': str(e)},
+                    headers={'Upload-Offset': str(e.offset)}
+                )
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                )
+            except Exception as e:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=str(e)
+                )
+
+            if not session:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Subida no encontrada o vencida"
+                )
+
+            response.headers['Upload-Offset'] = str(session.received_size)
+            return UploadSessionResponse.model_validate(session)
+
+        @self.router.post(
+            "/uploads/{session_id}/complete",
+            response_model=DocumentResponse,
+            status_code=status.HTTP_201_CREATED,
+            responses={
+                400: {"model": ErrorResponse},
+                404: {"model": ErrorResponse},
+                409: {"model": ErrorResponse}
+            }
+        )
+        async def complete_upload_session(session_id: str):
+            """
+            Finalizar una subida reanudable y crear el documento (público)
+
+            Responde 409 si todavía faltan bytes por enviar.
+            """
+            try:
+                document = await self.resumable_upload_usecase.complete(session_id)
+            except UploadConflictError as e:
+                return JSONResponse(
+                    status_code=status.HTTP_409_CONFLICT,
+                    content={'detail': str(e)},
+                    headers={'Upload-Offset': str(e.offset)}
+                )
+            except FileTooLargeError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=str(e)
+                )
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                )
+            except Exception as e:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Error al subir documento: {str(e)}"
+                )
+
+            if not document:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Subida no encontrada o vencida"
+                )
+
+            return DocumentResponse.model_validate(document)
+
+        @self.router.delete(
+            "/uploads/{session_id}",
+            status_code=status.HTTP_204_NO_CONTENT,
+            responses={
+                404: {"model": ErrorResponse},
+                409: {"model": ErrorResponse}
+            }
+        )
+        async def abort_upload_session(session_id: str):
+            """
+            Cancelar una subida reanudable y descartar los chunks recibidos (público)
+            """
+            try:
+                aborted = await self.resumable_upload_usecase.abort(session_id)
+            except UploadConflictError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=str(e)
+                )
+
+            if not aborted:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Subida no encontrada o vencida"
+                )
+
         @self.router.get(
             "/{document_id}/url",
             response_model=DocumentUrlResponse,
@@ -198,72 +786,257 @@ class DocumentController:
         )
         async def get_document_url(
             document_id: str,
-            credentials: HTTPAuthorizationCredentials = Depends(security)
+            payload: dict = Depends(self.require_auth)
         ):
             """
             Obtener URL de acceso a un documento
 
             - **document_id**: ID del documento
             """
-            # Verificar autenticación
-            from ...infrastructure.auth.jwt_service import JWTService
-            from ...config.config import get_settings
+            url = await self.get_document_url_usecase.execute(document_id)
 
-            settings = get_settings()
-            jwt_service = JWTService(settings.jwt_secret)
+            if url is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Documento no encontrado"
+                )
 
-            token = credentials.credentials
-            payload = jwt_service.verify_token(token)
+            return DocumentUrlResponse(document_id=document_id, url=url)
 
-            if payload is None:
+        @self.router.get(
+            "/{document_id}/content",
+            responses={
+                206: {"description": "Rango parcial del contenido"},
+                304: {"description": "El contenido no cambió"},
+                404: {"model": ErrorResponse},
+                401: {"model": ErrorResponse},
+                416: {"description": "Rango no satisfacible"}
+            }
+        )
+        async def get_document_content(
+            document_id: str,
+            range: Optional[str] = Header(None),
+            if_none_match: Optional[str] = Header(None),
+            if_range: Optional[str] = Header(None),
+            payload: dict = Depends(self.require_auth)
+        ):
+            """
+            Descargar el contenido de un documento
+
+            Soporta `Range` (un solo rango), `If-Range` e `If-None-Match`.
+            Los archivos locales se envían con sendfile cuando el servidor
+            lo permite; los de S3 se reenvían por chunks.
+
+            - **document_id**: ID del documento
+            """
+            content = await self.get_document_content_usecase.execute(document_id)
+
+            if content is None:
                 raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Token inválido o expirado"
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Documento no encontrado"
                 )
 
-            url = await self.get_document_url_usecase.execute(document_id)
+            document = content.document
+            headers = {
+                'ETag': content.etag,
+                'Cache-Control': 'private, max-age=3600',
+                'Accept-Ranges': 'bytes'
+            }
 
-            if url is None:
+            if etag_matches(if_none_match, content.etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+            # Con If-Range el rango solo vale si el cliente tiene esta misma versión
+            if if_range is not None and if_range.strip() != content.etag:
+                range = None
+
+            try:
+                byte_range = parse_range(range, content.size)
+            except RangeNotSatisfiableError:
+                return Response(
+                    status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                    headers={**headers, 'Content-Range': f"bytes */{content.size}"}
+                )
+
+            status_code = status.HTTP_200_OK
+
+            if byte_range is None:
+                byte_range = ByteRange(0, content.size - 1)
+            else:
+                status_code = status.HTTP_206_PARTIAL_CONTENT
+                headers['Content-Range'] = (
+                    f"bytes {byte_range.start}-{byte_range.end}/{content.size}"
+                )
+
+            headers['Content-Disposition'] = content_disposition(document.original_filename)
+
+            if content.local_path is not None:
+                if not os.path.isfile(content.local_path):
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail="Archivo no encontrado en el storage"
+                    )
+
+                return FileRangeResponse(
+                    content.local_path,
+                    byte_range,
+                    status_code=status_code,
+                    headers=headers,
+                    media_type=document.mime_type
+                )
+
+            chunks = self.get_document_content_usecase.open_range(
+                content, byte_range.start, byte_range.end
+            )
+
+            # Leer el primer chunk antes de responder para devolver 404 si no existe
+            try:
+                first_chunk = await anext(chunks, b'')
+            except FileNotFoundError:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Documento no encontrado"
+                    detail="Archivo no encontrado en el storage"
                 )
 
-            return DocumentUrlResponse(document_id=document_id, url=url)
+            async def body() -> AsyncIterator[bytes]:
+                yield first_chunk
+
+                async for chunk in chunks:
+                    yield chunk
+
+            headers['Content-Length'] = str(byte_range.length)
+
+            return StreamingResponse(
+                body(),
+                status_code=status_code,
+                headers=headers,
+                media_type=document.mime_type
+            )
 
         @self.router.get(
-            "/application/{application_id}",
-            response_model=List[DocumentResponse],
-            responses={401: {"model": ErrorResponse}}
+            "/{document_id}/thumbnail",
+            responses={
+                200: {"content": {"image/webp": {}}},
+                304: {"description": "La miniatura no cambió"},
+                404: {"model": ErrorResponse},
+                401: {"model": ErrorResponse}
+            }
         )
-        async def get_documents_by_application(
-            application_id: str,
-            credentials: HTTPAuthorizationCredentials = Depends(security)
+        async def get_document_thumbnail(
+            document_id: str,
+            if_none_match: Optional[str] = Header(None),
+            payload: dict = Depends(self.require_auth)
         ):
             """
-            Obtener todos los documentos de una postulación
+            Obtener una miniatura WebP de un documento de imagen (JPEG o PNG)
 
-            - **application_id**: ID de la postulación
+            Se genera la primera vez que se pide. Como depende solo del
+            contenido, se puede cachear de forma indefinida.
+
+            - **document_id**: ID del documento
             """
-            # Verificar autenticación
-            from ...infrastructure.auth.jwt_service import JWTService
-            from ...config.config import get_settings
+            try:
+                thumbnail = await self.get_document_thumbnail_usecase.execute(document_id)
+            except PreviewNotAvailableError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=str(e)
+                )
+
+            if thumbnail is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Documento no encontrado"
+                )
 
-            settings = get_settings()
-            jwt_service = JWTService(settings.jwt_secret)
+            headers = {
+                'ETag': thumbnail.etag,
+                'Cache-Control': 'private, max-age=31536000, immutable'
+            }
 
-            token = credentials.credentials
-            payload = jwt_service.verify_token(token)
+            if etag_matches(if_none_match, thumbnail.etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-            if payload is None:
+            try:
+                content = await self.get_document_thumbnail_usecase.load(thumbnail)
+            except FileNotFoundError:
                 raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Token inválido o expirado"
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Archivo no encontrado en el storage"
+                )
+            except PreviewNotAvailableError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=str(e)
                 )
 
-            documents = await self.get_documents_by_application_usecase.execute(application_id)
+            return Response(content=content, media_type=thumbnail.media_type, headers=headers)
 
-            return [DocumentResponse.model_validate(doc) for doc in documents]
+        @self.router.post(
+            "/urls",
+            response_model=DocumentUrlsResponse,
+            responses={
+                401: {"model": ErrorResponse},
+                422: {"model": ErrorResponse}
+            }
+        )
+        async def get_document_urls(
+            body: DocumentUrlsRequest,
+            payload: dict = Depends(self.require_auth)
+        ):
+            """
+            Obtener URLs de acceso de varios documentos en una sola petición
+
+            - **document_ids**: IDs de los documentos (máx 200)
+            """
+            urls = await self.get_document_urls_usecase.execute(body.document_ids)
+
+            return DocumentUrlsResponse(
+                urls=[
+                    DocumentUrlResponse(document_id=document_id, url=url)
+                    for document_id, url in urls.items()
+                ],
+                not_found=[
+                    document_id for document_id in dict.fromkeys(body.document_ids)
+                    if document_id not in urls
+                ]
+            )
+
+        @self.router.get(
+            "/application/{application_id}",
+            response_model=List[DocumentResponse],
+            responses={401: {"model": ErrorResponse}}
+        )
+        async def get_documents_by_application(
+            application_id: str,
+            limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+            cursor: Optional[str] = Query(None),
+            fields: Optional[str] = Query(None, description="Campos a incluir, separados por comas"),
+            include_urls: bool = Query(False, description="Incluir la URL de acceso de cada documento"),
+            if_none_match: Optional[str] = Header(None),
+            payload: dict = Depends(self.require_auth)
+        ):
+            """
+            Obtener los documentos de una postulación, paginados por cursor
+
+            - **application_id**: ID de la postulación
+            - **limit**: Tamaño de página (máx 200)
+            - **cursor**: Valor del header `X-Next-Cursor` de la página anterior
+            - **fields**: Campos a incluir, separados por comas (por defecto todos)
+            - **include_urls**: Incluir la URL de acceso de cada documento
+
+            Responde 304 si `If-None-Match` coincide con el ETag del listado.
+            """
+            return await self._list_documents(
+                self.get_documents_by_application_usecase,
+                application_id,
+                limit,
+                cursor,
+                fields,
+                include_urls,
+                if_none_match
+            )
 
         @self.router.get(
             "/user/{user_document}",
@@ -272,32 +1045,33 @@ class DocumentController:
         )
         async def get_documents_by_user(
             user_document: str,
-            credentials: HTTPAuthorizationCredentials = Depends(security)
+            limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+            cursor: Optional[str] = Query(None),
+            fields: Optional[str] = Query(None, description="Campos a incluir, separados por comas"),
+            include_urls: bool = Query(False, description="Incluir la URL de acceso de cada documento"),
+            if_none_match: Optional[str] = Header(None),
+            payload: dict = Depends(self.require_auth)
         ):
             """
-            Obtener todos los documentos de un usuario
+            Obtener los documentos de un usuario, paginados por cursor
 
             - **user_document**: Número de documento del usuario
-            """
-            # Verificar autenticación
-            from ...infrastructure.auth.jwt_service import JWTService
-            from ...config.config import get_settings
-
-            settings = get_settings()
-            jwt_service = JWTService(settings.jwt_secret)
-
-            token = credentials.credentials
-            payload = jwt_service.verify_token(token)
-
-            if payload is None:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Token inválido o expirado"
-                )
+            - **limit**: Tamaño de página (máx 200)
+            - **cursor**: Valor del header `X-Next-Cursor` de la página anterior
+            - **fields**: Campos a incluir, separados por comas (por defecto todos)
+            - **include_urls**: Incluir la URL de acceso de cada documento
 
-            documents = await self.get_documents_by_user_usecase.execute(user_document)
-
-            return [DocumentResponse.model_validate(doc) for doc in documents]
+            Responde 304 si `If-None-Match` coincide con el ETag del listado.
+            """
+            return await self._list_documents(
+                self.get_documents_by_user_usecase,
+                user_document,
+                limit,
+                cursor,
+                fields,
+                include_urls,
+                if_none_match
+            )
 
         @self.router.delete(
             "/{document_id}",
@@ -310,37 +1084,13 @@ class DocumentController:
         )
         async def delete_document(
             document_id: str,
-            credentials: HTTPAuthorizationCredentials = Depends(security)
+            payload: dict = Depends(self.require_staff)
         ):
             """
             Eliminar un documento (solo admin y recruiter)
 
             - **document_id**: ID del documento
             """
-            # Verificar autenticación y rol
-            from ...infrastructure.auth.jwt_service import JWTService
-            from ...config.config import get_settings
-
-            settings = get_settings()
-            jwt_service = JWTService(settings.jwt_secret)
-
-            token = credentials.credentials
-            payload = jwt_service.verify_token(token)
-
-            if payload is None:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Token inválido o expirado"
-                )
-
-            # Verificar rol
-            user_role = payload.get('role')
-            if user_role not in ['admin', 'recruiter']:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="No tienes permisos para eliminar documentos"
-                )
-
             deleted = await self.delete_document_usecase.execute(document_id)
 
             if not deleted:
@@ -351,3 +1101,37 @@ class DocumentController:
 
             return None
 
+        @self.router.delete(
+            "/application/{application_id}",
+            response_model=DeleteApplicationDocumentsResponse,
+            responses={
+                400: {"model": ErrorResponse},
+                401: {"model": ErrorResponse},
+                403: {"model": ErrorResponse}
+            }
+        )
+        async def delete_application_documents(
+            application_id: str,
+            payload: dict = Depends(self.require_staff)
+        ):
+            """
+            Eliminar todos los documentos de una postulación (solo admin y recruiter)
+
+            Las filas se eliminan en una sola sentencia y los archivos que
+            quedan sin referencias se encolan para el worker de limpieza.
+
+            - **application_id**: ID de la postulación
+            """
+            try:
+                result = await self.delete_application_documents_usecase.execute(application_id)
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                )
+
+            return DeleteApplicationDocumentsResponse(
+                application_id=application_id,
+                deleted=len(result.deleted_ids),
+                files_queued=len(result.queued_paths)
+            )
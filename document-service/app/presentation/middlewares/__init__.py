@@ -2,5 +2,7 @@
 Presentation Middlewares
 """
 from .auth_middleware import require_auth, require_roles, security
+from .metrics_middleware import MetricsMiddleware
+from .tracing_middleware import TracingMiddleware
 
-__all__ = ['require_auth', 'require_roles', 'security']
+__all__ = ['require_auth', 'require_roles', 'security', 'MetricsMiddleware', 'TracingMiddleware']
@@ -1,7 +1,7 @@
 """
 Middleware de autenticación JWT
 """
-from fastapi import HTTPException, status, Request
+from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
 from ...infrastructure.auth.jwt_service import JWTService
@@ -19,7 +19,7 @@ class AuthMiddleware:
     async def __call__(
         self, 
         request: Request,
-        credentials: HTTPAuthorizationCredentials
+        credentials: HTTPAuthorizationCredentials = Depends(security)
     ) -> dict:
         """
         Verificar token JWT
@@ -63,12 +63,13 @@ def require_roles(jwt_service: JWTService, allowed_roles: list[str]):
         jwt_service: Servicio JWT
         allowed_roles: Lista de roles permitidos
     """
+    auth_middleware = AuthMiddleware(jwt_service)
+    
     async def check_roles(
         request: Request,
-        credentials: HTTPAuthorizationCredentials
+        credentials: HTTPAuthorizationCredentials = Depends(security)
     ) -> dict:
         # Primero verificar autenticación
-        auth_middleware = AuthMiddleware(jwt_service)
         payload = await auth_middleware(request, credentials)
         
         # Verificar rol
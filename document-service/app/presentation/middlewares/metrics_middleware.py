@@ -0,0 +1,84 @@
+"""
+Middleware de métricas HTTP
+"""
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from ...infrastructure.metrics.registry import MetricsRegistry, SIZE_BUCKETS
+from .route_templates import RouteTemplates
+
+
+# Métodos cuyo cuerpo se cuenta en el histograma de tamaños
+BODY_METHODS = frozenset({'POST', 'PUT', 'PATCH'})
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI que mide cada petición HTTP por ruta
+
+    El label `route` es la plantilla de la ruta (`/api/v1/documents/{document_id}`),
+    no la URL: así el número de series queda acotado.
+
+    Es ASGI puro y no BaseHTTPMiddleware para no añadir una tarea ni
+    copiar el cuerpo de las respuestas en streaming.
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry):
+        self.app = app
+        self.requests = registry.counter(
+            'http_requests_total', 'Peticiones HTTP atendidas', ('method', 'route', 'status')
+        )
+        self.duration = registry.histogram(
+            'http_request_duration_seconds',
+            'Duración de las peticiones HTTP hasta terminar la respuesta',
+            ('method', 'route')
+        )
+        self.in_flight = registry.gauge(
+            'http_requests_in_flight', 'Peticiones HTTP en curso', ('method',)
+        )
+        self.body_size = registry.histogram(
+            'http_request_body_bytes',
+            'Tamaño del cuerpo de las peticiones con contenido (subidas)',
+            ('method', 'route'),
+            buckets=SIZE_BUCKETS
+        )
+        self._routes = RouteTemplates()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        method = scope['method']
+        status_code = 500
+        body_size = 0
+        count_body = method in BODY_METHODS
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        async def receive_wrapper() -> Message:
+            nonlocal body_size
+            message = await receive()
+            if message['type'] == 'http.request':
+                body_size += len(message.get('body', b''))
+            return message
+
+        self.in_flight.inc(method)
+        started = time.perf_counter()
+
+        try:
+            await self.app(scope, receive_wrapper if count_body else receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.in_flight.dec(method)
+
+            # El router escribe el endpoint en este mismo scope
+            route = self._routes.resolve(scope)
+            self.requests.inc(method, route, str(status_code))
+            self.duration.observe(method, route, value=elapsed)
+
+            if count_body:
+                self.body_size.observe(method, route, value=body_size)
@@ -0,0 +1,49 @@
+"""
+Plantilla de ruta de una petición ya enrutada
+"""
+from starlette.routing import Mount
+from starlette.types import Scope
+
+
+UNMATCHED_ROUTE = '<unmatched>'
+
+
+class RouteTemplates:
+    """
+    Resuelve la plantilla de la ruta (`/api/v1/documents/{document_id}`)
+    que atendió una petición, para usarla como label o nombre de span sin
+    multiplicar las series por cada URL distinta
+
+    Se parte del endpoint que el router deja en el scope, con un diccionario
+    endpoint -> plantilla que se reconstruye solo cuando aparece un endpoint
+    nuevo (las rutas de documentos se incluyen en el lifespan).
+    """
+
+    def __init__(self):
+        self._routes: dict = {}
+
+    def resolve(self, scope: Scope) -> str:
+        endpoint = scope.get('endpoint')
+
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+
+        route = self._routes.get(endpoint)
+
+        if route is None:
+            self._routes = self._build(scope['app'].routes)
+            route = self._routes.get(endpoint, UNMATCHED_ROUTE)
+
+        return route
+
+    @staticmethod
+    def _build(routes) -> dict:
+        mapping = {}
+
+        for route in routes:
+            if isinstance(route, Mount):
+                mapping[route.app] = route.path + '/{path}'
+            elif getattr(route, 'endpoint', None) is not None:
+                mapping[route.endpoint] = route.path
+
+        return mapping
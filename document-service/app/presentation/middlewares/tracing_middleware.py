@@ -0,0 +1,82 @@
+"""
+Middleware de tracing HTTP
+"""
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from ...infrastructure.tracing.tracer import Tracer, NOOP_SPAN
+from .metrics_middleware import BODY_METHODS
+from .route_templates import RouteTemplates
+
+
+class TracingMiddleware:
+    """
+    Middleware ASGI que abre el span raíz de cada petición muestreada
+
+    Todo lo que se ejecute dentro de la petición (casos de uso,
+    repositorios, SQL) cuelga de este span. La recepción del cuerpo queda
+    en un hijo `http.request_body`: en las subidas multipart coincide con
+    el parseo del formulario, que FastAPI hace antes de llamar al endpoint.
+
+    Las peticiones trazadas devuelven el header `X-Trace-Id` para poder
+    buscar la traza de una subida lenta concreta.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: Tracer):
+        self.app = app
+        self.tracer = tracer
+        self._routes = RouteTemplates()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        method = scope['method']
+        root = self.tracer.start_trace(method, {'http.method': method, 'http.target': scope['path']})
+
+        if root is NOOP_SPAN:
+            await self.app(scope, receive, send)
+            return
+
+        body_span = None
+
+        async def receive_wrapper() -> Message:
+            nonlocal body_span
+            if body_span is None:
+                body_span = self.tracer.start_span('http.request_body', {'http.request_body_bytes': 0})
+
+            message = await receive()
+
+            if message['type'] == 'http.request':
+                body_span.add('http.request_body_bytes', len(message.get('body', b'')))
+                if not message.get('more_body', False):
+                    body_span.end()
+            else:
+                body_span.end()
+
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                root.set_attribute('http.status_code', status_code)
+
+                if status_code >= 500:
+                    root.error = f"HTTP {status_code}"
+
+                headers = list(message.get('headers', []))
+                headers.append((b'x-trace-id', root.trace_id.encode()))
+                message = {**message, 'headers': headers}
+
+            await send(message)
+
+        with self.tracer.activate(root):
+            try:
+                await self.app(scope, receive_wrapper if method in BODY_METHODS else receive, send_wrapper)
+            finally:
+                # El router escribe el endpoint en este mismo scope
+                route = self._routes.resolve(scope)
+                root.name = f"{method} {route}"
+                root.set_attribute('http.route', route)
+
+                if body_span is not None:
+                    body_span.end()
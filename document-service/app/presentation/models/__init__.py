@@ -5,6 +5,15 @@ from .document_models import (
     UploadDocumentRequest,
     DocumentResponse,
     DocumentUrlResponse,
+    DocumentUrlsRequest,
+    DocumentUrlsResponse,
+    BulkUploadError,
+    BulkUploadResponse,
+    DeleteApplicationDocumentsResponse,
+    CreateUploadSessionRequest,
+    UploadSessionResponse,
+    CreateDirectUploadRequest,
+    DirectUploadResponse,
     ErrorResponse
 )
 
@@ -12,5 +21,14 @@ __all__ = [
     'UploadDocumentRequest',
     'DocumentResponse',
     'DocumentUrlResponse',
+    'DocumentUrlsRequest',
+    'DocumentUrlsResponse',
+    'BulkUploadError',
+    'BulkUploadResponse',
+    'DeleteApplicationDocumentsResponse',
+    'CreateUploadSessionRequest',
+    'UploadSessionResponse',
+    'CreateDirectUploadRequest',
+    'DirectUploadResponse',
     'ErrorResponse'
 ]
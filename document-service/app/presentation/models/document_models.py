@@ -3,7 +3,7 @@ Modelos de presentación - DTOs
 """
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 class UploadDocumentRequest(BaseModel):
@@ -26,6 +26,8 @@ class DocumentResponse(BaseModel):
     document_type: str
     uploaded_at: datetime
     uploaded_by: Optional[str]
+    content_hash: Optional[str] = None
+    url: Optional[str] = None
     
     class Config:
         from_attributes = True
@@ -37,6 +39,77 @@ class DocumentUrlResponse(BaseModel):
     url: str
 
 
+class DocumentUrlsRequest(BaseModel):
+    """Request para resolver URLs de varios documentos"""
+    document_ids: List[str] = Field(..., min_length=1, max_length=200, description="IDs de los documentos")
+
+
+class DocumentUrlsResponse(BaseModel):
+    """Response con las URLs de varios documentos"""
+    urls: List[DocumentUrlResponse]
+    not_found: List[str]
+
+
+class BulkUploadError(BaseModel):
+    """Error de un archivo dentro de una carga masiva"""
+    index: int
+    filename: str
+    status_code: int
+    detail: str
+
+
+class BulkUploadResponse(BaseModel):
+    """Response de una carga masiva: documentos creados y archivos rechazados"""
+    documents: List[DocumentResponse]
+    errors: List[BulkUploadError]
+
+
+class DeleteApplicationDocumentsResponse(BaseModel):
+    """Response del borrado de todos los documentos de una postulación"""
+    application_id: str
+    deleted: int
+    files_queued: int
+
+
+class CreateUploadSessionRequest(BaseModel):
+    """Request para iniciar una subida reanudable"""
+    user_document: str = Field(..., description="Número de documento del usuario")
+    application_id: str = Field(..., description="ID de la postulación")
+    document_type: str = Field(..., description="Tipo de documento (cv, carta_presentacion, etc)")
+    filename: str = Field(..., max_length=255, description="Nombre original del archivo")
+    file_size: int = Field(..., description="Tamaño total del archivo en bytes")
+    mime_type: Optional[str] = Field(None, description="Tipo MIME; si falta se deduce del nombre")
+
+
+class UploadSessionResponse(BaseModel):
+    """Response con el estado de una subida reanudable"""
+    id: str
+    filename: str
+    file_size: int
+    received_size: int
+    status: str
+    expires_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class CreateDirectUploadRequest(CreateUploadSessionRequest):
+    """Request para subir un archivo directo al storage con una URL firmada"""
+    sha256: str = Field(..., pattern=r'^[0-9a-fA-F]{64}$', description="SHA-256 del contenido (hex)")
+
+
+class DirectUploadResponse(BaseModel):
+    """Response con la petición firmada que el cliente debe enviar al storage"""
+    id: str
+    file_size: int
+    expires_at: Optional[datetime] = None
+    upload_url: str
+    upload_method: str
+    upload_headers: Dict[str, str]
+    upload_expires_in: int
+
+
 class ErrorResponse(BaseModel):
     """Response para errores"""
     detail: str
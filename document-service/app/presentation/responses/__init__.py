@@ -0,0 +1,20 @@
+"""
+Presentation Responses
+"""
+from .range_response import (
+    ByteRange,
+    RangeNotSatisfiableError,
+    FileRangeResponse,
+    parse_range,
+    etag_matches,
+    content_disposition
+)
+
+__all__ = [
+    'ByteRange',
+    'RangeNotSatisfiableError',
+    'FileRangeResponse',
+    'parse_range',
+    'etag_matches',
+    'content_disposition'
+]
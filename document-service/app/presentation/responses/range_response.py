@@ -0,0 +1,171 @@
+"""
+Respuestas HTTP con soporte de Range y ETag
+"""
+from typing import Mapping, NamedTuple, Optional
+from urllib.parse import quote
+import anyio
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+
+class ByteRange(NamedTuple):
+    """Rango de bytes inclusivo"""
+    start: int
+    end: int
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+
+class RangeNotSatisfiableError(Exception):
+    """El rango pedido empieza después del final del archivo (416)"""
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[ByteRange]:
+    """
+    Interpretar un header `Range` de un solo rango
+
+    Las cabeceras mal formadas, con otra unidad o con varios rangos se
+    ignoran y se sirve el archivo completo, como permite RFC 9110.
+
+    Args:
+        header: Valor del header `Range`
+        size: Tamaño total del archivo
+
+    Returns:
+        ByteRange o None para servir el archivo completo
+
+    Raises:
+        RangeNotSatisfiableError: Si ningún byte del rango existe
+    """
+    if not header:
+        return None
+
+    unit, _, spec = header.partition('=')
+    spec = spec.strip()
+
+    if unit.strip().lower() != 'bytes' or ',' in spec:
+        return None
+
+    first, separator, last = spec.partition('-')
+
+    if not separator or not (first.strip().isdigit() or last.strip().isdigit()):
+        return None
+
+    if first.strip() == '':
+        # Sufijo: los últimos N bytes
+        suffix = int(last)
+
+        if suffix == 0:
+            raise RangeNotSatisfiableError()
+
+        return ByteRange(max(size - suffix, 0), size - 1)
+
+    if not first.strip().isdigit() or (last.strip() and not last.strip().isdigit()):
+        return None
+
+    start = int(first)
+    end = int(last) if last.strip() else size - 1
+
+    if last.strip() and end < start:
+        return None
+
+    if start >= size:
+        raise RangeNotSatisfiableError()
+
+    return ByteRange(start, min(end, size - 1))
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """Comparación débil de `If-None-Match` contra el ETag actual"""
+    if not header:
+        return False
+
+    if header.strip() == '*':
+        return True
+
+    opaque = etag.removeprefix('W/')
+    candidates = (candidate.strip() for candidate in header.split(','))
+    return any(candidate.removeprefix('W/') == opaque for candidate in candidates)
+
+
+def content_disposition(filename: str, disposition_type: str = 'inline') -> str:
+    """Header Content-Disposition con soporte de nombres no ASCII"""
+    quoted = quote(filename)
+
+    if quoted != filename:
+        return f"{disposition_type}; filename*=utf-8''{quoted}"
+
+    return f'{disposition_type}; filename="{filename}"'
+
+
+class FileRangeResponse(Response):
+    """
+    Respuesta con un rango de un archivo local
+
+    Si el servidor ASGI ofrece la extensión `http.response.zerocopysend`
+    el archivo se envía con sendfile, sin pasar los bytes por Python; si
+    no, se lee por chunks en un hilo.
+    """
+
+    chunk_size = 256 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        byte_range: ByteRange,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None
+    ):
+        self.path = path
+        self.byte_range = byte_range
+        self.status_code = status_code
+        self.media_type = media_type
+        self.background = None
+        self.init_headers(headers)
+        self.headers['content-length'] = str(byte_range.length)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Abrir antes de enviar los headers para fallar limpio si no existe
+        file = await anyio.to_thread.run_sync(open, self.path, 'rb')
+
+        try:
+            await send({
+                'type': 'http.response.start',
+                'status': self.status_code,
+                'headers': self.raw_headers
+            })
+
+            if 'http.response.zerocopysend' in scope.get('extensions', {}):
+                await send({
+                    'type': 'http.response.zerocopysend',
+                    'file': file,
+                    'offset': self.byte_range.start,
+                    'count': self.byte_range.length,
+                    'more_body': False
+                })
+                return
+
+            await anyio.to_thread.run_sync(file.seek, self.byte_range.start)
+            remaining = self.byte_range.length
+
+            while remaining > 0:
+                chunk = await anyio.to_thread.run_sync(file.read, min(self.chunk_size, remaining))
+
+                if not chunk:
+                    break
+
+                remaining -= len(chunk)
+                await send({
+                    'type': 'http.response.body',
+                    'body': chunk,
+                    'more_body': remaining > 0
+                })
+
+            if remaining > 0 or self.byte_range.length == 0:
+                # Archivo vacío, o que se acortó mientras se enviaba
+                await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+        finally:
+            await anyio.to_thread.run_sync(file.close)
@@ -0,0 +1,3 @@
+"""
+Benchmarks del Document Service
+"""
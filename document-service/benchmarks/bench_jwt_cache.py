@@ -0,0 +1,53 @@
+"""
+Microbenchmark: verificaciones de JWT por segundo con y sin caché
+
+Simula el patrón de los recruiters: pocos tokens distintos que se
+verifican una y otra vez mientras se consultan los listados.
+
+Uso (desde document-service/):
+    python -m benchmarks.bench_jwt_cache --iterations 50000 --tokens 20
+"""
+import argparse
+import time
+from jose import jwt
+from app.infrastructure.auth import JWTService, CachedJWTService
+
+
+SECRET = 'bench_secret'
+
+
+def build_tokens(count: int) -> list[str]:
+    exp = int(time.time()) + 3600
+    return [
+        jwt.encode({'sub': f'user-{i}', 'role': 'recruiter', 'exp': exp}, SECRET, algorithm='HS256')
+        for i in range(count)
+    ]
+
+
+def measure(service: JWTService, tokens: list[str], iterations: int) -> float:
+    """Verificaciones por segundo"""
+    started = time.perf_counter()
+    for i in range(iterations):
+        assert service.verify_token(tokens[i % len(tokens)]) is not None
+    return iterations / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=50000)
+    parser.add_argument('--tokens', type=int, default=20)
+    args = parser.parse_args()
+
+    tokens = build_tokens(args.tokens)
+    plain = measure(JWTService(SECRET), tokens, args.iterations)
+    cached_service = CachedJWTService(SECRET)
+    cached = measure(cached_service, tokens, args.iterations)
+
+    print(f"{'servicio':<20}{'verif/s':>14}")
+    print(f"{'JWTService':<20}{plain:>14,.0f}")
+    print(f"{'CachedJWTService':<20}{cached:>14,.0f}")
+    print(f"speedup: {cached / plain:.1f}x  (hits={cached_service.cache.hits}, misses={cached_service.cache.misses})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Microbenchmark: coste por petición de MetricsMiddleware
+
+Llama a la app ASGI directamente (sin servidor ni cliente HTTP, que
+taparían la diferencia) con una ruta parametrizada mínima, con y sin el
+middleware, y mide también `Histogram.observe` y `MetricsRegistry.render`
+por separado.
+
+Uso (desde document-service/):
+    python -m benchmarks.bench_metrics_overhead --requests 50000
+"""
+import argparse
+import asyncio
+import time
+from fastapi import FastAPI
+from app.infrastructure.metrics import MetricsRegistry
+from app.presentation.middlewares import MetricsMiddleware
+
+
+def build_app(registry: MetricsRegistry = None) -> FastAPI:
+    app = FastAPI()
+
+    @app.get('/items/{item_id}')
+    async def get_item(item_id: str):
+        return {'id': item_id}
+
+    if registry is not None:
+        app.add_middleware(MetricsMiddleware, registry=registry)
+
+    return app
+
+
+async def measure(app: FastAPI, requests: int) -> float:
+    """Microsegundos por petición"""
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        pass
+
+    def scope(i: int) -> dict:
+        return {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+            'method': 'GET', 'scheme': 'http', 'path': f'/items/{i % 100}', 'raw_path': b'',
+            'root_path': '', 'query_string': b'', 'headers': [], 'server': ('bench', 80), 'client': None
+        }
+
+    # Calentar: construye el middleware stack y el mapa de rutas
+    for i in range(100):
+        await app(scope(i), receive, send)
+
+    started = time.perf_counter()
+    for i in range(requests):
+        await app(scope(i), receive, send)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=50000)
+    parser.add_argument('--series', type=int, default=50, help='Series del histograma al medir render()')
+    args = parser.parse_args()
+
+    plain = await measure(build_app(), args.requests)
+    registry = MetricsRegistry()
+    instrumented = await measure(build_app(registry), args.requests)
+
+    histogram = registry.histogram('bench_seconds', 'bench', ('route',))
+    started = time.perf_counter()
+    for i in range(args.requests):
+        histogram.observe(f'/route/{i % args.series}', value=(i % 1000) / 10000)
+    observe_us = (time.perf_counter() - started) / args.requests * 1e6
+
+    started = time.perf_counter()
+    text = registry.render()
+    render_ms = (time.perf_counter() - started) * 1000
+
+    print(f"{'app':<20}{'us/petición':>14}")
+    print(f"{'sin métricas':<20}{plain:>14.1f}")
+    print(f"{'MetricsMiddleware':<20}{instrumented:>14.1f}")
+    print(f"overhead: {instrumented - plain:.1f} us/petición ({(instrumented / plain - 1) * 100:.1f}%)")
+    print(f"Histogram.observe: {observe_us:.2f} us")
+    print(f"render(): {render_ms:.2f} ms para {len(text.splitlines())} líneas")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,131 @@
+"""
+Benchmark: subida multipart (/upload/public) vs cuerpo crudo (PUT /raw)
+
+Ejecuta ambas rutas contra el DocumentController real con storage local en
+un directorio temporal y un repositorio de documentos en memoria, de modo
+que la diferencia medida es el coste de parsear la petición.
+
+Uso (desde document-service/):
+    python -m benchmarks.bench_raw_upload --size-mb 10 --requests 50 --concurrency 8
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+import httpx
+from fastapi import FastAPI
+from app.application.usecases import UploadDocumentUseCase
+from app.infrastructure.auth import JWTService
+from app.infrastructure.storage import LocalStorageRepository
+from app.presentation.controllers.document_controller import DocumentController
+from .support import InMemoryDocumentRepository, percentile
+
+
+def build_app(storage_path: str) -> FastAPI:
+    """App mínima con solo las rutas de subida"""
+    upload_usecase = UploadDocumentUseCase(
+        document_repository=InMemoryDocumentRepository(),
+        storage_repository=LocalStorageRepository(storage_path)
+    )
+    controller = DocumentController(
+        upload_document_usecase=upload_usecase,
+        bulk_upload_documents_usecase=None,
+        get_document_url_usecase=None,
+        get_document_urls_usecase=None,
+        get_document_content_usecase=None,
+        get_document_thumbnail_usecase=None,
+        get_documents_by_application_usecase=None,
+        get_documents_by_user_usecase=None,
+        delete_document_usecase=None,
+        delete_application_documents_usecase=None,
+        resumable_upload_usecase=None,
+        direct_upload_usecase=None,
+        jwt_service=JWTService('bench')
+    )
+    app = FastAPI()
+    app.include_router(controller.router, prefix='/api/v1/documents')
+    return app
+
+
+async def upload_multipart(client: httpx.AsyncClient, payload: bytes) -> httpx.Response:
+    return await client.post(
+        '/api/v1/documents/upload/public',
+        files={'file': ('cv.pdf', payload, 'application/pdf')},
+        data={'user_document': '1234567890', 'application_id': 'bench', 'document_type': 'cv'}
+    )
+
+
+async def upload_raw(client: httpx.AsyncClient, payload: bytes) -> httpx.Response:
+    return await client.put(
+        '/api/v1/documents/raw',
+        content=payload,
+        params={'user_document': '1234567890', 'application_id': 'bench', 'document_type': 'cv', 'filename': 'cv.pdf'},
+        headers={'Content-Type': 'application/octet-stream'}
+    )
+
+
+async def run(name: str, upload, payload: bytes, requests: int, concurrency: int) -> dict:
+    storage_path = tempfile.mkdtemp(prefix='bench_upload_')
+    app = build_app(storage_path)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://bench') as client:
+        # Calentamiento
+        await upload(client, payload)
+
+        async def one():
+            async with semaphore:
+                started = time.perf_counter()
+                response = await upload(client, payload)
+                latencies.append(time.perf_counter() - started)
+                response.raise_for_status()
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        cpu = time.process_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+
+    shutil.rmtree(storage_path, ignore_errors=True)
+    total_mb = len(payload) * requests / (1024 * 1024)
+
+    return {
+        'endpoint': name,
+        'requests': requests,
+        'throughput_mb_s': total_mb / wall,
+        'requests_s': requests / wall,
+        'cpu_ms_per_mb': cpu * 1000 / total_mb,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size-mb', type=float, default=10)
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+
+    # Contenido de PDF simulado, sin exceder el límite de 10 MB
+    size = min(int(args.size_mb * 1024 * 1024), 10 * 1024 * 1024)
+    payload = b'%PDF-1.7\n' + os.urandom(size - 9)
+
+    results = [
+        await run('/upload/public (multipart)', upload_multipart, payload, args.requests, args.concurrency),
+        await run('/raw (octet-stream)', upload_raw, payload, args.requests, args.concurrency),
+    ]
+
+    print(f"{'endpoint':<30}{'MB/s':>10}{'req/s':>10}{'CPU ms/MB':>12}{'p50 ms':>10}{'p99 ms':>10}")
+    for r in results:
+        print(
+            f"{r['endpoint']:<30}{r['throughput_mb_s']:>10.1f}{r['requests_s']:>10.1f}"
+            f"{r['cpu_ms_per_mb']:>12.2f}{r['p50_ms']:>10.1f}{r['p99_ms']:>10.1f}"
+        )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
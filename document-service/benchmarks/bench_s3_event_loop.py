@@ -0,0 +1,188 @@
+"""
+Benchmark: latencia de los listados durante ráfagas de subidas a S3
+
+Sirve en el mismo event loop un listado por postulación y subidas por
+PUT /raw a un bucket real, y mide la latencia del listado en tres
+escenarios:
+
+- idle: solo listados, sin subidas
+- blocking: subidas con boto3 llamado directamente en el event loop
+  (el comportamiento anterior de S3StorageRepository)
+- pooled: subidas con S3StorageRepository, que ejecuta boto3 en su pool
+  de hilos acotado
+
+Con boto3 en el event loop cada PUT congela todas las demás peticiones
+mientras dura; el p99 del listado crece con el tamaño y la cantidad de
+subidas. Con el pool el listado debería quedarse cerca de idle.
+
+Necesita un servicio compatible con S3, por ejemplo el MinIO de
+docker-compose (`docker compose --profile s3 up -d minio minio-setup`).
+
+Uso (desde document-service/):
+    python -m benchmarks.bench_s3_event_loop --endpoint-url http://localhost:9000 --bucket documents
+    python -m benchmarks.bench_s3_event_loop --uploads 64 --upload-concurrency 16 --size-mb 4
+"""
+import argparse
+import asyncio
+import os
+import time
+import uuid
+import httpx
+from fastapi import FastAPI
+from jose import jwt
+from app.application.usecases import UploadDocumentUseCase, GetDocumentsByApplicationUseCase
+from app.infrastructure.auth import JWTService
+from app.infrastructure.storage.s3_storage import S3StorageRepository
+from app.presentation.controllers.document_controller import DocumentController
+from .support import InMemoryDocumentRepository, percentile
+
+
+SECRET = 'bench_secret'
+APPLICATION_ID = str(uuid.uuid4())
+
+
+class BlockingS3StorageRepository(S3StorageRepository):
+    """Comportamiento anterior: cada llamada a boto3 bloquea el event loop"""
+
+    async def _call(self, method, /, *args, **kwargs):
+        return method(*args, **kwargs)
+
+
+def build_app(storage: S3StorageRepository) -> FastAPI:
+    """App mínima con la subida cruda y el listado por postulación"""
+    repository = InMemoryDocumentRepository()
+    controller = DocumentController(
+        upload_document_usecase=UploadDocumentUseCase(repository, storage),
+        bulk_upload_documents_usecase=None,
+        get_document_url_usecase=None,
+        get_document_urls_usecase=None,
+        get_document_content_usecase=None,
+        get_document_thumbnail_usecase=None,
+        get_documents_by_application_usecase=GetDocumentsByApplicationUseCase(repository),
+        get_documents_by_user_usecase=None,
+        delete_document_usecase=None,
+        delete_application_documents_usecase=None,
+        resumable_upload_usecase=None,
+        direct_upload_usecase=None,
+        jwt_service=JWTService(SECRET)
+    )
+    app = FastAPI()
+    app.include_router(controller.router, prefix='/api/v1/documents')
+    return app
+
+
+async def run(name: str, storage: S3StorageRepository, args, payload: bytes) -> dict:
+    app = build_app(storage)
+    token = jwt.encode({'sub': 'bench', 'role': 'recruiter', 'exp': int(time.time()) + 3600}, SECRET, algorithm='HS256')
+    headers = {'Authorization': f'Bearer {token}'}
+    semaphore = asyncio.Semaphore(args.upload_concurrency)
+    uploaded_keys = []
+    latencies = []
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://bench') as client:
+        async def upload():
+            async with semaphore:
+                response = await client.put(
+                    '/api/v1/documents/raw',
+                    content=payload,
+                    params={
+                        'user_document': '1234567890',
+                        'application_id': APPLICATION_ID,
+                        'document_type': 'cv',
+                        # Contenido distinto por subida: sin deduplicación
+                        'filename': f'cv-{uuid.uuid4().hex}.pdf'
+                    },
+                    headers={'Content-Type': 'application/pdf'}
+                )
+                response.raise_for_status()
+                uploaded_keys.append(response.json()['file_path'])
+
+        async def probe():
+            # La latencia se mide desde el instante en que tocaba enviar la
+            # petición: si el event loop está bloqueado, la espera cuenta
+            scheduled = time.perf_counter()
+
+            while not done.is_set():
+                await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+                response = await client.get(f'/api/v1/documents/application/{APPLICATION_ID}', headers=headers)
+                finished = time.perf_counter()
+                latencies.append(finished - scheduled)
+                response.raise_for_status()
+                scheduled = max(scheduled + args.probe_interval, finished)
+
+        probes = [asyncio.create_task(probe()) for _ in range(args.probes)]
+        started = time.perf_counter()
+
+        if args.uploads and name != 'idle':
+            await asyncio.gather(*(upload() for _ in range(args.uploads)))
+        else:
+            await asyncio.sleep(args.idle_seconds)
+
+        wall = time.perf_counter() - started
+        done.set()
+        await asyncio.gather(*probes)
+
+    for key in uploaded_keys:
+        await storage.delete_file(key)
+
+    return {
+        'scenario': name,
+        'wall_s': wall,
+        'probes': len(latencies),
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'max_ms': max(latencies, default=0) * 1000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--endpoint-url', default=os.environ.get('S3_ENDPOINT_URL', 'http://localhost:9000'))
+    parser.add_argument('--bucket', default=os.environ.get('S3_BUCKET_NAME', 'documents'))
+    parser.add_argument('--access-key', default=os.environ.get('AWS_ACCESS_KEY_ID', 'minioadmin'))
+    parser.add_argument('--secret-key', default=os.environ.get('AWS_SECRET_ACCESS_KEY', 'minioadmin'))
+    parser.add_argument('--region', default=os.environ.get('AWS_REGION', 'us-east-1'))
+    parser.add_argument('--uploads', type=int, default=32)
+    parser.add_argument('--upload-concurrency', type=int, default=8)
+    parser.add_argument('--size-mb', type=float, default=2)
+    parser.add_argument('--io-threads', type=int, default=16)
+    parser.add_argument('--probes', type=int, default=4, help='Clientes que consultan el listado en paralelo')
+    parser.add_argument('--probe-interval', type=float, default=0.005)
+    parser.add_argument('--idle-seconds', type=float, default=3)
+    args = parser.parse_args()
+
+    size = min(int(args.size_mb * 1024 * 1024), 10 * 1024 * 1024)
+    payload = b'%PDF-1.7\n' + os.urandom(size - 9)
+
+    def storage(cls):
+        return cls(
+            aws_access_key_id=args.access_key,
+            aws_secret_access_key=args.secret_key,
+            region_name=args.region,
+            bucket_name=args.bucket,
+            endpoint_url=args.endpoint_url,
+            max_pool_connections=args.io_threads,
+            io_threads=args.io_threads
+        )
+
+    results = []
+
+    for name, cls in (('idle', S3StorageRepository), ('blocking', BlockingS3StorageRepository), ('pooled', S3StorageRepository)):
+        repository = storage(cls)
+
+        try:
+            results.append(await run(name, repository, args, payload))
+        finally:
+            repository.shutdown()
+
+    print(f"{'escenario':<12}{'wall s':>10}{'listados':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for r in results:
+        print(
+            f"{r['scenario']:<12}{r['wall_s']:>10.2f}{r['probes']:>10}"
+            f"{r['p50_ms']:>10.1f}{r['p99_ms']:>10.1f}{r['max_ms']:>10.1f}"
+        )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
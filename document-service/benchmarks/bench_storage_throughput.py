@@ -0,0 +1,151 @@
+"""
+Benchmark: throughput de los backends de storage
+
+Para cada backend, tamaño de archivo y nivel de concurrencia mide cuatro
+fases sobre el mismo lote de archivos: subida en streaming (chunks de
+64 KB, como la subida raw), lectura completa con open_range, stat_file y
+borrado. Informa ops/s, MB/s (subida y lectura) y latencias p50/p99.
+
+El backend `memory` marca el techo del propio bucle (sin disco ni red):
+la diferencia con `local` o `s3` es lo que cuesta el almacenamiento real.
+
+Uso (desde document-service/):
+    python -m benchmarks.bench_storage_throughput
+    python -m benchmarks.bench_storage_throughput --backends local,s3 --sizes-kb 256,8192 --concurrency 1,16
+    python -m benchmarks.bench_storage_throughput --output results/storage.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from typing import AsyncIterator, Awaitable, Callable
+from app.domain.repositories.storage_repository import IStorageRepository
+from .support import STORAGE_BACKENDS, add_storage_arguments, open_storage, percentile
+
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def chunked(content: bytes) -> AsyncIterator[bytes]:
+    for offset in range(0, len(content), UPLOAD_CHUNK_SIZE):
+        yield content[offset:offset + UPLOAD_CHUNK_SIZE]
+
+
+async def drain(storage: IStorageRepository, path: str) -> int:
+    size = 0
+    async for chunk in storage.open_range(path):
+        size += len(chunk)
+    return size
+
+
+async def run_phase(
+    operations: list[Callable[[], Awaitable]],
+    concurrency: int
+) -> tuple[float, list[float], list]:
+    """Ejecutar las operaciones con a lo sumo `concurrency` en vuelo"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def timed(operation):
+        async with semaphore:
+            started = time.perf_counter()
+            result = await operation()
+            latencies.append((time.perf_counter() - started) * 1000)
+            return result
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(timed(operation) for operation in operations))
+    return time.perf_counter() - started, latencies, results
+
+
+def summarize(phase: str, elapsed: float, latencies: list[float], total_bytes: int) -> dict:
+    return {
+        'phase': phase,
+        'ops_per_second': round(len(latencies) / elapsed, 1),
+        'mb_per_second': round(total_bytes / elapsed / 1e6, 1) if total_bytes else None,
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p99_ms': round(percentile(latencies, 99), 2)
+    }
+
+
+async def bench(storage: IStorageRepository, size: int, concurrency: int, operations: int) -> list[dict]:
+    run_id = uuid.uuid4().hex[:8]
+    payload = os.urandom(size)
+    paths = []
+
+    try:
+        elapsed, latencies, paths = await run_phase([
+            lambda i=i: storage.upload_stream(chunked(payload), f"bench-{run_id}-{i}.pdf", 'application/pdf')
+            for i in range(operations)
+        ], concurrency)
+        results = [summarize('upload', elapsed, latencies, size * operations)]
+
+        elapsed, latencies, sizes = await run_phase(
+            [lambda path=path: drain(storage, path) for path in paths], concurrency
+        )
+        if any(read != size for read in sizes):
+            raise RuntimeError(f"Lectura incompleta: se esperaban {size} bytes")
+        results.append(summarize('read', elapsed, latencies, sum(sizes)))
+
+        elapsed, latencies, _ = await run_phase(
+            [lambda path=path: storage.stat_file(path) for path in paths], concurrency
+        )
+        results.append(summarize('stat', elapsed, latencies, 0))
+
+        elapsed, latencies, _ = await run_phase(
+            [lambda path=path: storage.delete_file(path) for path in paths], concurrency
+        )
+        results.append(summarize('delete', elapsed, latencies, 0))
+        paths = []
+        return results
+    finally:
+        for path in paths:
+            await storage.delete_file(path)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--backends', default='memory,local', help=f"Separados por comas: {', '.join(STORAGE_BACKENDS)}")
+    parser.add_argument('--sizes-kb', default='4,256,4096', help='Tamaños de archivo en KB')
+    parser.add_argument('--concurrency', default='1,8,32', help='Niveles de concurrencia')
+    parser.add_argument('--operations', type=int, default=64, help='Archivos por combinación')
+    parser.add_argument('--output', help='Archivo JSON donde guardar los resultados')
+    add_storage_arguments(parser)
+    args = parser.parse_args()
+
+    backends = [b.strip() for b in args.backends.split(',') if b.strip()]
+    unknown = set(backends) - set(STORAGE_BACKENDS)
+    if unknown:
+        parser.error(f"Backends desconocidos: {', '.join(sorted(unknown))}")
+
+    sizes = [int(kb) * 1024 for kb in args.sizes_kb.split(',')]
+    levels = [int(level) for level in args.concurrency.split(',')]
+    rows = []
+
+    print(f"{'backend':<8}{'KB':>7}{'conc':>6}  {'fase':<8}{'ops/s':>10}{'MB/s':>9}{'p50 ms':>9}{'p99 ms':>9}")
+
+    for backend in backends:
+        with open_storage(backend, args) as storage:
+            for size in sizes:
+                for concurrency in levels:
+                    for result in await bench(storage, size, concurrency, args.operations):
+                        row = {'backend': backend, 'size_kb': size // 1024, 'concurrency': concurrency, **result}
+                        rows.append(row)
+                        mb = f"{row['mb_per_second']:.1f}" if row['mb_per_second'] is not None else '-'
+                        print(
+                            f"{backend:<8}{row['size_kb']:>7}{concurrency:>6}  {row['phase']:<8}"
+                            f"{row['ops_per_second']:>10.1f}{mb:>9}{row['p50_ms']:>9.2f}{row['p99_ms']:>9.2f}"
+                        )
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'operations': args.operations, 'results': rows}, f, indent=2)
+        print(f"\nResultados guardados en {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
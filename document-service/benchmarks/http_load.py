@@ -0,0 +1,368 @@
+"""
+Prueba de carga HTTP del Document Service completo
+
+Levanta la app real de `create_app` (lifespan, middlewares, contenedor,
+PostgreSQL de la configuración y storage local en un directorio temporal)
+y la ejercita escenario por escenario con N clientes concurrentes en
+bucle cerrado:
+
+- upload_public: POST /upload/public (multipart, sin autenticación)
+- upload_auth: POST /upload (multipart, con JWT)
+- list_application: GET /application/{id}
+- list_user: GET /user/{user_document}
+- get_url: GET /{id}/url sobre los documentos subidos
+- delete: DELETE /{id} (consume documentos subidos)
+
+Para cada escenario y nivel de concurrencia se obtiene el throughput, los
+percentiles p50/p95/p99 de latencia, los MB/s de las subidas y el pico de
+RSS. Los resultados se guardan en JSON y `--compare` los contrasta con una
+ejecución anterior: devuelve código 1 si el throughput cae o el p99 sube
+más de `--threshold` por ciento en algún escenario.
+
+Por defecto la app corre en el mismo proceso (httpx con transporte ASGI):
+no hay red y el cliente comparte la CPU con el servidor, así que mide el
+coste de la app, no la capacidad de una máquina. Para dimensionar hardware
+hay que apuntar `--base-url` a un servidor real (uvicorn/gunicorn) y pasar
+`--server-pid` para leer su pico de RSS. Con `--storage memory` el storage
+en proceso no toca el disco, lo que separa el coste de la app del de E/S.
+
+Los documentos se crean bajo una postulación nueva en cada ejecución y se
+eliminan al final.
+
+Uso (desde document-service/, con PostgreSQL levantado):
+    python -m benchmarks.http_load --output results/baseline.json
+    python -m benchmarks.http_load --concurrency 1,16,64 --requests 500 --size-kb 256
+    python -m benchmarks.http_load --scenarios list_application,get_url --compare results/baseline.json
+    python -m benchmarks.http_load --base-url http://localhost:8000 --server-pid 1234
+    python -m benchmarks.http_load --storage memory --scenarios upload_public,get_url
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+import httpx
+from jose import jwt
+from .support import percentile
+
+
+SCENARIOS = ('upload_public', 'upload_auth', 'list_application', 'list_user', 'get_url', 'delete')
+UPLOAD_SCENARIOS = ('upload_public', 'upload_auth')
+
+
+class LoadContext:
+    """Estado compartido entre escenarios: identidad, carga útil y documentos creados"""
+
+    def __init__(self, client: httpx.AsyncClient, secret: str, algorithm: str, size: int):
+        self.client = client
+        self.application_id = str(uuid.uuid4())
+        self.user_document = str(uuid.uuid4().int)[:10]
+        self.payload = b'%PDF-1.7\n' + os.urandom(max(0, size - 25))
+        self.document_ids: list[str] = []
+        self._sequence = 0
+        token = jwt.encode(
+            {'sub': str(uuid.uuid4()), 'role': 'recruiter', 'exp': int(time.time()) + 24 * 3600},
+            secret,
+            algorithm=algorithm
+        )
+        self.headers = {'Authorization': f'Bearer {token}'}
+
+    def next_file(self) -> tuple[str, bytes, str]:
+        """Archivo con contenido único: sin deduplicación, cada subida escribe en el storage"""
+        self._sequence += 1
+        content = self.payload + self._sequence.to_bytes(16, 'big')
+        return (f'bench-{self._sequence}.pdf', content, 'application/pdf')
+
+    def form(self) -> dict:
+        return {
+            'user_document': self.user_document,
+            'application_id': self.application_id,
+            'document_type': 'cv'
+        }
+
+
+async def request(ctx: LoadContext, scenario: str, index: int) -> httpx.Response:
+    """Una petición del escenario; `index` reparte los documentos entre peticiones"""
+    client = ctx.client
+    base = '/api/v1/documents'
+
+    if scenario == 'upload_public':
+        response = await client.post(f'{base}/upload/public', files={'file': ctx.next_file()}, data=ctx.form())
+    elif scenario == 'upload_auth':
+        response = await client.post(
+            f'{base}/upload', files={'file': ctx.next_file()}, data=ctx.form(), headers=ctx.headers
+        )
+    elif scenario == 'list_application':
+        return await client.get(f'{base}/application/{ctx.application_id}', headers=ctx.headers)
+    elif scenario == 'list_user':
+        return await client.get(f'{base}/user/{ctx.user_document}', headers=ctx.headers)
+    elif scenario == 'get_url':
+        document_id = ctx.document_ids[index % len(ctx.document_ids)]
+        return await client.get(f'{base}/{document_id}/url', headers=ctx.headers)
+    elif scenario == 'delete':
+        return await client.delete(f'{base}/{ctx.document_ids.pop()}', headers=ctx.headers)
+    else:
+        raise ValueError(f"Escenario desconocido: {scenario}")
+
+    if response.status_code == 201:
+        ctx.document_ids.append(response.json()['id'])
+
+    return response
+
+
+async def run_scenario(ctx: LoadContext, scenario: str, concurrency: int, requests: int, warmup: int) -> dict:
+    """Lanzar `requests` peticiones con `concurrency` clientes en bucle cerrado"""
+    if scenario == 'delete':
+        requests = min(requests, len(ctx.document_ids))
+        warmup = 0
+    elif scenario == 'get_url' and not ctx.document_ids:
+        return {'scenario': scenario, 'concurrency': concurrency, 'skipped': 'sin documentos subidos'}
+
+    for i in range(warmup):
+        await request(ctx, scenario, i)
+
+    latencies = []
+    statuses: dict[str, int] = {}
+    errors = 0
+    next_index = 0
+
+    async def worker():
+        nonlocal next_index, errors
+
+        while next_index < requests:
+            index = next_index
+            next_index += 1
+            started = time.perf_counter()
+
+            try:
+                response = await request(ctx, scenario, index)
+                status = str(response.status_code)
+                ok = response.status_code < 400
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+                ok = False
+
+            latencies.append(time.perf_counter() - started)
+            statuses[status] = statuses.get(status, 0) + 1
+
+            if not ok:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    result = {
+        'scenario': scenario,
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'errors': errors,
+        'statuses': statuses,
+        'elapsed_s': round(elapsed, 3),
+        'throughput_rps': round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+        'max_ms': round(max(latencies, default=0) * 1000, 3)
+    }
+
+    if scenario in UPLOAD_SCENARIOS and elapsed:
+        result['throughput_mb_s'] = round(len(latencies) * len(ctx.payload) / elapsed / (1024 * 1024), 2)
+
+    return result
+
+
+def peak_rss_mb(server_pid: Optional[int]) -> Optional[float]:
+    """Pico de RSS del servidor: este proceso si la app corre aquí, o `server_pid`"""
+    if server_pid is None:
+        # ru_maxrss está en KB en Linux y en bytes en macOS
+        divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+        return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / divisor, 1)
+
+    try:
+        with open(f'/proc/{server_pid}/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+
+    return None
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: list[dict], baseline_path: str, threshold: float) -> list[str]:
+    """Diferencias contra una ejecución anterior; devuelve los escenarios que empeoraron"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {(r['scenario'], r['concurrency']): r for r in json.load(f)['results'] if 'requests' in r}
+
+    regressions = []
+    print(f"\ncomparación con {baseline_path} (umbral {threshold:.0f}%)")
+    print(f"{'escenario':<18}{'conc':>6}{'req/s':>12}{'Δ req/s':>10}{'p99 ms':>10}{'Δ p99':>10}")
+
+    for r in results:
+        before = baseline.get((r['scenario'], r['concurrency']))
+
+        if before is None or 'requests' not in r:
+            continue
+
+        rps_delta = (r['throughput_rps'] / before['throughput_rps'] - 1) * 100 if before['throughput_rps'] else 0.0
+        p99_delta = (r['p99_ms'] / before['p99_ms'] - 1) * 100 if before['p99_ms'] else 0.0
+        worse = rps_delta < -threshold or p99_delta > threshold
+
+        if worse:
+            regressions.append(f"{r['scenario']}@{r['concurrency']}")
+
+        print(
+            f"{r['scenario']:<18}{r['concurrency']:>6}{r['throughput_rps']:>12.1f}{rps_delta:>+9.1f}%"
+            f"{r['p99_ms']:>10.1f}{p99_delta:>+9.1f}%" + ('  REGRESIÓN' if worse else '')
+        )
+
+    return regressions
+
+
+def print_results(results: list[dict]) -> None:
+    print(
+        f"{'escenario':<18}{'conc':>6}{'req':>7}{'err':>6}{'req/s':>10}{'MB/s':>8}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'RSS MB':>9}"
+    )
+
+    for r in results:
+        if 'skipped' in r:
+            print(f"{r['scenario']:<18}{r['concurrency']:>6}  omitido: {r['skipped']}")
+            continue
+
+        mb_s = f"{r['throughput_mb_s']:.1f}" if 'throughput_mb_s' in r else '-'
+        rss = f"{r['peak_rss_mb']:.0f}" if r.get('peak_rss_mb') is not None else '-'
+        print(
+            f"{r['scenario']:<18}{r['concurrency']:>6}{r['requests']:>7}{r['errors']:>6}"
+            f"{r['throughput_rps']:>10.1f}{mb_s:>8}{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}{rss:>9}"
+        )
+
+
+async def run(args, client: httpx.AsyncClient, secret: str, algorithm: str) -> list[dict]:
+    ctx = LoadContext(client, secret, algorithm, int(args.size_kb * 1024))
+    results = []
+
+    try:
+        for concurrency in args.concurrency:
+            for scenario in args.scenarios:
+                result = await run_scenario(ctx, scenario, concurrency, args.requests, args.warmup)
+                result['peak_rss_mb'] = peak_rss_mb(args.server_pid)
+                results.append(result)
+                print(
+                    f"{scenario} x{concurrency}: {result.get('throughput_rps', 0):.1f} req/s",
+                    file=sys.stderr
+                )
+    finally:
+        response = await client.delete(
+            f'/api/v1/documents/application/{ctx.application_id}', headers=ctx.headers
+        )
+        if response.status_code != 200:
+            print(f"No se pudo limpiar la postulación {ctx.application_id}: {response.status_code}", file=sys.stderr)
+
+    return results
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help='Escenarios separados por comas, en orden')
+    parser.add_argument('--concurrency', default='1,8,32', help='Niveles de concurrencia separados por comas')
+    parser.add_argument('--requests', type=int, default=200, help='Peticiones medidas por escenario y nivel')
+    parser.add_argument('--warmup', type=int, default=10, help='Peticiones previas no medidas')
+    parser.add_argument('--size-kb', type=float, default=128, help='Tamaño de cada archivo subido')
+    parser.add_argument('--base-url', help='Servidor ya levantado; sin esto la app corre en este proceso')
+    parser.add_argument('--server-pid', type=int, help='PID del servidor para leer su pico de RSS')
+    parser.add_argument('--storage', choices=('local', 'memory'), default='local', help='Storage de la app en proceso')
+    parser.add_argument('--output', help='Archivo JSON donde guardar los resultados')
+    parser.add_argument('--compare', help='JSON de una ejecución anterior con el que comparar')
+    parser.add_argument('--threshold', type=float, default=10.0, help='Porcentaje tolerado antes de marcar regresión')
+    args = parser.parse_args()
+
+    args.scenarios = [s.strip() for s in args.scenarios.split(',') if s.strip()]
+    args.concurrency = [int(c) for c in args.concurrency.split(',')]
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Escenarios desconocidos: {', '.join(sorted(unknown))}")
+
+    storage_path = None
+    started_at = datetime.now(timezone.utc)
+
+    if args.base_url:
+        from app.config.config import get_settings
+        settings = get_settings()
+        limits = httpx.Limits(max_connections=max(args.concurrency))
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=60, limits=limits) as client:
+            results = await run(args, client, settings.jwt_secret, settings.jwt_algorithm)
+        target = args.base_url
+    else:
+        # La configuración se lee al importar la app: el storage temporal va antes
+        storage_path = tempfile.mkdtemp(prefix='http-load-')
+        os.environ['STORAGE_TYPE'] = args.storage
+        os.environ['STORAGE_BASE_PATH'] = storage_path
+        from app.main import create_app
+        from app.config.config import get_settings
+        settings = get_settings()
+        app = create_app()
+
+        try:
+            async with app.router.lifespan_context(app):
+                transport = httpx.ASGITransport(app=app)
+                async with httpx.AsyncClient(transport=transport, base_url='http://bench', timeout=60) as client:
+                    results = await run(args, client, settings.jwt_secret, settings.jwt_algorithm)
+        finally:
+            shutil.rmtree(storage_path, ignore_errors=True)
+        target = 'in-process'
+
+    print_results(results)
+
+    report = {
+        'started_at': started_at.isoformat(),
+        'commit': git_commit(),
+        'target': target,
+        'storage_type': settings.storage_type,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'parameters': {
+            'scenarios': args.scenarios,
+            'concurrency': args.concurrency,
+            'requests': args.requests,
+            'warmup': args.warmup,
+            'size_kb': args.size_kb
+        },
+        'results': results
+    }
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResultados guardados en {args.output}", file=sys.stderr)
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        if regressions:
+            print(f"\nRegresiones: {', '.join(regressions)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,362 @@
+"""
+Suite de conformidad de los backends de storage
+
+Comprueba que un backend cumple el contrato de `IStorageRepository` tal
+como lo usan los casos de uso: subidas completas y en streaming (sin
+archivos parciales si el flujo falla), lecturas por rangos, URLs,
+existencia y metadata, borrado, mover y copiar, listado en orden de bytes,
+subidas directas firmadas (si el backend las admite), concurrencia y
+archivos grandes (por encima del tamaño de parte multipart de S3).
+
+Cada comprobación trabaja con rutas propias de la ejecución y las borra
+al terminar, así que se puede lanzar contra un bucket compartido.
+Devuelve código 1 si algún backend no cumple.
+
+Uso (desde document-service/):
+    python -m benchmarks.storage_conformance
+    python -m benchmarks.storage_conformance --backends local,s3 --endpoint-url http://localhost:9000
+    python -m benchmarks.storage_conformance --backends memory --large-mb 64 --concurrency 32
+"""
+import argparse
+import asyncio
+import hashlib
+import os
+import sys
+import time
+import uuid
+from typing import AsyncIterator, Optional
+from app.domain.repositories.storage_repository import IStorageRepository, PresignedUpload
+from .support import STORAGE_BACKENDS, add_storage_arguments, open_storage
+
+
+class Skip(Exception):
+    """La comprobación no aplica a este backend"""
+
+
+def expect(condition: bool, message: str) -> None:
+    if not condition:
+        raise AssertionError(message)
+
+
+async def chunked(content: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    for offset in range(0, len(content), chunk_size):
+        yield content[offset:offset + chunk_size]
+
+
+class StorageConformance:
+    """Comprobaciones del contrato de IStorageRepository sobre un backend"""
+
+    def __init__(self, storage: IStorageRepository, large_mb: int, concurrency: int):
+        self.storage = storage
+        self.large_mb = large_mb
+        self.concurrency = concurrency
+        self.run_id = uuid.uuid4().hex[:12]
+        self.created: set[str] = set()
+
+    # Utilidades
+
+    def filename(self, name: str) -> str:
+        return f"conformance-{self.run_id}-{name}"
+
+    def path(self, name: str) -> str:
+        """Ruta explícita (destino de mover o copiar) bajo el prefijo de la ejecución"""
+        return f"conformance-{self.run_id}/{name}"
+
+    async def upload(self, content: bytes, name: str, chunk_size: Optional[int] = None) -> str:
+        if chunk_size is None:
+            path = await self.storage.upload_file(content, self.filename(name), 'application/pdf')
+        else:
+            path = await self.storage.upload_stream(chunked(content, chunk_size), self.filename(name), 'application/pdf')
+        self.created.add(path)
+        return path
+
+    async def read(self, path: str, start: int = 0, end: Optional[int] = None) -> bytes:
+        parts = []
+        async for chunk in self.storage.open_range(path, start, end):
+            parts.append(chunk)
+        return b''.join(parts)
+
+    async def cleanup(self) -> None:
+        for path in self.created:
+            try:
+                await self.storage.delete_file(path)
+            except Exception:
+                pass
+
+    # Comprobaciones
+
+    async def check_upload_file(self) -> None:
+        """upload_file guarda el contenido y devuelve una ruta que termina en el nombre"""
+        content = os.urandom(100 * 1024)
+        path = await self.upload(content, 'file.pdf')
+
+        expect(path.endswith(self.filename('file.pdf')), f"ruta inesperada: {path}")
+        expect(await self.read(path) == content, "el contenido leído no coincide")
+        expect(await self.storage.file_exists(path), "file_exists devuelve False tras subir")
+
+        metadata = await self.storage.stat_file(path)
+        expect(metadata is not None, "stat_file devuelve None tras subir")
+        expect(metadata.size == len(content), f"stat_file.size={metadata.size}, esperado {len(content)}")
+        expect(metadata.content_type in (None, 'application/pdf'), f"content_type={metadata.content_type}")
+        expect(
+            metadata.sha256 in (None, hashlib.sha256(content).hexdigest()),
+            "stat_file.sha256 no coincide con el contenido"
+        )
+
+    async def check_upload_stream(self) -> None:
+        """upload_stream con chunks pequeños e irregulares reconstruye el archivo"""
+        content = os.urandom(300 * 1024 + 17)
+        path = await self.upload(content, 'stream.pdf', chunk_size=7 * 1024 + 3)
+
+        expect(await self.read(path) == content, "el contenido leído no coincide")
+
+    async def check_upload_stream_failure(self) -> None:
+        """Si el flujo falla a mitad de subida no queda ningún archivo parcial"""
+        sentinel = await self.upload(b'sentinel', 'sentinel.pdf')
+        directory = sentinel.rsplit('/', 1)[0] + '/' if '/' in sentinel else ''
+        name = self.filename('broken.pdf')
+
+        async def broken() -> AsyncIterator[bytes]:
+            yield os.urandom(64 * 1024)
+            yield os.urandom(64 * 1024)
+            raise RuntimeError("corte del cliente")
+
+        try:
+            path = await self.storage.upload_stream(broken(), name, 'application/pdf')
+            self.created.add(path)
+            raise AssertionError("upload_stream no propagó el error del flujo")
+        except RuntimeError:
+            pass
+
+        leftovers = [f.path async for f in self.storage.list_files(directory) if name in f.path]
+        expect(not leftovers, f"quedaron archivos parciales: {leftovers}")
+
+    async def check_open_range(self) -> None:
+        """open_range respeta start y end inclusivo, y recorta al final del archivo"""
+        content = os.urandom(1000)
+        path = await self.upload(content, 'range.pdf')
+
+        for start, end in ((0, None), (10, 19), (0, 0), (990, None), (995, 2000)):
+            data = await self.read(path, start, end)
+            stop = len(content) if end is None else end + 1
+            expect(data == content[start:stop], f"rango {start}-{end}: {len(data)} bytes")
+
+    async def check_open_range_missing(self) -> None:
+        """open_range lanza FileNotFoundError para un archivo inexistente"""
+        try:
+            await self.read(self.path('missing.pdf'))
+        except FileNotFoundError:
+            return
+        raise AssertionError("no lanzó FileNotFoundError")
+
+    async def check_missing_file(self) -> None:
+        """file_exists y stat_file informan de archivos inexistentes sin lanzar"""
+        missing = self.path('missing.pdf')
+        expect(not await self.storage.file_exists(missing), "file_exists devuelve True")
+        expect(await self.storage.stat_file(missing) is None, "stat_file no devuelve None")
+
+    async def check_file_url(self) -> None:
+        """get_file_url devuelve una URL no vacía"""
+        path = await self.upload(b'%PDF-1.7 url', 'url.pdf')
+
+        for expiration in (60, 3600):
+            url = await self.storage.get_file_url(path, expiration)
+            expect(isinstance(url, str) and url != '', f"URL vacía con expiración {expiration}")
+
+    async def check_delete(self) -> None:
+        """delete_file elimina el archivo y es idempotente"""
+        path = await self.upload(b'%PDF-1.7 delete', 'delete.pdf')
+        await self.storage.delete_file(path)
+
+        expect(not await self.storage.file_exists(path), "el archivo sigue existiendo")
+        try:
+            await self.read(path)
+            raise AssertionError("open_range leyó un archivo eliminado")
+        except FileNotFoundError:
+            pass
+
+        # Borrar dos veces no es un error (el worker de limpieza reintenta)
+        await self.storage.delete_file(path)
+
+    async def check_move(self) -> None:
+        """move_file mueve el contenido y sobrescribe el destino"""
+        first = os.urandom(2048)
+        second = os.urandom(4096)
+        source = await self.upload(first, 'move-a.pdf')
+        other = await self.upload(second, 'move-b.pdf')
+        target = self.path('moved/target.pdf')
+        self.created.add(target)
+
+        expect(await self.storage.move_file(source, target) == target, "move_file no devuelve el destino")
+        expect(not await self.storage.file_exists(source), "el origen sigue existiendo")
+        expect(await self.read(target) == first, "el destino no tiene el contenido movido")
+
+        await self.storage.move_file(other, target)
+        expect(await self.read(target) == second, "el destino no se sobrescribió")
+
+    async def check_copy(self) -> None:
+        """copy_file conserva el origen, la copia sobrevive al origen y falla si no existe"""
+        content = os.urandom(4096)
+        source = await self.upload(content, 'copy.pdf')
+        target = self.path('copied/target.pdf')
+        self.created.add(target)
+
+        expect(await self.storage.copy_file(source, target) == target, "copy_file no devuelve el destino")
+        expect(await self.read(source) == content, "el origen cambió")
+        expect(await self.read(target) == content, "la copia no coincide")
+
+        await self.storage.delete_file(source)
+        expect(await self.read(target) == content, "la copia desapareció al borrar el origen")
+
+        try:
+            await self.storage.copy_file(self.path('missing.pdf'), self.path('copied/other.pdf'))
+        except FileNotFoundError:
+            return
+        raise AssertionError("copiar un archivo inexistente no lanzó FileNotFoundError")
+
+    async def check_list_files(self) -> None:
+        """list_files recorre en orden de bytes y respeta prefix y start_after"""
+        source = await self.upload(b'%PDF-1.7 list', 'list.pdf')
+        prefix = self.path('list/')
+        # "/" (0x2f) va después de "-" y "." pero antes que las letras
+        names = ['a.pdf', 'a/x.pdf', 'a-b.pdf', 'B.pdf', 'a/y/z.pdf', 'b.pdf', 'ñ.pdf']
+        paths = [prefix + name for name in names]
+
+        for path in paths:
+            self.created.add(path)
+            await self.storage.copy_file(source, path)
+
+        expected = sorted(paths, key=lambda path: path.encode())
+        listed = [f async for f in self.storage.list_files(prefix)]
+
+        expect([f.path for f in listed] == expected, f"orden: {[f.path for f in listed]}")
+        expect(all(f.size == len(b'%PDF-1.7 list') for f in listed), "tamaños incorrectos")
+
+        resumed = [f.path async for f in self.storage.list_files(prefix, start_after=expected[2])]
+        expect(resumed == expected[3:], f"start_after: {resumed}")
+
+        nested = [f.path async for f in self.storage.list_files(prefix + 'a/')]
+        expect(nested == [p for p in expected if p.startswith(prefix + 'a/')], f"prefix: {nested}")
+
+    async def check_upload_url(self) -> None:
+        """generate_upload_url firma una subida directa o declara que no la admite"""
+        content = b'%PDF-1.7 direct'
+        try:
+            upload = await self.storage.generate_upload_url(
+                self.path('direct.pdf'), 'application/pdf', len(content),
+                hashlib.sha256(content).hexdigest(), expiration=300
+            )
+        except NotImplementedError:
+            raise Skip("el backend no admite subidas directas")
+
+        expect(isinstance(upload, PresignedUpload), f"tipo devuelto: {type(upload).__name__}")
+        expect(upload.method in ('PUT', 'POST'), f"método {upload.method}")
+        expect(upload.url.startswith(('http://', 'https://')), f"URL {upload.url}")
+        expect(upload.expires_in == 300, f"expires_in={upload.expires_in}")
+
+    async def check_concurrency(self) -> None:
+        """Subidas, lecturas y borrados concurrentes no se mezclan ni fallan"""
+        contents = [os.urandom(64 * 1024 + i) for i in range(self.concurrency)]
+        paths = await asyncio.gather(*(
+            self.upload(content, f'concurrent-{i}.pdf', chunk_size=16 * 1024)
+            for i, content in enumerate(contents)
+        ))
+
+        expect(len(set(paths)) == len(paths), "rutas repetidas entre subidas concurrentes")
+        read_back = await asyncio.gather(*(self.read(path) for path in paths))
+        expect(read_back == contents, "alguna lectura concurrente no coincide con su subida")
+
+        # Varios borrados del mismo archivo a la vez (reintentos del worker)
+        await asyncio.gather(*(self.storage.delete_file(paths[0]) for _ in range(self.concurrency)))
+        expect(not await self.storage.file_exists(paths[0]), "el archivo sigue existiendo")
+
+    async def check_large_file(self) -> None:
+        """Un archivo grande subido en streaming se lee completo y sin alterar"""
+        block = os.urandom(1024 * 1024)
+        sha256 = hashlib.sha256()
+
+        async def generate() -> AsyncIterator[bytes]:
+            for i in range(self.large_mb):
+                chunk = i.to_bytes(8, 'big') + block[8:]
+                sha256.update(chunk)
+                yield chunk
+
+        path = await self.storage.upload_stream(generate(), self.filename('large.pdf'), 'application/pdf')
+        self.created.add(path)
+
+        read_hash = hashlib.sha256()
+        size = 0
+        async for chunk in self.storage.open_range(path):
+            read_hash.update(chunk)
+            size += len(chunk)
+
+        expect(size == self.large_mb * 1024 * 1024, f"leídos {size} bytes")
+        expect(read_hash.hexdigest() == sha256.hexdigest(), "el contenido leído no coincide")
+
+        metadata = await self.storage.stat_file(path)
+        expect(metadata is not None and metadata.size == size, "stat_file no refleja el tamaño")
+
+
+CHECKS = [name for name in vars(StorageConformance) if name.startswith('check_')]
+
+
+async def run_backend(backend: str, args) -> list[tuple[str, str, float, str]]:
+    results = []
+
+    with open_storage(backend, args) as storage:
+        suite = StorageConformance(storage, args.large_mb, args.concurrency)
+
+        try:
+            for name in CHECKS:
+                check = getattr(suite, name)
+                started = time.perf_counter()
+
+                try:
+                    await check()
+                    outcome, detail = 'PASS', ''
+                except Skip as e:
+                    outcome, detail = 'SKIP', str(e)
+                except Exception as e:
+                    outcome, detail = 'FAIL', f"{type(e).__name__}: {e}"
+
+                elapsed = (time.perf_counter() - started) * 1000
+                results.append((name[len('check_'):], outcome, elapsed, detail))
+                print(f"  {outcome:<5} {name[len('check_'):]:<24}{elapsed:>9.1f} ms  {detail}")
+        finally:
+            await suite.cleanup()
+
+    return results
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--backends', default='memory,local', help=f"Separados por comas: {', '.join(STORAGE_BACKENDS)}")
+    parser.add_argument('--large-mb', type=int, default=24, help='Tamaño del archivo grande')
+    parser.add_argument('--concurrency', type=int, default=16, help='Operaciones simultáneas')
+    add_storage_arguments(parser)
+    args = parser.parse_args()
+
+    backends = [b.strip() for b in args.backends.split(',') if b.strip()]
+    unknown = set(backends) - set(STORAGE_BACKENDS)
+    if unknown:
+        parser.error(f"Backends desconocidos: {', '.join(sorted(unknown))}")
+
+    failed = []
+
+    for backend in backends:
+        print(f"{backend}:")
+        results = await run_backend(backend, args)
+        failures = [name for name, outcome, _, _ in results if outcome == 'FAIL']
+        passed = sum(1 for _, outcome, _, _ in results if outcome == 'PASS')
+        print(f"  {passed} ok, {len(failures)} fallos, {len(results) - passed - len(failures)} omitidas\n")
+
+        if failures:
+            failed.append(backend)
+
+    if failed:
+        print(f"No cumplen el contrato: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,163 @@
+"""
+Utilidades compartidas por los benchmarks
+"""
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from app.domain.entities.document import Document
+from app.domain.repositories.document_repository import IDocumentRepository
+from app.domain.repositories.storage_repository import IStorageRepository
+from app.infrastructure.storage import LocalStorageRepository, MemoryStorageRepository, S3StorageRepository
+
+
+STORAGE_BACKENDS = ('memory', 'local', 's3')
+
+
+class InMemoryDocumentRepository(IDocumentRepository):
+    """Repositorio de documentos en memoria para aislar el coste de la capa HTTP"""
+
+    def __init__(self):
+        self.documents: dict[str, Document] = {}
+        self.blobs: dict[str, list] = {}
+        self.version = 0
+
+    async def save(self, document: Document) -> Document:
+        self.documents[document.id] = document
+        self.version += 1
+        return document
+
+    async def save_many(self, documents: list[Document]) -> list[Document]:
+        for document in documents:
+            self.documents[document.id] = document
+        self.version += 1
+        return documents
+
+    async def find_by_id(self, document_id: str) -> Optional[Document]:
+        return self.documents.get(document_id)
+
+    async def find_by_ids(self, document_ids: list[str]) -> list[Document]:
+        return [self.documents[i] for i in document_ids if i in self.documents]
+
+    async def find_by_user_document(self, user_document: str, limit=None, after=None) -> list[Document]:
+        return self._page([d for d in self.documents.values() if d.user_document == user_document], limit, after)
+
+    async def find_by_application_id(self, application_id: str, limit=None, after=None) -> list[Document]:
+        return self._page([d for d in self.documents.values() if d.application_id == application_id], limit, after)
+
+    async def find_json_by_user_document(self, user_document: str, limit: int, after=None, fields=None):
+        return self._page_json(await self.find_by_user_document(user_document, limit + 1, after), limit, fields)
+
+    async def find_json_by_application_id(self, application_id: str, limit: int, after=None, fields=None):
+        return self._page_json(await self.find_by_application_id(application_id, limit + 1, after), limit, fields)
+
+    @staticmethod
+    def _page_json(documents: list[Document], limit: int, fields) -> tuple[str, Optional[tuple]]:
+        page = documents[:limit]
+        items = json.dumps([
+            {**d.model_dump(mode='json', include=set(fields) if fields else None), 'url': None} for d in page
+        ])
+        if len(documents) <= limit:
+            return items, None
+        return items, (page[-1].uploaded_at, page[-1].id)
+
+    @staticmethod
+    def _page(documents: list[Document], limit, after) -> list[Document]:
+        documents = sorted(documents, key=lambda d: (d.uploaded_at, d.id), reverse=True)
+        if after is not None:
+            documents = [d for d in documents if (d.uploaded_at, d.id) < after]
+        return documents[:limit] if limit is not None else documents
+
+    async def list_version_by_user_document(self, user_document: str) -> str:
+        return str(self.version)
+
+    async def list_version_by_application_id(self, application_id: str) -> str:
+        return str(self.version)
+
+    async def delete(self, document_id: str) -> bool:
+        self.version += 1
+        return self.documents.pop(document_id, None) is not None
+
+    async def delete_by_application_id(self, application_id: str) -> tuple[list[str], list[str]]:
+        documents = [d for d in self.documents.values() if d.application_id == application_id]
+        orphan_paths = []
+        self.version += 1
+        for document in documents:
+            del self.documents[document.id]
+            if document.content_hash is None:
+                orphan_paths.append(document.file_path)
+            else:
+                orphan_path = await self.release_blob(document.content_hash)
+                if orphan_path is not None:
+                    orphan_paths.append(orphan_path)
+        return [d.id for d in documents], orphan_paths
+
+    async def exists_by_id(self, document_id: str) -> bool:
+        return document_id in self.documents
+
+    async def acquire_blob(self, content_hash: str, file_path: str, file_size: int, mime_type: str) -> tuple[str, bool]:
+        blob = self.blobs.get(content_hash)
+        if blob is None:
+            self.blobs[content_hash] = [file_path, 1]
+            return file_path, True
+        blob[1] += 1
+        return blob[0], False
+
+    async def release_blob(self, content_hash: str) -> Optional[str]:
+        blob = self.blobs.get(content_hash)
+        if blob is None:
+            return None
+        blob[1] -= 1
+        if blob[1] > 0:
+            return None
+        del self.blobs[content_hash]
+        return blob[0]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Percentil por el método del rango más cercano"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def add_storage_arguments(parser) -> None:
+    """Opciones para construir los backends de storage (S3 con los valores del .env)"""
+    parser.add_argument('--storage-path', help='Directorio del backend local (por defecto, uno temporal)')
+    parser.add_argument('--endpoint-url', default=os.environ.get('S3_ENDPOINT_URL', 'http://localhost:9000'))
+    parser.add_argument('--bucket', default=os.environ.get('S3_BUCKET_NAME', 'documents'))
+    parser.add_argument('--access-key', default=os.environ.get('AWS_ACCESS_KEY_ID', 'minioadmin'))
+    parser.add_argument('--secret-key', default=os.environ.get('AWS_SECRET_ACCESS_KEY', 'minioadmin'))
+    parser.add_argument('--region', default=os.environ.get('AWS_REGION', 'us-east-1'))
+
+
+@contextmanager
+def open_storage(backend: str, args) -> Iterator[IStorageRepository]:
+    """Crear un backend de storage y liberar sus recursos al salir"""
+    if backend == 'memory':
+        yield MemoryStorageRepository()
+    elif backend == 'local':
+        path = args.storage_path or tempfile.mkdtemp(prefix='storage-bench-')
+        try:
+            yield LocalStorageRepository(path)
+        finally:
+            if args.storage_path is None:
+                shutil.rmtree(path, ignore_errors=True)
+    elif backend == 's3':
+        storage = S3StorageRepository(
+            aws_access_key_id=args.access_key,
+            aws_secret_access_key=args.secret_key,
+            region_name=args.region,
+            bucket_name=args.bucket,
+            endpoint_url=args.endpoint_url
+        )
+        try:
+            yield storage
+        finally:
+            storage.shutdown()
+    else:
+        raise ValueError(f"Backend desconocido: {backend}")
@@ -1,8 +1,29 @@
 -- Document Service Database Schema
 -- PostgreSQL 18.1
+--
+-- Crea la base desde cero (borra las tablas existentes). Para actualizar
+-- una base con datos, usar database/upgrade.sql
 
--- Eliminar tabla si existe
+-- Eliminar tablas si existen
 DROP TABLE IF EXISTS documents CASCADE;
+DROP TABLE IF EXISTS document_blobs CASCADE;
+DROP TABLE IF EXISTS storage_deletions CASCADE;
+DROP TABLE IF EXISTS document_list_versions CASCADE;
+DROP TABLE IF EXISTS upload_session_parts CASCADE;
+DROP TABLE IF EXISTS upload_sessions CASCADE;
+
+-- Crear tabla de blobs (contenido direccionado por hash)
+CREATE TABLE document_blobs (
+    content_hash CHAR(64) PRIMARY KEY,
+    file_path VARCHAR(500) NOT NULL,
+    file_size INTEGER NOT NULL,
+    mime_type VARCHAR(100) NOT NULL,
+    ref_count INTEGER NOT NULL DEFAULT 1,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    
+    -- Constraints
+    CONSTRAINT chk_blob_ref_count CHECK (ref_count >= 0)
+);
 
 -- Crear tabla de documentos
 CREATE TABLE documents (
@@ -10,36 +31,124 @@ CREATE TABLE documents (
     user_document VARCHAR(50) NOT NULL,
     application_id UUID NOT NULL,
     filename VARCHAR(255) NOT NULL,
+    original_filename VARCHAR(255) NOT NULL,
     file_path VARCHAR(500) NOT NULL,
     file_size INTEGER NOT NULL,
     mime_type VARCHAR(100) NOT NULL,
     document_type VARCHAR(50) NOT NULL,
     uploaded_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-    uploaded_by UUID NOT NULL,
+    uploaded_by UUID,
+    content_hash CHAR(64) REFERENCES document_blobs(content_hash),
     
     -- Constraints
     CONSTRAINT chk_file_size CHECK (file_size > 0 AND file_size <= 10485760), -- Máximo 10 MB
     CONSTRAINT chk_document_type CHECK (document_type IN ('cv', 'carta_presentacion', 'certificado', 'diploma', 'referencia', 'otro'))
 );
 
+-- Crear tabla outbox de archivos pendientes de eliminar del storage
+-- Se escribe en la misma transacción que el borrado de documentos y la
+-- vacía el worker de limpieza en segundo plano
+CREATE TABLE storage_deletions (
+    id BIGSERIAL PRIMARY KEY,
+    file_path VARCHAR(500) NOT NULL,
+    content_hash CHAR(64),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_error TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Crear tabla de versiones de borrado por usuario y por postulación
+-- Junto con el conteo y el último uploaded_at forma el ETag de los listados
+CREATE TABLE document_list_versions (
+    scope VARCHAR(20) NOT NULL,
+    scope_key VARCHAR(50) NOT NULL,
+    version BIGINT NOT NULL DEFAULT 0,
+    
+    PRIMARY KEY (scope, scope_key),
+    CONSTRAINT chk_list_version_scope CHECK (scope IN ('user_document', 'application_id'))
+);
+
+-- Crear tablas de subidas reanudables
+-- Cada chunk se guarda como un archivo en el storage; al finalizar se
+-- concatenan y pasan por el mismo flujo que una subida normal
+CREATE TABLE upload_sessions (
+    id UUID PRIMARY KEY,
+    user_document VARCHAR(50) NOT NULL,
+    application_id UUID NOT NULL,
+    document_type VARCHAR(50) NOT NULL,
+    filename VARCHAR(255) NOT NULL,
+    mime_type VARCHAR(100) NOT NULL,
+    file_size INTEGER NOT NULL,
+    received_size INTEGER NOT NULL DEFAULT 0,
+    status VARCHAR(20) NOT NULL DEFAULT 'open',
+    uploaded_by UUID,
+    content_hash CHAR(64),
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    expires_at TIMESTAMP NOT NULL,
+    
+    -- Constraints
+    CONSTRAINT chk_upload_file_size CHECK (file_size > 0 AND file_size <= 10485760), -- Máximo 10 MB
+    CONSTRAINT chk_upload_received_size CHECK (received_size >= 0 AND received_size <= file_size),
+    CONSTRAINT chk_upload_status CHECK (status IN ('open', 'completing')),
+    CONSTRAINT chk_upload_content_hash CHECK (content_hash ~ '^[0-9a-f]{64}$')
+);
+
+CREATE TABLE upload_session_parts (
+    session_id UUID NOT NULL REFERENCES upload_sessions(id),
+    part_offset INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    file_path VARCHAR(500) NOT NULL,
+    
+    PRIMARY KEY (session_id, part_offset)
+);
+
 -- Índices para mejorar rendimiento
-CREATE INDEX idx_documents_user_document ON documents(user_document);
-CREATE INDEX idx_documents_application_id ON documents(application_id);
+-- Compuestos para la paginación keyset por (uploaded_at, id)
+CREATE INDEX idx_documents_user_document_uploaded ON documents(user_document, uploaded_at DESC, id DESC);
+CREATE INDEX idx_documents_application_uploaded ON documents(application_id, uploaded_at DESC, id DESC);
 CREATE INDEX idx_documents_uploaded_at ON documents(uploaded_at DESC);
 CREATE INDEX idx_documents_document_type ON documents(document_type);
+CREATE INDEX idx_documents_content_hash ON documents(content_hash);
+CREATE INDEX idx_storage_deletions_available ON storage_deletions(available_at);
+CREATE INDEX idx_upload_sessions_expires ON upload_sessions(expires_at);
 
 -- Comentarios en la tabla
 COMMENT ON TABLE documents IS 'Almacena metadata de documentos subidos por usuarios';
 COMMENT ON COLUMN documents.id IS 'Identificador único del documento (UUID)';
 COMMENT ON COLUMN documents.user_document IS 'Número de documento del usuario que sube el archivo';
 COMMENT ON COLUMN documents.application_id IS 'ID de la postulación a la que pertenece el documento';
-COMMENT ON COLUMN documents.filename IS 'Nombre original del archivo';
+COMMENT ON COLUMN documents.filename IS 'Nombre del archivo en el sistema';
+COMMENT ON COLUMN documents.original_filename IS 'Nombre original del archivo';
 COMMENT ON COLUMN documents.file_path IS 'Ruta del archivo en el storage (local o S3)';
 COMMENT ON COLUMN documents.file_size IS 'Tamaño del archivo en bytes';
 COMMENT ON COLUMN documents.mime_type IS 'Tipo MIME del archivo';
 COMMENT ON COLUMN documents.document_type IS 'Tipo de documento (cv, carta_presentacion, etc)';
 COMMENT ON COLUMN documents.uploaded_at IS 'Fecha y hora de carga del documento';
-COMMENT ON COLUMN documents.uploaded_by IS 'ID del usuario que cargó el documento';
+COMMENT ON COLUMN documents.uploaded_by IS 'ID del usuario que cargó el documento (NULL en subidas públicas)';
+COMMENT ON COLUMN documents.content_hash IS 'SHA-256 del contenido; NULL en documentos anteriores a la deduplicación';
+
+COMMENT ON TABLE document_blobs IS 'Archivos físicos compartidos por documentos con el mismo contenido';
+COMMENT ON COLUMN document_blobs.content_hash IS 'SHA-256 del contenido del archivo';
+COMMENT ON COLUMN document_blobs.file_path IS 'Ruta del blob en el storage (local o S3)';
+COMMENT ON COLUMN document_blobs.ref_count IS 'Número de documentos que referencian el blob; 0 mientras espera su borrado en storage_deletions';
+
+COMMENT ON TABLE storage_deletions IS 'Outbox de archivos a eliminar del storage por el worker de limpieza';
+COMMENT ON COLUMN storage_deletions.content_hash IS 'Blob a eliminar si sigue sin referencias; NULL en archivos de documentos anteriores a la deduplicación';
+COMMENT ON COLUMN storage_deletions.attempts IS 'Intentos realizados; al llegar al máximo la fila queda para revisión manual';
+COMMENT ON COLUMN storage_deletions.available_at IS 'Momento a partir del cual la fila puede reclamarse (reintentos y lease del worker)';
+COMMENT ON COLUMN storage_deletions.last_error IS 'Último error al eliminar el archivo';
+
+COMMENT ON TABLE document_list_versions IS 'Contador de borrados por usuario y por postulación, para invalidar los ETag de los listados';
+COMMENT ON COLUMN document_list_versions.scope IS 'Columna del listado: user_document o application_id';
+COMMENT ON COLUMN document_list_versions.version IS 'Se incrementa en cada sentencia que borra documentos del listado';
+
+COMMENT ON TABLE upload_sessions IS 'Subidas reanudables en curso; se eliminan al finalizar o al vencer';
+COMMENT ON COLUMN upload_sessions.file_size IS 'Tamaño total declarado al crear la sesión';
+COMMENT ON COLUMN upload_sessions.received_size IS 'Bytes recibidos: offset en el que debe empezar el próximo chunk';
+COMMENT ON COLUMN upload_sessions.status IS 'open mientras se reciben chunks; completing durante la finalización';
+COMMENT ON COLUMN upload_sessions.content_hash IS 'SHA-256 declarado en subidas directas al storage (NULL en subidas por chunks)';
+COMMENT ON TABLE upload_session_parts IS 'Chunks recibidos de cada sesión y su archivo en el storage';
 
 -- Datos de ejemplo (opcional - comentar si no se necesita)
 -- INSERT INTO documents (
@@ -0,0 +1,261 @@
+"""
+Migración en línea de los archivos al layout actual del storage
+
+Recorre la base de datos por lotes y deja cada archivo en la ruta que le
+corresponde según `StorageLayout` (fan-out por prefijo del hash):
+
+1. legacy: documentos anteriores a la deduplicación (sin content_hash).
+   Se calcula el hash leyendo el archivo, se copia a su ruta de blob y el
+   documento pasa a referenciar ese blob (o uno existente con el mismo
+   contenido).
+2. blobs: blobs guardados con otro fan-out. Se copian a la ruta nueva y se
+   actualizan el blob y sus documentos en una sola transacción.
+
+El servicio puede seguir atendiendo mientras tanto: primero se copia el
+archivo, luego se cambia la ruta en la BD bloqueando la fila (subiendo
+la versión de los listados afectados, para que su ETag cambie), y la ruta
+vieja se encola en `storage_deletions` con un retraso de `--grace`
+segundos. Los workers del API leen la ruta a través de la caché de
+documentos (`DOCUMENT_CACHE_TTL`, 60 s por defecto) y la caché de URLs
+firmadas está indexada por ruta, así que dejan de firmar la ruta vieja
+en cuanto vence esa caché; el --grace debe cubrir además la vigencia de
+las URLs ya entregadas (`S3_URL_EXPIRATION`). Las filas ya migradas se
+saltan, así que el script se puede interrumpir y volver a lanzar.
+
+Uso (desde document-service/):
+    python -m scripts.migrate_storage_layout --dry-run
+    python -m scripts.migrate_storage_layout --batch-size 500 --concurrency 8
+"""
+import argparse
+import asyncio
+import hashlib
+import sys
+import time
+from typing import Optional
+import asyncpg
+from app.config.config import get_settings
+from app.config.container import Container
+from app.domain.repositories.storage_repository import IStorageRepository
+from app.domain.services.storage_layout import StorageLayout
+from app.infrastructure.persistence.postgres_document_repository import PostgresDocumentRepository
+
+
+LEGACY_BATCH_QUERY = """
+    SELECT id, file_path, mime_type FROM documents
+    WHERE content_hash IS NULL AND id > $1
+    ORDER BY id
+    LIMIT $2
+"""
+
+LOCK_LEGACY_QUERY = """
+    SELECT file_path FROM documents
+    WHERE id = $1 AND content_hash IS NULL
+    FOR UPDATE
+"""
+
+# Sube la versión de los listados de los documentos de la CTE `updated`:
+# el ETag cambia en la misma transacción que la ruta y los clientes no se
+# quedan con rutas que el worker borrará al vencer el --grace
+BUMP_LIST_VERSIONS = """
+    INSERT INTO document_list_versions (scope, scope_key, version)
+    SELECT 'user_document', user_document, 1 FROM updated
+    UNION
+    SELECT 'application_id', application_id::text, 1 FROM updated
+    ON CONFLICT (scope, scope_key)
+    DO UPDATE SET version = document_list_versions.version + 1
+"""
+
+ADOPT_LEGACY_QUERY = """
+    WITH updated AS (
+        UPDATE documents SET file_path = $2, content_hash = $3 WHERE id = $1
+        RETURNING user_document, application_id
+    )
+""" + BUMP_LIST_VERSIONS
+
+BLOBS_BATCH_QUERY = """
+    SELECT content_hash, file_path FROM document_blobs
+    WHERE content_hash > $1 AND ref_count > 0
+    ORDER BY content_hash
+    LIMIT $2
+"""
+
+# Los blobs en cero son del worker de limpieza: no se tocan
+LOCK_BLOB_QUERY = """
+    SELECT file_path FROM document_blobs
+    WHERE content_hash = $1 AND ref_count > 0
+    FOR UPDATE
+"""
+
+MOVE_BLOB_QUERY = """
+    WITH blob AS (
+        UPDATE document_blobs SET file_path = $2 WHERE content_hash = $1
+    ),
+    updated AS (
+        UPDATE documents SET file_path = $2 WHERE content_hash = $1
+        RETURNING user_document, application_id
+    )
+""" + BUMP_LIST_VERSIONS
+
+ENQUEUE_QUERY = """
+    INSERT INTO storage_deletions (file_path, content_hash, available_at)
+    VALUES ($1, NULL, CURRENT_TIMESTAMP + make_interval(secs => $2))
+"""
+
+
+class Migration:
+    """Estado compartido de la migración y sus contadores"""
+
+    def __init__(
+        self,
+        pool: asyncpg.Pool,
+        storage: IStorageRepository,
+        layout: StorageLayout,
+        grace: int,
+        dry_run: bool
+    ):
+        self.pool = pool
+        self.storage = storage
+        self.layout = layout
+        self.grace = float(grace)
+        self.dry_run = dry_run
+        self.counts = {'checked': 0, 'migrated': 0, 'deduplicated': 0, 'skipped': 0, 'missing': 0, 'failed': 0}
+
+    async def migrate_legacy(self, row) -> None:
+        """Convertir un documento sin hash en una referencia a su blob"""
+        if self.dry_run:
+            self.counts['migrated'] += 1
+            return
+
+        sha256 = hashlib.sha256()
+        size = 0
+
+        try:
+            async for chunk in self.storage.open_range(row['file_path']):
+                sha256.update(chunk)
+                size += len(chunk)
+        except FileNotFoundError:
+            self.counts['missing'] += 1
+            return
+
+        content_hash = sha256.hexdigest()
+        target_path = self.layout.blob_path(content_hash, self.layout.extension(row['file_path']))
+        await self.storage.copy_file(row['file_path'], target_path)
+
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                current_path = await conn.fetchval(LOCK_LEGACY_QUERY, row['id'])
+
+                # Borrado o migrado mientras tanto; la copia la limpia la reconciliación
+                if current_path != row['file_path']:
+                    self.counts['skipped'] += 1
+                    return
+
+                blob = await conn.fetchrow(
+                    PostgresDocumentRepository.STATEMENTS['acquire_blob'],
+                    content_hash, target_path, size, row['mime_type']
+                )
+                await conn.execute(ADOPT_LEGACY_QUERY, row['id'], blob['file_path'], content_hash)
+                await conn.execute(ENQUEUE_QUERY, row['file_path'], self.grace)
+
+        self.counts['migrated' if blob['created'] else 'deduplicated'] += 1
+
+    async def migrate_blob(self, row) -> None:
+        """Mover un blob a la ruta del layout actual"""
+        target_path = self.layout.blob_path(row['content_hash'], self.layout.extension(row['file_path']))
+
+        if row['file_path'] == target_path:
+            return
+
+        if self.dry_run:
+            self.counts['migrated'] += 1
+            return
+
+        try:
+            await self.storage.copy_file(row['file_path'], target_path)
+        except FileNotFoundError:
+            self.counts['missing'] += 1
+            return
+
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                current_path = await conn.fetchval(LOCK_BLOB_QUERY, row['content_hash'])
+
+                if current_path != row['file_path']:
+                    self.counts['skipped'] += 1
+                    return
+
+                await conn.execute(MOVE_BLOB_QUERY, row['content_hash'], target_path)
+                await conn.execute(ENQUEUE_QUERY, row['file_path'], self.grace)
+
+        self.counts['migrated'] += 1
+
+    async def run_phase(self, name: str, query: str, key: str, start: Optional[str], migrate, batch_size: int, concurrency: int) -> None:
+        """Recorrer una tabla por keyset y migrar cada lote con concurrencia acotada"""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def process(row) -> None:
+            async with semaphore:
+                try:
+                    await migrate(row)
+                except Exception as e:
+                    self.counts['failed'] += 1
+                    print(f"[{name}] Error con {row['file_path']}: {str(e)}", file=sys.stderr)
+
+        position = start
+
+        while True:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(query, position, batch_size)
+
+            if not rows:
+                break
+
+            await asyncio.gather(*(process(row) for row in rows))
+            self.counts['checked'] += len(rows)
+            position = rows[-1][key]
+
+            summary = ', '.join(f"{k}={v}" for k, v in self.counts.items())
+            print(f"[{name}] {summary}", file=sys.stderr)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--batch-size', type=int, default=200, help='Filas leídas por lote')
+    parser.add_argument('--concurrency', type=int, default=4, help='Archivos migrados en paralelo')
+    parser.add_argument('--grace', type=int, default=3600, help='Segundos antes de borrar la ruta vieja')
+    parser.add_argument('--dry-run', action='store_true', help='Solo contar lo que se migraría')
+    args = parser.parse_args()
+
+    settings = get_settings()
+    container = Container()
+    layout = container.storage_layout()
+    pool = await asyncpg.create_pool(settings.database_url, min_size=1, max_size=args.concurrency + 1)
+    migration = Migration(pool, container.storage_repository(), layout, args.grace, args.dry_run)
+    started = time.perf_counter()
+
+    print(
+        f"Layout: fan-out de {layout.fanout_depth} nivel(es) de {layout.fanout_width} caracteres"
+        + (" (dry run)" if args.dry_run else ""),
+        file=sys.stderr
+    )
+
+    try:
+        await migration.run_phase(
+            'legacy', LEGACY_BATCH_QUERY, 'id', '00000000-0000-0000-0000-000000000000',
+            migration.migrate_legacy, args.batch_size, args.concurrency
+        )
+        # Después de legacy: los blobs reutilizados por esa fase también se normalizan
+        await migration.run_phase(
+            'blobs', BLOBS_BATCH_QUERY, 'content_hash', '',
+            migration.migrate_blob, args.batch_size, args.concurrency
+        )
+    finally:
+        await pool.close()
+
+    elapsed = time.perf_counter() - started
+    summary = ', '.join(f"{key}={value}" for key, value in migration.counts.items())
+    print(f"Migración terminada en {elapsed:.1f}s: {summary}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
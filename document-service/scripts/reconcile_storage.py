@@ -0,0 +1,267 @@
+"""
+Reconciliación entre el storage y la base de datos
+
+Cruza en un solo recorrido las rutas referenciadas en PostgreSQL (leídas
+con un cursor del lado del servidor) y el listado del storage, ambos en
+orden de bytes, sin cargar ninguno completo en memoria:
+
+- orphan:  archivo en el storage que ninguna fila referencia
+- missing: fila de `documents`/`document_blobs` cuyo archivo no existe
+
+Las miniaturas (`thumbnails/`) no tienen fila propia: son válidas mientras
+exista el blob del que derivan y estén en la ruta del layout actual.
+
+Los archivos y filas más recientes que `--min-age` se ignoran para no
+confundir subidas en curso con inconsistencias. El avance se guarda en un
+checkpoint JSON y una ejecución posterior continúa desde ahí.
+
+Con `--repair` los huérfanos se encolan en `storage_deletions` y los borra
+el worker de limpieza (los blobs pasan antes a ser una fila con ref_count
+0, así una subida concurrente del mismo contenido no pierde el archivo).
+Los archivos faltantes solo se reportan.
+
+Uso (desde document-service/):
+    python -m scripts.reconcile_storage --report reconcile.jsonl
+    python -m scripts.reconcile_storage --repair --min-age 86400
+"""
+import argparse
+import asyncio
+import json
+import mimetypes
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator
+import asyncpg
+from app.config.config import get_settings
+from app.config.container import Container
+from app.domain.repositories.storage_repository import IStorageRepository, StoredFile
+from app.domain.services.storage_layout import StorageLayout
+
+
+# Todas las rutas conocidas por la BD, una fila por ruta. `pending` indica
+# que solo la referencian blobs sin documentos, la outbox de borrados o
+# chunks de subidas reanudables
+REFERENCES_QUERY = """
+    SELECT file_path, bool_and(pending) AS pending, max(created_at) AS created_at
+    FROM (
+        SELECT file_path COLLATE "C" AS file_path, false AS pending, uploaded_at AS created_at
+        FROM documents
+        UNION ALL
+        SELECT file_path COLLATE "C", ref_count <= 0, created_at
+        FROM document_blobs
+        UNION ALL
+        SELECT file_path COLLATE "C", true, created_at
+        FROM storage_deletions
+        UNION ALL
+        SELECT p.file_path COLLATE "C", true, s.created_at
+        FROM upload_session_parts p JOIN upload_sessions s ON s.id = p.session_id
+    ) AS refs
+    WHERE file_path > $1
+    GROUP BY file_path
+    ORDER BY file_path
+"""
+
+# Adoptar un blob huérfano como fila con ref_count 0 para que el worker lo
+# elimine bloqueando la fila; si ya existe es que alguien lo referenció
+ADOPT_BLOB_QUERY = """
+    INSERT INTO document_blobs (content_hash, file_path, file_size, mime_type, ref_count)
+    VALUES ($1, $2, $3, $4, 0)
+    ON CONFLICT (content_hash) DO NOTHING
+    RETURNING content_hash
+"""
+
+ENQUEUE_QUERY = "INSERT INTO storage_deletions (file_path, content_hash) VALUES ($1, $2)"
+
+BLOB_EXISTS_QUERY = "SELECT EXISTS(SELECT 1 FROM document_blobs WHERE content_hash = $1)"
+
+
+class Checkpoint:
+    """Posición y contadores de la reconciliación, guardados de forma atómica"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.position = ''
+        self.done = False
+        self.counts = {'checked': 0, 'ok': 0, 'orphan': 0, 'missing': 0, 'pending': 0, 'recent': 0, 'repaired': 0}
+
+    def load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path) as f:
+            data = json.load(f)
+
+        # Una ejecución terminada no se reanuda: se empieza de nuevo
+        if data.get('done'):
+            return
+
+        self.position = data['position']
+        self.counts.update(data['counts'])
+
+    def save(self) -> None:
+        temp_path = f"{self.path}.tmp"
+
+        with open(temp_path, 'w') as f:
+            json.dump({'position': self.position, 'counts': self.counts, 'done': self.done}, f)
+
+        os.replace(temp_path, self.path)
+
+
+async def stream_references(conn: asyncpg.Connection, position: str, prefetch: int) -> AsyncIterator:
+    """Rutas referenciadas en la BD mediante un cursor del lado del servidor"""
+    async with conn.transaction(readonly=True):
+        async for record in conn.cursor(REFERENCES_QUERY, position, prefetch=prefetch):
+            yield record
+
+
+async def repair_orphan(conn: asyncpg.Connection, layout: StorageLayout, stored_file: StoredFile) -> bool:
+    """Encolar el borrado de un archivo huérfano"""
+    content_hash = layout.blob_hash(stored_file.path)
+
+    async with conn.transaction():
+        if content_hash is None:
+            await conn.execute(ENQUEUE_QUERY, stored_file.path, None)
+            return True
+
+        mime_type = mimetypes.guess_type(stored_file.path)[0] or 'application/octet-stream'
+        adopted = await conn.fetchval(
+            ADOPT_BLOB_QUERY, content_hash, stored_file.path, stored_file.size, mime_type
+        )
+
+        if adopted is None:
+            return False
+
+        await conn.execute(ENQUEUE_QUERY, stored_file.path, content_hash)
+        return True
+
+
+async def reconcile(
+    read_conn: asyncpg.Connection,
+    write_conn: asyncpg.Connection,
+    storage: IStorageRepository,
+    layout: StorageLayout,
+    checkpoint: Checkpoint,
+    repair: bool,
+    min_age: int,
+    prefetch: int,
+    checkpoint_every: int,
+    report
+) -> None:
+    """Cruzar ambos listados ordenados y reportar las diferencias"""
+    counts = checkpoint.counts
+    storage_cutoff = datetime.now(timezone.utc) - timedelta(seconds=min_age)
+    # Las fechas de la BD se guardan en UTC sin zona horaria
+    db_cutoff = storage_cutoff.replace(tzinfo=None)
+
+    references = stream_references(read_conn, checkpoint.position, prefetch)
+    files = storage.list_files(start_after=checkpoint.position or None)
+    reference = await anext(references, None)
+    stored_file = await anext(files, None)
+
+    def emit(kind: str, path: str, **extra) -> None:
+        counts[kind] += 1
+        report.write(json.dumps({'type': kind, 'path': path, **extra}, default=str) + '\n')
+
+    while reference is not None or stored_file is not None:
+        if stored_file is None or (reference is not None and reference['file_path'] < stored_file.path):
+            # Solo en la BD
+            path = reference['file_path']
+
+            if reference['pending']:
+                counts['pending'] += 1
+            elif reference['created_at'] is not None and reference['created_at'] > db_cutoff:
+                counts['recent'] += 1
+            else:
+                emit('missing', path)
+
+            reference = await anext(references, None)
+        elif reference is None or stored_file.path < reference['file_path']:
+            # Solo en el storage
+            path = stored_file.path
+            thumbnail_hash = layout.thumbnail_hash(path)
+
+            if stored_file.modified > storage_cutoff:
+                counts['recent'] += 1
+            elif (
+                thumbnail_hash is not None
+                and path == layout.thumbnail_path(thumbnail_hash)
+                and await write_conn.fetchval(BLOB_EXISTS_QUERY, thumbnail_hash)
+            ):
+                counts['ok'] += 1
+            else:
+                emit('orphan', path, size=stored_file.size, modified=stored_file.modified.isoformat())
+
+                if repair and await repair_orphan(write_conn, layout, stored_file):
+                    counts['repaired'] += 1
+
+            stored_file = await anext(files, None)
+        else:
+            path = stored_file.path
+            counts['ok'] += 1
+            reference = await anext(references, None)
+            stored_file = await anext(files, None)
+
+        # Todo lo que es <= path ya está revisado en ambos listados
+        checkpoint.position = path
+        counts['checked'] += 1
+
+        if counts['checked'] % checkpoint_every == 0:
+            checkpoint.save()
+            report.flush()
+
+    checkpoint.done = True
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repair', action='store_true', help='Encolar el borrado de los archivos huérfanos')
+    parser.add_argument('--min-age', type=int, default=3600, help='Ignorar archivos y filas más recientes (segundos)')
+    parser.add_argument('--checkpoint', default='reconcile_checkpoint.json')
+    parser.add_argument('--checkpoint-every', type=int, default=10000, help='Rutas revisadas entre checkpoints')
+    parser.add_argument('--restart', action='store_true', help='Ignorar el checkpoint y empezar desde el principio')
+    parser.add_argument('--prefetch', type=int, default=1000, help='Filas por ida y vuelta del cursor')
+    parser.add_argument('--report', help='Archivo JSONL de diferencias (por defecto stdout)')
+    args = parser.parse_args()
+
+    settings = get_settings()
+    container = Container()
+    storage = container.storage_repository()
+
+    checkpoint = Checkpoint(args.checkpoint)
+    if not args.restart:
+        checkpoint.load()
+
+    read_conn = await asyncpg.connect(settings.database_url)
+    write_conn = await asyncpg.connect(settings.database_url)
+    report = open(args.report, 'a') if args.report else sys.stdout
+    started = time.perf_counter()
+
+    try:
+        await reconcile(
+            read_conn,
+            write_conn,
+            storage,
+            container.storage_layout(),
+            checkpoint,
+            repair=args.repair,
+            min_age=args.min_age,
+            prefetch=args.prefetch,
+            checkpoint_every=args.checkpoint_every,
+            report=report
+        )
+    finally:
+        checkpoint.save()
+        await read_conn.close()
+        await write_conn.close()
+        if report is not sys.stdout:
+            report.close()
+
+    elapsed = time.perf_counter() - started
+    summary = ', '.join(f"{key}={value}" for key, value in checkpoint.counts.items())
+    print(f"Reconciliación terminada en {elapsed:.1f}s: {summary}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,120 @@
+"""
+Collector OTLP/HTTP mínimo para desarrollo
+
+Sustituto local del OpenTelemetry Collector: acepta `POST /v1/traces` con
+el cuerpo JSON que envía `OtlpJsonSpanExporter` y guarda cada span en un
+archivo JSONL con la misma forma que `JsonlSpanExporter`, de modo que
+`scripts.trace_report` sirve igual para ambos exportadores.
+
+Solo entiende la codificación JSON de OTLP (no protobuf).
+
+Uso (desde document-service/):
+    python -m scripts.trace_collector --port 4318 --output traces/collector.jsonl
+    TRACING_EXPORTER=otlp TRACING_OTLP_ENDPOINT=http://localhost:4318 uvicorn app.main:app
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+SPAN_KINDS = {1: 'internal', 2: 'server', 3: 'client'}
+
+
+def decode_value(value: dict):
+    if 'intValue' in value:
+        return int(value['intValue'])
+    if 'doubleValue' in value:
+        return float(value['doubleValue'])
+    if 'boolValue' in value:
+        return bool(value['boolValue'])
+    return value.get('stringValue')
+
+
+def decode_request(body: dict) -> list[dict]:
+    """ExportTraceServiceRequest en JSON -> spans en la forma plana del JSONL"""
+    spans = []
+
+    for resource_spans in body.get('resourceSpans', []):
+        for scope_spans in resource_spans.get('scopeSpans', []):
+            for span in scope_spans.get('spans', []):
+                start = int(span['startTimeUnixNano'])
+                end = int(span['endTimeUnixNano'])
+                status = span.get('status', {})
+                spans.append({
+                    'trace_id': span['traceId'],
+                    'span_id': span['spanId'],
+                    'parent_span_id': span.get('parentSpanId') or None,
+                    'name': span['name'],
+                    'kind': SPAN_KINDS.get(span.get('kind'), 'internal'),
+                    'start_time_unix_nano': start,
+                    'end_time_unix_nano': end,
+                    'duration_ms': round((end - start) / 1e6, 3),
+                    'attributes': {
+                        attribute['key']: decode_value(attribute['value'])
+                        for attribute in span.get('attributes', [])
+                    },
+                    'status': 'error' if status.get('code') == 2 else 'ok',
+                    'error': status.get('message') if status.get('code') == 2 else None
+                })
+
+    return spans
+
+
+def build_handler(output: str, lock: threading.Lock):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path.rstrip('/') != '/v1/traces':
+                self.send_error(404)
+                return
+
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                spans = decode_request(json.loads(self.rfile.read(length)))
+            except (ValueError, KeyError) as e:
+                self.send_error(400, str(e))
+                return
+
+            lines = ''.join(json.dumps(span) + '\n' for span in spans)
+
+            with lock:
+                with open(output, 'a', encoding='utf-8') as f:
+                    f.write(lines)
+
+            body = b'{}'
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            print(f"{len(spans)} spans recibidos", file=sys.stderr)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=4318)
+    parser.add_argument('--output', default='traces/collector.jsonl')
+    args = parser.parse_args()
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    server = ThreadingHTTPServer((args.host, args.port), build_handler(args.output, threading.Lock()))
+    print(f"Escuchando en http://{args.host}:{args.port}/v1/traces -> {args.output}", file=sys.stderr)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+"""
+Desglose de las trazas más lentas a partir del JSONL de spans
+
+Lee el archivo que escribe `JsonlSpanExporter` (o `scripts.trace_collector`)
+y muestra, para las N peticiones más lentas, el árbol de spans con la
+duración total y el tiempo propio de cada etapa (lo que no está cubierto
+por sus hijos), además de los atributos útiles: SQL, filas y bytes.
+
+Con `--folded` imprime en cambio las pilas en formato "collapsed"
+(`raíz;hijo;nieto microsegundos`), que aceptan flamegraph.pl,
+speedscope o inferno para dibujar el flame graph de las trazas elegidas.
+
+Uso (desde document-service/):
+    python -m scripts.trace_report traces/spans.jsonl --top 5
+    python -m scripts.trace_report traces/spans.jsonl --route '/api/v1/documents/upload'
+    python -m scripts.trace_report traces/spans.jsonl --top 100 --folded > upload.folded
+"""
+import argparse
+import json
+import sys
+from collections import defaultdict
+from typing import Optional
+
+
+ATTRIBUTES = ('http.status_code', 'db.rows', 'storage.bytes', 'http.request_body_bytes',
+              'upload.source_wait_ms', 'tracing.dropped_spans')
+
+
+def load_traces(path: str) -> dict[str, list[dict]]:
+    traces = defaultdict(list)
+
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                span = json.loads(line)
+                traces[span['trace_id']].append(span)
+
+    return traces
+
+
+def find_root(spans: list[dict]) -> Optional[dict]:
+    ids = {span['span_id'] for span in spans}
+    roots = [span for span in spans if span.get('parent_span_id') not in ids]
+    return max(roots, key=lambda span: span['duration_ms'], default=None)
+
+
+def build_children(spans: list[dict]) -> dict[str, list[dict]]:
+    children = defaultdict(list)
+
+    for span in spans:
+        children[span.get('parent_span_id')].append(span)
+
+    for siblings in children.values():
+        siblings.sort(key=lambda span: span['start_time_unix_nano'])
+
+    return children
+
+
+def self_time(span: dict, children: dict) -> float:
+    """Duración menos la unión de los intervalos de sus hijos (pueden solaparse)"""
+    intervals = sorted(
+        (child['start_time_unix_nano'], child['end_time_unix_nano'])
+        for child in children.get(span['span_id'], [])
+    )
+    covered = 0
+    current_start = current_end = None
+
+    for start, end in intervals:
+        start = max(start, span['start_time_unix_nano'])
+        end = min(end, span['end_time_unix_nano'])
+
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                covered += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+
+    if current_end is not None:
+        covered += current_end - current_start
+
+    return max(0.0, span['duration_ms'] - max(0, covered) / 1e6)
+
+
+def describe(span: dict) -> str:
+    attributes = span.get('attributes', {})
+    details = [f"{key}={attributes[key]}" for key in ATTRIBUTES if key in attributes]
+
+    if span.get('error'):
+        details.append(f"error={span['error']}")
+
+    if 'db.statement' in attributes:
+        statement = attributes['db.statement']
+        details.append(statement if len(statement) <= 80 else statement[:77] + '...')
+
+    return '  '.join(details)
+
+
+def print_tree(span: dict, children: dict, depth: int = 0) -> None:
+    own = self_time(span, children)
+    name = '  ' * depth + span['name']
+    print(f"{span['duration_ms']:>10.2f} {own:>10.2f}  {name:<60} {describe(span)}")
+
+    for child in children.get(span['span_id'], []):
+        print_tree(child, children, depth + 1)
+
+
+def print_folded(span: dict, children: dict, stacks: dict, prefix: str = '') -> None:
+    stack = f"{prefix};{span['name']}" if prefix else span['name']
+    stacks[stack] += self_time(span, children) * 1000
+
+    for child in children.get(span['span_id'], []):
+        print_folded(child, children, stacks, stack)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', help='Archivo JSONL de spans')
+    parser.add_argument('--top', type=int, default=5, help='Trazas más lentas a mostrar')
+    parser.add_argument('--route', help='Solo trazas cuya raíz tenga este http.route')
+    parser.add_argument('--folded', action='store_true', help='Salida en formato collapsed para flame graphs')
+    args = parser.parse_args()
+
+    roots = []
+
+    for spans in load_traces(args.path).values():
+        root = find_root(spans)
+
+        if root is None:
+            continue
+        if args.route and root.get('attributes', {}).get('http.route') != args.route:
+            continue
+
+        roots.append((root, build_children(spans)))
+
+    roots.sort(key=lambda item: item[0]['duration_ms'], reverse=True)
+    selected = roots[:args.top]
+
+    if args.folded:
+        stacks = defaultdict(float)
+        for root, children in selected:
+            print_folded(root, children, stacks)
+        for stack, micros in stacks.items():
+            if micros >= 1:
+                print(f"{stack} {int(micros)}")
+        return
+
+    print(f"{len(roots)} trazas; las {len(selected)} más lentas:", file=sys.stderr)
+
+    for root, children in selected:
+        print(f"\ntrace {root['trace_id']}")
+        print(f"{'total ms':>10} {'propio ms':>10}  {'span':<60} detalle")
+        print_tree(root, children)
+
+
+if __name__ == '__main__':
+    main()
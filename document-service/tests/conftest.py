@@ -0,0 +1,42 @@
+"""
+Fixtures compartidas por las pruebas
+"""
+import uuid
+from datetime import datetime
+import pytest
+from app.domain.entities.document import Document
+from app.infrastructure.storage import MemoryStorageRepository
+from benchmarks.support import InMemoryDocumentRepository
+
+
+@pytest.fixture
+def make_document():
+    """Construir documentos válidos variando solo los campos indicados"""
+    def factory(**overrides) -> Document:
+        document_id = overrides.pop('id', None) or str(uuid.uuid4())
+        values = {
+            'id': document_id,
+            'user_document': '1234567890',
+            'application_id': '84a17550-56c4-4299-9f97-0de9856ea586',
+            'filename': f"cv_{document_id}.pdf",
+            'original_filename': 'cv.pdf',
+            'file_path': f"blobs/{document_id}.pdf",
+            'file_size': 3,
+            'mime_type': 'application/pdf',
+            'document_type': 'cv',
+            'uploaded_at': datetime(2025, 11, 13, 12, 0, 0),
+            **overrides
+        }
+        return Document(**values)
+
+    return factory
+
+
+@pytest.fixture
+def document_repository() -> InMemoryDocumentRepository:
+    return InMemoryDocumentRepository()
+
+
+@pytest.fixture
+def storage() -> MemoryStorageRepository:
+    return MemoryStorageRepository()
@@ -0,0 +1,167 @@
+"""
+Pruebas de TTLCache, PresignedUrlCache y CachedJWTService
+"""
+import time
+from jose import jwt
+from app.infrastructure.auth.cached_jwt_service import CachedJWTService
+from app.infrastructure.cache.ttl_cache import TTLCache
+from app.infrastructure.cache.url_cache import PresignedUrlCache
+
+
+SECRET = 'test-secret'
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_entries():
+    clock = FakeClock()
+    cache = TTLCache(max_size=10, ttl=60, clock=clock)
+    cache.set('a', 1)
+
+    clock.now += 59.9
+    assert cache.get('a') == 1
+
+    clock.now += 0.1
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_per_entry_ttl():
+    clock = FakeClock()
+    cache = TTLCache(ttl=60, clock=clock)
+    cache.set('short', 1, ttl=5)
+    cache.set('long', 2)
+
+    clock.now += 10
+
+    assert cache.get('short') is None
+    assert cache.get('long') == 2
+
+
+def test_ttl_cache_non_positive_ttl_removes_entry():
+    cache = TTLCache(ttl=60)
+    cache.set('a', 1)
+
+    cache.set('a', 2, ttl=0)
+
+    assert cache.get('a', 'missing') == 'missing'
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+
+def test_ttl_cache_counts_hits_and_misses():
+    clock = FakeClock()
+    cache = TTLCache(ttl=1, clock=clock)
+    cache.set('a', 1)
+
+    cache.get('a')
+    cache.get('b')
+    clock.now += 1
+    cache.get('a')
+
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_url_cache_keeps_urls_until_safety_margin():
+    cache = PresignedUrlCache(expiration=3600, safety_margin=300)
+    clock = FakeClock()
+    cache._urls._clock = clock
+    cache.put_url('blobs/a.pdf', 'https://signed/a')
+
+    clock.now += 3299
+    assert cache.get_url('blobs/a.pdf') == 'https://signed/a'
+
+    clock.now += 1
+    assert cache.get_url('blobs/a.pdf') is None
+
+
+def test_url_cache_invalidate_url():
+    cache = PresignedUrlCache()
+    cache.put_url('blobs/a.pdf', 'https://signed/a')
+
+    cache.invalidate_url('blobs/a.pdf')
+
+    assert cache.get_url('blobs/a.pdf') is None
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def _token(**claims) -> str:
+    return jwt.encode({'sub': 'user', 'role': 'admin', **claims}, SECRET, algorithm='HS256')
+
+
+def _cached_service(clock: FakeClock, cache_ttl: int = 300) -> CachedJWTService:
+    service = CachedJWTService(SECRET, cache_ttl=cache_ttl)
+    service.cache = TTLCache(max_size=100, ttl=cache_ttl, clock=clock)
+    return service
+
+
+def test_cached_jwt_reuses_verified_payload():
+    service = _cached_service(FakeClock())
+    token = _token(exp=int(time.time()) + 3600)
+
+    first = service.verify_token(token)
+    second = service.verify_token(token)
+
+    assert first == second
+    assert first['sub'] == 'user'
+    assert service.cache.hits == 1
+
+
+def test_cached_jwt_caps_ttl_at_token_exp():
+    clock = FakeClock()
+    service = _cached_service(clock, cache_ttl=300)
+    token = _token(exp=int(time.time()) + 10)
+
+    assert service.verify_token(token) is not None
+
+    clock.now += 5
+    assert service.cache.get(next(iter(service.cache._entries))) is not None
+
+    clock.now += 6
+    assert len(service.cache) == 1
+    assert service.cache.get(next(iter(service.cache._entries))) is None
+
+
+def test_cached_jwt_uses_cache_ttl_when_exp_is_later():
+    clock = FakeClock()
+    service = _cached_service(clock, cache_ttl=60)
+    service.verify_token(_token(exp=int(time.time()) + 3600))
+
+    expires_at, _ = next(iter(service.cache._entries.values()))
+
+    assert expires_at == clock.now + 60
+
+
+def test_cached_jwt_does_not_cache_invalid_tokens():
+    service = _cached_service(FakeClock())
+
+    assert service.verify_token(_token(exp=int(time.time()) - 10)) is None
+    assert service.verify_token('not-a-token') is None
+    assert len(service.cache) == 0
+
+
+def test_cached_jwt_does_not_store_raw_token():
+    service = _cached_service(FakeClock())
+    token = _token(exp=int(time.time()) + 3600)
+
+    service.verify_token(token)
+
+    assert token not in service.cache._entries
+    assert token.encode() not in service.cache._entries
@@ -0,0 +1,86 @@
+"""
+Pruebas de la resolución de URLs con caché de URLs firmadas
+"""
+import asyncio
+from app.application.usecases.get_document_url import GetDocumentUrlUseCase
+from app.application.usecases.get_document_urls import GetDocumentUrlsUseCase
+from app.infrastructure.cache.url_cache import PresignedUrlCache
+
+
+class CountingStorage:
+    """Storage que solo firma URLs y cuenta las firmas"""
+
+    def __init__(self):
+        self.signed = []
+
+    async def get_file_url(self, file_path: str, expiration: int = 3600) -> str:
+        self.signed.append(file_path)
+        return f"https://signed/{file_path}?n={len(self.signed)}"
+
+
+def test_url_is_signed_once_per_path(document_repository, make_document):
+    storage = CountingStorage()
+    usecase = GetDocumentUrlUseCase(document_repository, storage, PresignedUrlCache())
+    document = asyncio.run(document_repository.save(make_document()))
+
+    first = asyncio.run(usecase.execute(document.id))
+    second = asyncio.run(usecase.execute(document.id))
+
+    assert first == second
+    assert storage.signed == [document.file_path]
+
+
+def test_deleted_document_has_no_url_even_if_cached(document_repository, make_document):
+    storage = CountingStorage()
+    url_cache = PresignedUrlCache()
+    usecase = GetDocumentUrlUseCase(document_repository, storage, url_cache)
+    document = asyncio.run(document_repository.save(make_document()))
+    asyncio.run(usecase.execute(document.id))
+
+    # Borrado por otro proceso: la caché de URLs no se entera
+    del document_repository.documents[document.id]
+
+    assert url_cache.get_url(document.file_path) is not None
+    assert asyncio.run(usecase.execute(document.id)) is None
+
+
+def test_moved_document_is_signed_at_new_path(document_repository, make_document):
+    storage = CountingStorage()
+    usecase = GetDocumentUrlUseCase(document_repository, storage, PresignedUrlCache())
+    document = asyncio.run(document_repository.save(make_document()))
+    asyncio.run(usecase.execute(document.id))
+
+    moved = document.model_copy(update={'file_path': 'blobs/nuevo.pdf'})
+    document_repository.documents[document.id] = moved
+
+    assert asyncio.run(usecase.execute(document.id)).startswith('https://signed/blobs/nuevo.pdf')
+
+
+def test_batch_urls_skip_invalid_and_missing_ids(document_repository, make_document):
+    storage = CountingStorage()
+    usecase = GetDocumentUrlsUseCase(document_repository, storage, PresignedUrlCache())
+    shared = 'blobs/compartido.pdf'
+    first = asyncio.run(document_repository.save(make_document(file_path=shared)))
+    second = asyncio.run(document_repository.save(make_document(file_path=shared)))
+    missing = make_document()
+
+    urls = asyncio.run(usecase.execute([first.id, 'no-es-uuid', second.id, missing.id, first.id]))
+
+    assert set(urls) == {first.id, second.id}
+    assert urls[first.id] == urls[second.id]
+    assert storage.signed == [shared]
+
+
+def test_batch_urls_reuse_cached_urls(document_repository, make_document):
+    storage = CountingStorage()
+    url_cache = PresignedUrlCache()
+    single = GetDocumentUrlUseCase(document_repository, storage, url_cache)
+    batch = GetDocumentUrlsUseCase(document_repository, storage, url_cache)
+    first = asyncio.run(document_repository.save(make_document()))
+    second = asyncio.run(document_repository.save(make_document()))
+    asyncio.run(single.execute(first.id))
+
+    urls = asyncio.run(batch.execute([first.id, second.id]))
+
+    assert len(urls) == 2
+    assert storage.signed == [first.file_path, second.file_path]
@@ -0,0 +1,65 @@
+"""
+Pruebas del cursor de paginación keyset
+"""
+import base64
+from datetime import datetime
+import pytest
+from app.application.usecases.pagination import (
+    decode_cursor,
+    encode_cursor,
+    encode_cursor_key,
+    paginate
+)
+
+
+DOCUMENT_ID = '123e4567-e89b-12d3-a456-426614174000'
+
+
+def test_cursor_round_trip(make_document):
+    document = make_document(id=DOCUMENT_ID, uploaded_at=datetime(2025, 11, 13, 12, 0, 0, 123456))
+
+    cursor = encode_cursor(document)
+
+    assert '=' not in cursor
+    assert decode_cursor(cursor) == (document.uploaded_at, DOCUMENT_ID)
+
+
+def test_cursor_key_matches_document_cursor(make_document):
+    document = make_document(id=DOCUMENT_ID)
+
+    assert encode_cursor_key((document.uploaded_at, document.id)) == encode_cursor(document)
+
+
+def test_decode_cursor_normalizes_uuid():
+    cursor = encode_cursor_key((datetime(2025, 1, 1), DOCUMENT_ID.upper()))
+
+    assert decode_cursor(cursor)[1] == DOCUMENT_ID
+
+
+@pytest.mark.parametrize('cursor', [
+    '',
+    'no es base64',
+    base64.urlsafe_b64encode(b'2025-01-01T00:00:00').decode(),
+    base64.urlsafe_b64encode(b'ayer|123e4567-e89b-12d3-a456-426614174000').decode(),
+    base64.urlsafe_b64encode(b'2025-01-01T00:00:00|no-es-uuid').decode(),
+    base64.urlsafe_b64encode(b'a|b|c').decode(),
+    base64.urlsafe_b64encode(b'\xff\xfe').decode(),
+])
+def test_decode_cursor_rejects_invalid(cursor):
+    with pytest.raises(ValueError, match='Cursor de paginación inválido'):
+        decode_cursor(cursor)
+
+
+def test_paginate_last_page_has_no_cursor(make_document):
+    documents = [make_document() for _ in range(3)]
+
+    assert paginate(documents, 3) == (documents, None)
+
+
+def test_paginate_cursor_points_after_last_item(make_document):
+    documents = [make_document() for _ in range(4)]
+
+    page, cursor = paginate(documents, 3)
+
+    assert page == documents[:3]
+    assert decode_cursor(cursor) == (documents[2].uploaded_at, documents[2].id)
@@ -0,0 +1,133 @@
+"""
+Pruebas de Range, ETag y FileRangeResponse
+"""
+import asyncio
+import pytest
+from app.presentation.responses.range_response import (
+    ByteRange,
+    FileRangeResponse,
+    RangeNotSatisfiableError,
+    etag_matches,
+    parse_range
+)
+
+
+@pytest.mark.parametrize('header, expected', [
+    ('bytes=0-99', ByteRange(0, 99)),
+    ('bytes=100-', ByteRange(100, 999)),
+    ('bytes=-100', ByteRange(900, 999)),
+    ('bytes=-5000', ByteRange(0, 999)),
+    ('bytes=900-5000', ByteRange(900, 999)),
+    ('BYTES = 10-19', ByteRange(10, 19)),
+])
+def test_parse_range_single_ranges(header, expected):
+    assert parse_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize('header', [
+    None,
+    '',
+    'items=0-10',
+    'bytes=0-10,20-30',
+    'bytes=abc',
+    'bytes=-',
+    'bytes=10-5',
+    'bytes=a-10',
+    'bytes=10-b',
+])
+def test_parse_range_ignores_invalid_headers(header):
+    assert parse_range(header, 1000) is None
+
+
+@pytest.mark.parametrize('header', ['bytes=1000-', 'bytes=2000-3000', 'bytes=-0'])
+def test_parse_range_not_satisfiable(header):
+    with pytest.raises(RangeNotSatisfiableError):
+        parse_range(header, 1000)
+
+
+def test_byte_range_length_is_inclusive():
+    assert ByteRange(10, 19).length == 10
+
+
+@pytest.mark.parametrize('header, expected', [
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"x", "abc"', True),
+    ('*', True),
+    ('"abd"', False),
+    ('', False),
+    (None, False),
+])
+def test_etag_matches(header, expected):
+    assert etag_matches(header, '"abc"') is expected
+
+
+def test_etag_matches_weak_current_etag():
+    assert etag_matches('"abc"', 'W/"abc"')
+
+
+def _serve(response: FileRangeResponse, extensions: dict = None) -> list[dict]:
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    async def receive():
+        return {'type': 'http.disconnect'}
+
+    scope = {'type': 'http', 'extensions': extensions or {}}
+    asyncio.run(response(scope, receive, send))
+    return messages
+
+
+def test_file_range_response_sends_only_the_range(tmp_path):
+    path = tmp_path / 'file.bin'
+    content = bytes(range(256)) * 4096
+    path.write_bytes(content)
+
+    response = FileRangeResponse(str(path), ByteRange(1000, 600_000), status_code=206)
+    response.chunk_size = 64 * 1024
+    messages = _serve(response)
+
+    assert messages[0]['status'] == 206
+    assert (b'content-length', b'599001') in messages[0]['headers']
+    body = b''.join(message['body'] for message in messages[1:])
+    assert body == content[1000:600_001]
+    assert messages[-1]['more_body'] is False
+
+
+def test_file_range_response_empty_file(tmp_path):
+    path = tmp_path / 'empty.bin'
+    path.write_bytes(b'')
+
+    messages = _serve(FileRangeResponse(str(path), ByteRange(0, -1)))
+
+    assert [message['type'] for message in messages] == ['http.response.start', 'http.response.body']
+    assert messages[1] == {'type': 'http.response.body', 'body': b'', 'more_body': False}
+
+
+def test_file_range_response_uses_zerocopysend(tmp_path):
+    path = tmp_path / 'file.bin'
+    path.write_bytes(b'0123456789')
+
+    messages = _serve(
+        FileRangeResponse(str(path), ByteRange(2, 5), status_code=206),
+        extensions={'http.response.zerocopysend': {}}
+    )
+
+    assert messages[1]['type'] == 'http.response.zerocopysend'
+    assert (messages[1]['offset'], messages[1]['count']) == (2, 4)
+
+
+def test_file_range_response_missing_file_fails_before_headers(tmp_path):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    response = FileRangeResponse(str(tmp_path / 'missing.bin'), ByteRange(0, 9))
+
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(response({'type': 'http'}, None, send))
+
+    assert messages == []
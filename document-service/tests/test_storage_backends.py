@@ -0,0 +1,30 @@
+"""
+Suite de conformidad de storage sobre los backends que no necesitan red
+"""
+import asyncio
+import pytest
+from app.infrastructure.storage import LocalStorageRepository, MemoryStorageRepository
+from benchmarks.storage_conformance import CHECKS, Skip, StorageConformance
+
+
+@pytest.fixture(params=['memory', 'local'])
+def backend(request, tmp_path):
+    if request.param == 'memory':
+        return MemoryStorageRepository()
+    return LocalStorageRepository(str(tmp_path))
+
+
+@pytest.mark.parametrize('check', CHECKS)
+def test_storage_conformance(backend, check):
+    suite = StorageConformance(backend, large_mb=6, concurrency=8)
+
+    async def run():
+        try:
+            await getattr(suite, check)()
+        finally:
+            await suite.cleanup()
+
+    try:
+        asyncio.run(run())
+    except Skip as e:
+        pytest.skip(str(e))
@@ -0,0 +1,73 @@
+"""
+Pruebas de las rutas del storage
+"""
+import pytest
+from app.domain.services.storage_layout import StorageLayout
+
+
+CONTENT_HASH = '9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08'
+
+
+def test_blob_path_default_fanout():
+    layout = StorageLayout()
+
+    assert layout.blob_path(CONTENT_HASH, 'pdf') == f"blobs/9f/86/{CONTENT_HASH}.pdf"
+
+
+@pytest.mark.parametrize('depth, width, prefix', [
+    (0, 2, 'blobs/'),
+    (1, 3, 'blobs/9f8/'),
+    (3, 1, 'blobs/9/f/8/'),
+])
+def test_blob_path_custom_fanout(depth, width, prefix):
+    layout = StorageLayout(fanout_depth=depth, fanout_width=width)
+
+    assert layout.blob_path(CONTENT_HASH, 'png') == f"{prefix}{CONTENT_HASH}.png"
+
+
+@pytest.mark.parametrize('depth, width', [(-1, 2), (2, 0), (5, 7)])
+def test_invalid_fanout(depth, width):
+    with pytest.raises(ValueError):
+        StorageLayout(fanout_depth=depth, fanout_width=width)
+
+
+def test_other_paths():
+    layout = StorageLayout()
+
+    assert layout.thumbnail_path(CONTENT_HASH) == f"thumbnails/9f/86/{CONTENT_HASH}.webp"
+    assert layout.incoming_path('session', 'pdf') == 'incoming/session.pdf'
+    assert layout.document_filename('cv', 'doc-id', 'pdf') == 'cv_doc-id.pdf'
+
+
+def test_hashes_are_read_back_with_any_fanout():
+    layout = StorageLayout()
+    legacy = StorageLayout(fanout_depth=1, fanout_width=4)
+
+    assert layout.blob_hash(legacy.blob_path(CONTENT_HASH, 'pdf')) == CONTENT_HASH
+    assert layout.thumbnail_hash(legacy.thumbnail_path(CONTENT_HASH)) == CONTENT_HASH
+
+
+@pytest.mark.parametrize('file_path', [
+    '2025/11/cv.pdf',
+    f"blobs/{CONTENT_HASH[:-1]}.pdf",
+    f"blobs/9f/{CONTENT_HASH}",
+    f"thumbnails/{CONTENT_HASH}.webp",
+])
+def test_blob_hash_rejects_other_paths(file_path):
+    assert StorageLayout().blob_hash(file_path) is None
+
+
+@pytest.mark.parametrize('file_path, expected', [
+    ('cv.PDF', 'pdf'),
+    ('archivo.tar.gz', 'gz'),
+    ('2025/11/cv.docx', 'docx'),
+    ('sin_extension', 'bin'),
+    ('punto.final.', 'bin'),
+    ('dir.con.punto/archivo', 'bin'),
+    ('mal.p df', 'bin'),
+    ('mal.%2f', 'bin'),
+    ('largo.abcdefghijk', 'bin'),
+    ('acento.pdfñ', 'bin'),
+])
+def test_extension(file_path, expected):
+    assert StorageLayout.extension(file_path) == expected
@@ -0,0 +1,138 @@
+"""
+Pruebas de la subida en streaming sobre el storage en memoria
+"""
+import asyncio
+import hashlib
+import pytest
+from app.application.usecases.upload_document import (
+    MAX_FILE_SIZE,
+    UPLOAD_CHUNK_SIZE,
+    FileTooLargeError,
+    SizeLimitedStream,
+    UploadDocumentUseCase
+)
+
+
+APPLICATION_ID = '84a17550-56c4-4299-9f97-0de9856ea586'
+
+
+async def chunked(content: bytes, chunk_size: int = 4):
+    for offset in range(0, len(content), chunk_size):
+        yield content[offset:offset + chunk_size]
+
+
+async def collect(stream: SizeLimitedStream) -> bytes:
+    return b''.join([chunk async for chunk in stream])
+
+
+async def list_paths(storage) -> list[str]:
+    return [stored.path async for stored in storage.list_files()]
+
+
+def test_size_limited_stream_counts_and_hashes():
+    content = b'contenido del archivo'
+    stream = SizeLimitedStream(chunked(content), max_size=len(content))
+
+    assert asyncio.run(collect(stream)) == content
+    assert stream.size == len(content)
+    assert stream.sha256.hexdigest() == hashlib.sha256(content).hexdigest()
+
+
+def test_size_limited_stream_stops_over_limit():
+    chunks_read = []
+
+    async def source():
+        for chunk in (b'1234', b'5678', b'9'):
+            chunks_read.append(chunk)
+            yield chunk
+
+    stream = SizeLimitedStream(source(), max_size=8)
+
+    with pytest.raises(FileTooLargeError):
+        asyncio.run(collect(stream))
+
+    assert chunks_read == [b'1234', b'5678', b'9']
+    assert stream.size == 9
+
+
+def upload(usecase: UploadDocumentUseCase, content: bytes, chunk_size: int = 4, **overrides):
+    values = {
+        'filename': 'Mi CV.pdf',
+        'mime_type': 'application/pdf',
+        'user_document': '1234567890',
+        'application_id': APPLICATION_ID,
+        'document_type': 'cv',
+        'uploaded_by': None,
+        **overrides
+    }
+    return asyncio.run(usecase.execute(chunks=chunked(content, chunk_size), **values))
+
+
+@pytest.fixture
+def usecase(document_repository, storage) -> UploadDocumentUseCase:
+    return UploadDocumentUseCase(document_repository, storage)
+
+
+def test_upload_stores_blob_by_content_hash(usecase, document_repository, storage):
+    content = b'%PDF-1.4 contenido'
+    content_hash = hashlib.sha256(content).hexdigest()
+
+    document = upload(usecase, content)
+
+    assert document.content_hash == content_hash
+    assert document.file_path == f"blobs/{content_hash[:2]}/{content_hash[2:4]}/{content_hash}.pdf"
+    assert document.filename == f"cv_{document.id}.pdf"
+    assert document.original_filename == 'Mi CV.pdf'
+    assert document.file_size == len(content)
+    assert document_repository.documents[document.id] == document
+    assert asyncio.run(list_paths(storage)) == [document.file_path]
+
+
+def test_identical_uploads_share_the_blob(usecase, document_repository, storage):
+    first = upload(usecase, b'mismo contenido')
+    second = upload(usecase, b'mismo contenido', filename='copia.pdf')
+
+    assert first.id != second.id
+    assert first.file_path == second.file_path
+    assert document_repository.blobs[first.content_hash][1] == 2
+    assert asyncio.run(list_paths(storage)) == [first.file_path]
+
+
+def test_upload_rejects_declared_size_over_limit(usecase, storage):
+    with pytest.raises(FileTooLargeError):
+        upload(usecase, b'x', file_size=11 * 1024 * 1024)
+
+    assert asyncio.run(list_paths(storage)) == []
+
+
+def test_upload_rejects_mime_type(usecase):
+    with pytest.raises(ValueError, match='Tipo de archivo no permitido'):
+        upload(usecase, b'x', mime_type='text/html')
+
+
+def test_upload_rejects_empty_file(usecase, document_repository, storage):
+    with pytest.raises(ValueError, match='vacío'):
+        upload(usecase, b'')
+
+    assert document_repository.documents == {}
+    assert asyncio.run(list_paths(storage)) == []
+
+
+def test_upload_over_limit_leaves_no_files(usecase, document_repository, storage):
+    with pytest.raises(FileTooLargeError):
+        upload(usecase, b'x' * (MAX_FILE_SIZE + 1), chunk_size=UPLOAD_CHUNK_SIZE)
+
+    assert document_repository.documents == {}
+    assert asyncio.run(list_paths(storage)) == []
+
+
+def test_failed_save_releases_the_blob(usecase, document_repository):
+    async def failing_save(document):
+        raise RuntimeError('BD caída')
+
+    document_repository.save = failing_save
+
+    with pytest.raises(RuntimeError):
+        upload(usecase, b'contenido')
+
+    assert document_repository.blobs == {}
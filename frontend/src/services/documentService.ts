@@ -15,6 +15,24 @@ documentAPI.interceptors.request.use((config) => {
   return config;
 });
 
+// Página máxima que acepta el servicio; el resto se pide con X-Next-Cursor
+const PAGE_SIZE = 200;
+
+async function fetchAllDocuments(path: string): Promise<Document[]> {
+  const documents: Document[] = [];
+  let cursor: string | undefined;
+
+  do {
+    const response = await documentAPI.get<Document[]>(path, {
+      params: { limit: PAGE_SIZE, cursor },
+    });
+    documents.push(...response.data);
+    cursor = response.headers['x-next-cursor'] || undefined;
+  } while (cursor);
+
+  return documents;
+}
+
 export const documentService = {
   async uploadDocument(data: UploadDocumentData): Promise<Document> {
     const formData = new FormData();
@@ -38,15 +56,13 @@ export const documentService = {
   },
 
   async getDocumentsByApplication(applicationId: string): Promise<Document[]> {
-    const response = await documentAPI.get<Document[]>(`/documents/application/${applicationId}`);
-    return response.data;
+    return fetchAllDocuments(`/documents/application/${applicationId}`);
   },
 
   async downloadDocument(applicationId: string): Promise<void> {
     try {
       // Obtener documentos de la aplicación (usa el token del interceptor)
-      const response = await documentAPI.get(`/documents/application/${applicationId}`);
-      const documents = response.data;
+      const documents = await fetchAllDocuments(`/documents/application/${applicationId}`);
       
       // Buscar el CV
       const cvDoc = documents.find((doc: any) => doc.document_type === 'cv');